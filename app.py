@@ -2,13 +2,22 @@
 Hauptanwendungs-Controller
 Koordiniert alle Komponenten
 """
+import os
+import time
 import tkinter as tk
+from array import array
 from data.grid_manager import GridManager
+from data.models import Grid, StrategicRoleType, STRATEGIC_ROLE_CODES
+from data.pathfinding import MovementCosts, UNREACHABLE
+from data.validation import MapValidator
 from ui.map_canvas import MapCanvas
 from ui.main_window import MainWindow
 from ui.event_handlers import EventHandlers
-from ui.dialogs import GridSizeDialog
+from ui.dialogs import GridSizeDialog, GenerateMapDialog
+from ui.task_runner import TaskRunner, TaskContext
+from ui import file_dialogs
 from export.godot_exporter import MapExporter
+from export.map_io import MapIO, temp_map_path
 
 
 class HexMapApplication:
@@ -29,6 +38,9 @@ class HexMapApplication:
         self.event_handlers = None
         self.exporter = None  # Wird nach Canvas-Erstellung initialisiert
         
+        # Laden, Generieren und Export laufen im Hintergrund
+        self.task_runner = TaskRunner(self.root)
+        
         self._initialize_components()
         self._setup_callbacks()
         
@@ -60,13 +72,21 @@ class HexMapApplication:
     def _setup_callbacks(self):
         """Setzt Callbacks zwischen Komponenten"""
         self.main_window.on_new_grid = self._create_new_grid
+        self.main_window.on_generate = self._generate_map
         self.main_window.on_export = self._export_map
         self.main_window.on_load = self._load_map
+        self.main_window.on_show_distances = self._show_headquarter_distances
+        self.main_window.on_cancel_task = self.task_runner.cancel
+        
+        self.task_runner.on_start = self.main_window.show_progress
+        self.task_runner.on_progress = self.main_window.update_progress
+        self.task_runner.on_finish = self.main_window.hide_progress
     
     def _post_init_setup(self):
         """Post-Initialisierung Setup"""
-        # Map Canvas initial rendern
+        # Map Canvas initial rendern und prüfen
         self.map_canvas.render_map()
+        self.map_canvas.validate_map()
         
         # Main Window Setup
         self.main_window.post_init_setup()
@@ -74,8 +94,95 @@ class HexMapApplication:
         # Focus auf Canvas setzen
         self.map_canvas.canvas.focus_set()
     
+    def _start_task(self, name: str, work, on_done, on_cancel=None) -> bool:
+        """
+        Startet einen Hintergrund-Task mit Fortschrittsanzeige
+        
+        Args:
+            name: Status-Text während der Ausführung
+            work: Arbeit im Worker-Thread (erhält den TaskContext)
+            on_done: Übernimmt das Ergebnis im UI-Thread
+            on_cancel: Aufräumen nach Abbruch oder Fehler
+            
+        Returns:
+            False wenn bereits ein Task läuft
+        """
+        def on_error(error: Exception):
+            if on_cancel:
+                on_cancel()
+            self.main_window.set_status(f"{name.rstrip('.')} failed")
+            file_dialogs.show_error("Error", f"{name.rstrip('.')} failed:\n{str(error)}")
+        
+        def cancelled():
+            if on_cancel:
+                on_cancel()
+            self.main_window.set_status(f"{name.rstrip('.')} cancelled")
+        
+        if not self.task_runner.start(name, work, on_done, on_error, cancelled):
+            self.main_window.set_status("Another operation is still running")
+            return False
+        return True
+    
+    def _task_busy(self) -> bool:
+        """True (mit Hinweis in der Statusleiste) solange ein Hintergrund-Task läuft"""
+        if self.task_runner.is_busy:
+            self.main_window.set_status("Another operation is still running")
+            return True
+        return False
+    
+    @staticmethod
+    def _prepare_grid(manager: GridManager, task: TaskContext):
+        """
+        Baut im Worker Nachbar-Tabelle und Prüfung für das fertige Grid
+        
+        Returns:
+            (grid, neighbor_table, validator) für _swap_grid
+        """
+        task.report(1.0, "Building neighbour table...")
+        neighbor_table = manager.neighbor_table
+        task.report(1.0, "Validating map...")
+        validator = MapValidator(manager)
+        validator.validate()
+        return manager.grid, neighbor_table, validator
+    
+    def _swap_grid(self, prepared, hex_size=None):
+        """Übernimmt ein im Hintergrund vorbereitetes Grid in einem Schritt und zeichnet neu"""
+        grid, neighbor_table, validator = prepared
+        self.grid_manager.set_grid(grid, neighbor_table)
+        
+        # Auswahl, Path-Start und Overlay gehören zum alten Grid
+        self.main_window.select_tile_for_editing(None)
+        self.main_window.path_start = None
+        self.map_canvas.clear_overlay()
+        if hex_size is not None:
+            self.map_canvas.set_hex_size(hex_size)
+        
+        # UI aktualisieren
+        self.main_window.update_grid_info()
+        
+        # Map neu rendern (geprüft wurde schon im Worker)
+        issues = self.map_canvas.set_validator(validator)
+        self.map_canvas.render_map()
+        return issues
+    
+    def _snapshot_grid(self) -> Grid:
+        """Kopie der Spalten des aktuellen Grids für einen Hintergrund-Task"""
+        grid = self.grid_manager.grid
+        return Grid(
+            width=grid.width,
+            height=grid.height,
+            area_definitions=list(grid.area_definitions),
+            area_codes=array('B', grid.area_codes),
+            faction_codes=array('B', grid.faction_codes),
+            role_codes=array('B', grid.role_codes),
+            land=array('B', grid.land),
+            production=array('i', grid.production)
+        )
+    
     def _create_new_grid(self):
         """Erstellt ein neues Grid"""
+        if self._task_busy():
+            return
         current_grid = self.grid_manager.grid
         dialog = GridSizeDialog(
             self.root, 
@@ -87,34 +194,145 @@ class HexMapApplication:
         if result:
             width, height = result
             
-            # Neues Grid erstellen
-            self.grid_manager.create_new_grid(width, height)
+            def work(task: TaskContext):
+                manager = GridManager()
+                manager.create_new_grid(width, height)
+                return self._prepare_grid(manager, task)
             
-            # UI aktualisieren
-            self.main_window.update_grid_info()
+            def done(prepared):
+                self._swap_grid(prepared)
+                self.main_window.set_status(f"Created new grid: {width}x{height}")
             
-            # Map neu rendern
-            self.map_canvas.render_map()
+            self._start_task(f"Creating {width}x{height} grid...", work, done)
+    
+    def _generate_map(self):
+        """Erstellt ein Grid mit generiertem Terrain"""
+        if self._task_busy():
+            return
+        current_grid = self.grid_manager.grid
+        dialog = GenerateMapDialog(
+            self.root,
+            current_grid.width,
+            current_grid.height
+        )
+        result = dialog.show()
+        
+        if result:
+            width, height, settings = result
+            
+            def work(task: TaskContext):
+                start = time.perf_counter()
+                manager = GridManager()
+                manager.generate_grid(width, height, settings)
+                task.report(0.9)
+                return self._prepare_grid(manager, task), time.perf_counter() - start
+            
+            def done(result):
+                prepared, elapsed = result
+                self._swap_grid(prepared)
+                self.main_window.set_status(
+                    f"Generated {width}x{height} map (seed {settings.seed}) in {elapsed:.1f} s")
             
-            self.main_window.set_status(f"Created new grid: {width}x{height}")
+            self._start_task(f"Generating {width}x{height} map...", work, done)
     
     def _export_map(self):
         """Exportiert die Karte"""
-        success = self.exporter.export_map()
-        if success:
-            self.main_window.set_status("Map exported successfully")
+        if self._task_busy():
+            return
+        file_path = file_dialogs.ask_save_map_path()
+        if not file_path:
+            return
+        # Nach Laden und Bearbeiten ist die Prüfung aktuell; sonst prüft der Worker die Kopie
+        validator = self.map_canvas.validator
+        issues = validator.issues() if validator.is_current else None
+        
+        # Der Worker schreibt eine Kopie der Spalten, weiteres Malen ändert den Export nicht
+        writer = MapIO(GridManager(self._snapshot_grid()))
+        writer.hex_size = self.map_canvas.hex_size
+        indent = self.exporter.json_indent
+        # Erst in eine temporäre Datei (gleiche Endung, gleiches Format),
+        # damit ein Abbruch keine halbe Karte hinterlässt
+        temp_path = temp_map_path(file_path, ".part")
+        
+        def work(task: TaskContext):
+            writer.write_map(temp_path, indent=indent, progress=task.report)
+            if issues is not None:
+                return issues
+            task.report(1.0, "Validating map...")
+            return MapValidator(writer.grid_manager).validate()
+        
+        def done(issues):
+            os.replace(temp_path, file_path)
+            if issues:
+                self.main_window.set_status(f"Map exported with {len(issues)} validation issues: "
+                                            + "; ".join(issue.message for issue in issues))
+            else:
+                self.main_window.set_status("Map exported successfully")
+            file_dialogs.show_info("Export Success", f"Map exported successfully to:\n{file_path}")
+        
+        def cleanup():
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        self._start_task("Exporting map...", work, done, cleanup)
+    
+    def _show_headquarter_distances(self):
+        """Berechnet die Bewegungskosten vom nächsten Headquarter im Hintergrund und zeigt sie an"""
+        if self._task_busy():
+            return
+        sources = self.grid_manager.query_values(
+            "role_codes", [STRATEGIC_ROLE_CODES[StrategicRoleType.HEADQUARTER]])
+        if not sources:
+            self.main_window.set_status("No headquarters on the map")
+            return
+        
+        grid = self.grid_manager.grid
+        snapshot = self._snapshot_grid()
+        neighbor_table = self.grid_manager.neighbor_table
+        
+        def work(task: TaskContext):
+            # Erst hier importiert: Prozess-Pool und Shared Memory gehören nicht zum Start des Editors
+            from data.parallel import parallel_distance_field
+            
+            costs = MovementCosts().build(snapshot)
+            return parallel_distance_field(snapshot, sources, costs, neighbors=neighbor_table,
+                                           progress=task.report)
+        
+        def done(distances):
+            if self.grid_manager.grid is not grid:
+                self.main_window.set_status("Distance field discarded: the map was replaced")
+                return
+            reachable = len(distances) - distances.count(UNREACHABLE)
+            self.map_canvas.set_distance_overlay(distances)
+            self.main_window.set_status(
+                f"Distance from {len(sources)} headquarters: {reachable} tiles reachable, "
+                f"max cost {max(distances)}")
+        
+        self._start_task("Computing distances...", work, done)
     
     def _load_map(self):
         """Lädt eine Karte aus JSON"""
-        success = self.exporter.load_map()
-        if success:
-            # UI aktualisieren
-            self.main_window.update_grid_info()
-            
-            # Map neu rendern
-            self.map_canvas.render_map()
+        if self._task_busy():
+            return
+        file_path = file_dialogs.ask_open_map_path()
+        if not file_path:
+            return
+        
+        def work(task: TaskContext):
+            reader = MapIO(GridManager())
+            reader.read_map(file_path, progress=task.report)
+            return self._prepare_grid(reader.grid_manager, task), reader.hex_size
+        
+        def done(result):
+            prepared, hex_size = result
+            issues = self._swap_grid(prepared, hex_size)
             
-            self.main_window.set_status("Map loaded successfully")
+            if issues:
+                self.main_window.set_status(f"Map loaded with {len(issues)} validation issues")
+            else:
+                self.main_window.set_status("Map loaded successfully")
+        
+        self._start_task("Loading map...", work, done)
     
     def run(self):
         """Startet die Anwendung"""
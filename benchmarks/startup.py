@@ -0,0 +1,131 @@
+"""
+Startzeit-Benchmark
+Misst Import-Zeiten (in frischen Prozessen) und die Latenz bis zum ersten Render von app.py
+
+Aufruf (aus dem Projekt-Verzeichnis):
+    python -m benchmarks.startup [--repeat 5] [--json results.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module, die ohne GUI importierbar sein sollen (kein tkinter)
+HEADLESS_MODULES = ("data.grid_manager", "export.map_io", "export.godot_exporter", "cli")
+GUI_MODULES = ("app",)
+
+_IMPORT_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, int("tkinter" in sys.modules))
+"""
+
+_FIRST_RENDER_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+try:
+    application = app.HexMapApplication()
+except Exception as e:
+    print("skip", type(e).__name__)
+    sys.exit(0)
+root = application.root
+canvas = application.map_canvas
+deadline = start + 30.0
+while not canvas.renderer.items and not canvas.chunk_cache.displayed:
+    root.update()
+    if time.perf_counter() > deadline:
+        print("skip", "timeout")
+        sys.exit(0)
+rendered = time.perf_counter()
+root.destroy()
+print(imported - start, rendered - start)
+"""
+
+
+def _run(script: str) -> List[str]:
+    """Führt ein Skript in einem frischen Interpreter im Projekt-Verzeichnis aus"""
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return output.split()
+
+
+def measure_import(module: str, repeat: int) -> Dict[str, object]:
+    """Import-Zeit eines Moduls (Median über repeat frische Prozesse)"""
+    times = []
+    loads_tkinter = False
+    for _ in range(repeat):
+        elapsed, tkinter_loaded = _run(_IMPORT_SCRIPT.format(module=module))
+        times.append(float(elapsed))
+        loads_tkinter = tkinter_loaded == "1"
+    return {"seconds": statistics.median(times), "loads_tkinter": loads_tkinter}
+
+
+def measure_first_render(repeat: int) -> Optional[Dict[str, float]]:
+    """Import- und Render-Latenz von app.py oder None ohne Display"""
+    imports = []
+    renders = []
+    for _ in range(repeat):
+        result = _run(_FIRST_RENDER_SCRIPT)
+        if result[0] == "skip":
+            return None
+        imports.append(float(result[0]))
+        renders.append(float(result[1]))
+    return {"import_seconds": statistics.median(imports),
+            "first_render_seconds": statistics.median(renders)}
+
+
+def run(repeat: int = 5) -> Dict[str, float]:
+    """
+    Führt alle Startzeit-Messungen aus
+
+    Returns:
+        Flaches Dict Messgröße -> Sekunden
+    """
+    results = {}
+    for module in HEADLESS_MODULES + GUI_MODULES:
+        measurement = measure_import(module, repeat)
+        results[f"import.{module}"] = measurement["seconds"]
+        if module in HEADLESS_MODULES and measurement["loads_tkinter"]:
+            print(f"warning: importing {module} loads tkinter", file=sys.stderr)
+
+    first_render = measure_first_render(max(1, repeat // 2))
+    if first_render is None:
+        print("first render skipped (no display available)", file=sys.stderr)
+    else:
+        results["app.import"] = first_render["import_seconds"]
+        results["app.first_render"] = first_render["first_render_seconds"]
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Startup time benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh processes per measurement")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    for name, seconds in results.items():
+        print(f"{name:40s} {seconds * 1000:9.1f} ms")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Canvas-Attrappe für Benchmarks ohne Display
+Bildet die von MapCanvas, HexRenderer und ChunkCache genutzte tk.Canvas API mit minimalem Aufwand nach
+"""
+from collections import defaultdict
+from typing import Callable, Dict, List, Set
+
+
+class StubCanvas:
+    """
+    Ersatz für tk.Canvas
+
+    Items werden nur mit Koordinaten und Tags gespeichert, damit die
+    Messungen die Python-Seite des Renderings erfassen. Transformationen
+    (scale/move) werden gezählt, aber nicht ausgeführt. Mit after/after_idle
+    eingeplante Callbacks laufen erst bei run_idle().
+    """
+
+    def __init__(self, parent=None, width: int = 1200, height: int = 800, **options):
+        self.width = int(width)
+        self.height = int(height)
+        self.next_id = 1
+        self.item_coords: Dict[int, List[float]] = {}
+        self.item_tags: Dict[int, tuple] = {}
+        self.tagged: Dict[str, Set[int]] = defaultdict(set)
+        self.idle_callbacks: Dict[str, Callable] = {}
+        self.next_callback = 1
+
+        # Anzahl der Canvas-Aufrufe pro Operation
+        self.calls: Dict[str, int] = defaultdict(int)
+
+    def _create(self, kind: str, coords, tags) -> int:
+        self.calls[kind] += 1
+        item_id = self.next_id
+        self.next_id += 1
+        self.item_coords[item_id] = list(coords)
+        tags = tuple(tags or ())
+        self.item_tags[item_id] = tags
+        for tag in tags:
+            self.tagged[tag].add(item_id)
+        return item_id
+
+    def create_polygon(self, coords, tags=None, **options) -> int:
+        return self._create("create_polygon", coords, tags)
+
+    def create_text(self, x, y, tags=None, **options) -> int:
+        return self._create("create_text", (x, y), tags)
+
+    def create_image(self, x, y, tags=None, **options) -> int:
+        return self._create("create_image", (x, y), tags)
+
+    def create_rectangle(self, x0, y0, x1, y1, tags=None, **options) -> int:
+        return self._create("create_rectangle", (x0, y0, x1, y1), tags)
+
+    def create_oval(self, x0, y0, x1, y1, tags=None, **options) -> int:
+        return self._create("create_oval", (x0, y0, x1, y1), tags)
+
+    def create_line(self, *coords, tags=None, **options) -> int:
+        return self._create("create_line", coords, tags)
+
+    def coords(self, item_id, *coords):
+        self.calls["coords"] += 1
+        if coords:
+            self.item_coords[item_id] = list(coords)
+            return None
+        return list(self.item_coords.get(item_id, ()))
+
+    def delete(self, *targets):
+        for target in targets:
+            self.calls["delete"] += 1
+            item_ids = list(self.tagged.get(target, ())) if isinstance(target, str) else [target]
+            for item_id in item_ids:
+                for tag in self.item_tags.pop(item_id, ()):
+                    self.tagged[tag].discard(item_id)
+                self.item_coords.pop(item_id, None)
+
+    def itemconfigure(self, item_id, **options):
+        self.calls["itemconfigure"] += 1
+
+    itemconfig = itemconfigure
+
+    def scale(self, tag, x, y, factor_x, factor_y):
+        self.calls["scale"] += 1
+
+    def move(self, tag, dx, dy):
+        self.calls["move"] += 1
+
+    def tag_raise(self, tag, *above):
+        self.calls["tag_raise"] += 1
+
+    def after(self, milliseconds, callback=None, *args):
+        identifier = f"after#{self.next_callback}"
+        self.next_callback += 1
+        if callback is not None:
+            self.idle_callbacks[identifier] = lambda: callback(*args)
+        return identifier
+
+    def after_idle(self, callback, *args):
+        return self.after(0, callback, *args)
+
+    def after_cancel(self, identifier):
+        self.idle_callbacks.pop(identifier, None)
+
+    def run_idle(self):
+        """Führt alle eingeplanten Callbacks aus (auch neu eingeplante)"""
+        while self.idle_callbacks:
+            identifier = next(iter(self.idle_callbacks))
+            self.idle_callbacks.pop(identifier)()
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    def update_idletasks(self):
+        pass
+
+    def bind(self, sequence=None, func=None, add=None):
+        pass
+
+    def focus_set(self):
+        pass
+
+    def config(self, **options):
+        pass
+
+    configure = config
+
+    @property
+    def item_count(self) -> int:
+        return len(self.item_coords)
+
+
+class StubPhotoImage:
+    """Ersatz für tk.PhotoImage (zählt nur die geschriebenen Pixel-Zeilen)"""
+
+    def __init__(self, width: int = 1, height: int = 1, **options):
+        self._width = width
+        self._height = height
+        self.puts = 0
+
+    def put(self, data, to=None):
+        self.puts += 1
+
+    def width(self) -> int:
+        return self._width
+
+    def height(self) -> int:
+        return self._height
@@ -0,0 +1,430 @@
+"""
+Benchmark-Suite für die Hot Paths des Editors
+Rendering, Hit-Testing, Malen, Laden/Speichern, Radius-Abfragen, Karten-Prüfung, Terrain-Generierung und Chunk-Parallelisierung
+
+Aufruf (aus dem Projekt-Verzeichnis):
+    python -m benchmarks.suite                 # alle Benchmarks, Canvas-Attrappe
+    python -m benchmarks.suite --quick         # nur kleine Karten
+    python -m benchmarks.suite --display       # echtes tk.Canvas (z.B. unter xvfb-run)
+    python -m benchmarks.suite --save-baseline # aktuelle Werte als Baseline speichern
+
+Jeder Lauf wird an die History-Datei angehängt und mit der Baseline
+verglichen; langsamere Werte als baseline * (1 + threshold) werden als
+Regression gemeldet (Exit-Code 1).
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from array import array
+from typing import Callable, Dict, List, Optional
+
+from data.grid_manager import GridManager
+from data.models import DEFAULT_AREAS, Grid
+from data.neighbor_table import build_neighbor_table
+from data.paint_stroke import LAYER_AREA
+from data.parallel import parallel_distance_field, parallel_generate_terrain
+from data.pathfinding import MovementCosts
+from data.terrain_generator import TerrainSettings, generate_terrain
+from data.validation import MapValidator
+from export.map_io import MapIO
+from utils.hex_math import HexMath
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCHMARK_DIR)
+DEFAULT_HISTORY = os.path.join(BENCHMARK_DIR, "history.json")
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+
+CANVAS_WIDTH = 1200
+CANVAS_HEIGHT = 800
+
+RENDER_GRID_SIZES = (200, 1000)
+RENDER_SCREEN_HEX_SIZES = (40.0, 15.0, 7.0, 3.0)  # 3.0 liegt im LOD-Bereich
+BRUSH_RADII = (1, 2, 5, 10, 20)
+IO_GRID_SIZES = (50, 200, 500, 1000, 2000)
+QUICK_IO_GRID_SIZES = (50, 200, 500)
+NEIGHBOR_RADII = (1, 5, 20, 100)
+NEIGHBOR_TABLE_SIZES = (200, 1000)
+VALIDATION_GRID_SIZES = (200, 1000)
+GENERATE_GRID_SIZES = (500, 2000)
+QUICK_GENERATE_GRID_SIZES = (500,)
+PARALLEL_GRID_SIZE = 2000
+QUICK_PARALLEL_GRID_SIZE = 1000
+PARALLEL_WORKER_COUNTS = (1, 2, 4, 8, 16, 32)
+
+Results = Dict[str, float]
+
+
+def measure(function: Callable[[], None], repeat: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """Median-Laufzeit in Sekunden über repeat Durchläufe"""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def make_grid_manager(size: int, seed: int = 1) -> GridManager:
+    """Erstellt ein size x size Grid mit reproduzierbar gemischtem Terrain"""
+    grid_manager = GridManager()
+    grid = grid_manager.create_new_grid(size, size)
+    rng = random.Random(seed)
+    area_count = len(grid.area_definitions)
+    row = bytes(rng.randrange(area_count) for _ in range(size * 2))
+    factions = bytes(rng.choice((0, 0, 0, 1, 2)) for _ in range(size * 2))
+    for y in range(size):
+        shift = (y * 7) % size
+        start = y * size
+        grid.area_codes[start:start + size] = array('B', row[shift:shift + size])
+        grid.faction_codes[start:start + size] = array('B', factions[shift:shift + size])
+    return grid_manager
+
+
+class CanvasFactory:
+    """Erstellt MapCanvas-Instanzen mit echtem tk.Canvas oder der Attrappe"""
+
+    def __init__(self, use_display: bool):
+        import ui.chunk_cache
+        import ui.map_canvas
+
+        self.map_canvas_module = ui.map_canvas
+        self.root = None
+        if use_display:
+            import tkinter as tk
+            self.root = tk.Tk()
+            self.root.geometry(f"{CANVAS_WIDTH}x{CANVAS_HEIGHT}")
+        else:
+            from benchmarks.stub_canvas import StubCanvas, StubPhotoImage
+
+            def canvas_type(parent, **options):
+                return StubCanvas(parent, width=CANVAS_WIDTH, height=CANVAS_HEIGHT)
+
+            # Nur die tk-Referenzen der Canvas-Module ersetzen
+            ui.map_canvas.tk = types.SimpleNamespace(Canvas=canvas_type, Widget=object)
+            ui.chunk_cache.tk = types.SimpleNamespace(PhotoImage=StubPhotoImage)
+
+    def create(self, grid_manager: GridManager):
+        """Erstellt einen MapCanvas für den GridManager"""
+        map_canvas = self.map_canvas_module.MapCanvas(self.root, grid_manager)
+        if self.root is not None:
+            map_canvas.canvas.pack(fill="both", expand=True)
+            self.root.update()
+        return map_canvas
+
+    def run_idle(self, map_canvas):
+        """Führt ausstehende after/after_idle Callbacks aus"""
+        if self.root is not None:
+            self.root.update()
+        else:
+            map_canvas.canvas.run_idle()
+
+    def destroy(self, map_canvas):
+        """Entfernt das Canvas wieder"""
+        if self.root is not None:
+            map_canvas.canvas.destroy()
+
+
+def set_camera(map_canvas, screen_hex_size: float):
+    """Zentriert die Ansicht auf das Grid bei gegebener Bildschirm-Hex-Größe"""
+    map_canvas.zoom_factor = screen_hex_size / map_canvas.hex_size
+    grid = map_canvas.grid_manager.grid
+    center_x, center_y = HexMath.hex_to_pixel(grid.width // 2, grid.height // 2, map_canvas.hex_size)
+    map_canvas.view_x = center_x - CANVAS_WIDTH / 2.0 / map_canvas.zoom_factor
+    map_canvas.view_y = center_y - CANVAS_HEIGHT / 2.0 / map_canvas.zoom_factor
+
+
+def bench_render(factory: CanvasFactory, repeat: int) -> Results:
+    """render_map: kalt, beim Pannen und nach Tile-Änderungen"""
+    results = {}
+    for size in RENDER_GRID_SIZES:
+        grid_manager = make_grid_manager(size)
+        map_canvas = factory.create(grid_manager)
+        for screen_size in RENDER_SCREEN_HEX_SIZES:
+            key = f"{size}x{size}.hex{screen_size:g}"
+            set_camera(map_canvas, screen_size)
+
+            def reset():
+                map_canvas.renderer.clear()
+                map_canvas.chunk_cache.invalidate_all()
+
+            results[f"render.cold.{key}"] = measure(
+                lambda: map_canvas.render_map(tiles_changed=True), repeat, setup=reset)
+
+            map_canvas.render_map(tiles_changed=True)
+            pans = 20
+
+            def pan():
+                for step in range(pans):
+                    direction = 1 if step < pans // 2 else -1
+                    map_canvas.view_x += direction * 40.0 / map_canvas.zoom_factor
+                    map_canvas.render_map(tiles_changed=False)
+
+            results[f"render.pan.{key}"] = measure(pan, repeat) / pans
+            results[f"render.refresh.{key}"] = measure(
+                lambda: map_canvas.render_map(tiles_changed=True), repeat)
+        factory.destroy(map_canvas)
+    return results
+
+
+def bench_hit_test(factory: CanvasFactory, repeat: int) -> Results:
+    """_get_tile_at_pixel: Zeit pro 10000 Abfragen"""
+    grid_manager = make_grid_manager(500)
+    map_canvas = factory.create(grid_manager)
+    set_camera(map_canvas, 15.0)
+    rng = random.Random(2)
+    points = [(rng.randrange(CANVAS_WIDTH), rng.randrange(CANVAS_HEIGHT)) for _ in range(10000)]
+
+    def hit_test():
+        for pixel_x, pixel_y in points:
+            map_canvas._get_tile_at_pixel(pixel_x, pixel_y)
+
+    results = {"hit_test.10k": measure(hit_test, repeat)}
+    factory.destroy(map_canvas)
+    return results
+
+
+def bench_paint(factory: CanvasFactory, repeat: int) -> Results:
+    """Pinselstrich aus 50 Maus-Samples inklusive Redraw und Undo-Eintrag"""
+    results = {}
+    grid_manager = make_grid_manager(500)
+    map_canvas = factory.create(grid_manager)
+    set_camera(map_canvas, 15.0)
+    map_canvas.render_map()
+    areas = [area for area in DEFAULT_AREAS if area.id != "water"]
+
+    for radius in BRUSH_RADII:
+        map_canvas.set_brush_size(radius + 1)
+        strokes = iter(range(1 << 30))
+
+        def stroke():
+            area = areas[next(strokes) % len(areas)]
+            map_canvas.paint_stroke = grid_manager.begin_paint_stroke(LAYER_AREA, area)
+            for sample in range(50):
+                tile = grid_manager.get_tile_at(200 + sample * 2, 240 + sample % 7)
+                map_canvas._paint_stroke_to(tile)
+                if sample % 5 == 4:
+                    factory.run_idle(map_canvas)
+            map_canvas._end_paint_stroke()
+
+        results[f"paint.stroke50.r{radius}"] = measure(stroke, repeat)
+    factory.destroy(map_canvas)
+    return results
+
+
+def bench_io(sizes, repeat: int) -> Results:
+    """JSON und .hexmap Speichern/Laden über MapIO (Basis des MapExporter)"""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            grid_manager = make_grid_manager(size)
+            writer = MapIO(grid_manager)
+            runs = repeat if size <= 500 else 1
+            for extension in (".json", ".hexmap"):
+                path = os.path.join(directory, f"map{size}{extension}")
+                label = extension.lstrip(".")
+                results[f"io.save.{label}.{size}x{size}"] = measure(
+                    lambda: writer.write_map(path, indent=2), runs)
+                results[f"io.load.{label}.{size}x{size}"] = measure(
+                    lambda: MapIO(GridManager()).read_map(path), runs)
+                os.remove(path)
+    return results
+
+
+def bench_neighbors(repeat: int) -> Results:
+    """get_hex_neighbors_in_radius (pro 1000 Aufrufe) und Aufbau der Nachbar-Tabelle"""
+    results = {}
+    for size in NEIGHBOR_TABLE_SIZES:
+        results[f"neighbors.table_build.{size}x{size}"] = measure(
+            lambda: build_neighbor_table(size, size), repeat)
+    for radius in NEIGHBOR_RADII:
+        calls = 1000 if radius <= 20 else 100
+
+        def query():
+            for center in range(calls):
+                HexMath.get_hex_neighbors_in_radius(center, center // 3, radius)
+
+        results[f"neighbors.radius{radius}.1k"] = measure(query, repeat) * (1000 / calls)
+    return results
+
+
+def bench_validation(repeat: int) -> Results:
+    """Vollständige Karten-Prüfung und Nachprüfung nach einem Fraktions-Strich aus 50 Tiles"""
+    results = {}
+    for size in VALIDATION_GRID_SIZES:
+        grid_manager = make_grid_manager(size)
+        validator = MapValidator(grid_manager)
+        grid_manager.neighbor_table
+        results[f"validation.full.{size}x{size}"] = measure(validator.validate, repeat)
+
+        grid = grid_manager.grid
+        start = (size // 2) * size + size // 4
+        indices = list(range(start, start + 50))
+        strokes = iter(range(1 << 30))
+
+        def recheck():
+            code = 1 + next(strokes) % 2
+            for index in indices:
+                grid.faction_codes[index] = code
+            validator.recheck(indices, ("faction_codes",))
+
+        results[f"validation.recheck50.{size}x{size}"] = measure(recheck, repeat)
+    return results
+
+
+def bench_generate(sizes, repeat: int) -> Results:
+    """Terrain-Generierung (Noise, Klassifizierung, Städte) mit vorhandener Nachbar-Tabelle"""
+    results = {}
+    for size in sizes:
+        grid = Grid(width=size, height=size)
+        neighbors = build_neighbor_table(size, size)
+        seeds = iter(range(1 << 30))
+        results[f"generate.terrain.{size}x{size}"] = measure(
+            lambda: generate_terrain(grid, TerrainSettings(seed=next(seeds)), neighbors), repeat)
+    return results
+
+
+def bench_parallel(size: int, repeat: int) -> Results:
+    """Terrain-Generierung und Distanz-Feld in Chunks mit 1..N Prozessen (Skalierung über die Kerne)"""
+    results = {}
+    grid = Grid(width=size, height=size)
+    neighbors = build_neighbor_table(size, size)
+    cores = os.cpu_count() or 1
+    worker_counts = [workers for workers in PARALLEL_WORKER_COUNTS if workers <= cores]
+    settings = TerrainSettings(seed=1)
+    for workers in worker_counts:
+        results[f"parallel.generate.{size}x{size}.w{workers}"] = measure(
+            lambda: parallel_generate_terrain(grid, settings, neighbors, workers), repeat)
+
+    costs = MovementCosts().build(grid)
+    sources = [index for index in range(0, size * size, size * size // 16) if costs[index] >= 0]
+    for workers in worker_counts:
+        results[f"parallel.distance.{size}x{size}.w{workers}"] = measure(
+            lambda: parallel_distance_field(grid, sources, costs, neighbors=neighbors, workers=workers),
+            max(1, repeat // 2))
+    return results
+
+
+def run_suite(use_display: bool, quick: bool, repeat: int, only: Optional[str]) -> Results:
+    """Führt alle (bzw. die per Präfix gewählten) Benchmarks aus"""
+    factory = None
+    results: Results = {}
+    groups = [
+        ("render", lambda: bench_render(factory, repeat)),
+        ("hit_test", lambda: bench_hit_test(factory, repeat)),
+        ("paint", lambda: bench_paint(factory, repeat)),
+        ("io", lambda: bench_io(QUICK_IO_GRID_SIZES if quick else IO_GRID_SIZES, repeat)),
+        ("neighbors", lambda: bench_neighbors(repeat)),
+        ("validation", lambda: bench_validation(repeat)),
+        ("generate", lambda: bench_generate(QUICK_GENERATE_GRID_SIZES if quick else GENERATE_GRID_SIZES,
+                                            repeat)),
+        ("parallel", lambda: bench_parallel(QUICK_PARALLEL_GRID_SIZE if quick else PARALLEL_GRID_SIZE,
+                                            repeat)),
+    ]
+    for name, run in groups:
+        if only and not name.startswith(only):
+            continue
+        if factory is None and name in ("render", "hit_test", "paint"):
+            factory = CanvasFactory(use_display)
+        print(f"running {name} ...", file=sys.stderr)
+        results.update(run())
+    return results
+
+
+def git_revision() -> Optional[str]:
+    """Aktueller Commit (oder None außerhalb eines Git-Repositories)"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def append_history(path: str, results: Results, options: dict):
+    """Hängt einen Lauf an die JSON History-Datei an"""
+    history = []
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    history.append({
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": options,
+        "results": results,
+    })
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+
+
+def find_regressions(results: Results, baseline: Results, threshold: float) -> List[str]:
+    """Vergleicht mit der Baseline; liefert Meldungen für langsamere Messwerte"""
+    regressions = []
+    for name, seconds in sorted(results.items()):
+        reference = baseline.get(name)
+        if reference and seconds > reference * (1.0 + threshold):
+            regressions.append(f"{name}: {seconds * 1000:.2f} ms vs baseline "
+                               f"{reference * 1000:.2f} ms (+{(seconds / reference - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Hex map editor benchmark suite")
+    parser.add_argument("--display", action="store_true",
+                        help="use a real tk.Canvas (needs a display, e.g. xvfb-run)")
+    parser.add_argument("--quick", action="store_true", help="skip the large load/save grids")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (median)")
+    parser.add_argument("--only", help="run only benchmark groups with this prefix")
+    parser.add_argument("--startup", action="store_true", help="include the startup benchmark")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown flagged as regression (default 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.display, args.quick, args.repeat, args.only)
+    if args.startup:
+        from benchmarks import startup
+        results.update({f"startup.{name}": seconds for name, seconds in startup.run(args.repeat).items()})
+
+    for name, seconds in results.items():
+        print(f"{name:45s} {seconds * 1000:10.2f} ms")
+
+    options = {"display": args.display, "quick": args.quick, "repeat": args.repeat}
+    append_history(args.history, results, options)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = find_regressions(results, json.load(f), args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+"""
+Kommandozeilen-Werkzeug für Hex-Karten (ohne GUI)
+Konvertiert, prüft, skaliert, vergleicht, exportiert und generiert ganze Karten-Verzeichnisse
+
+Beispiele:
+    python cli.py convert maps/ --to hexmap -o build/maps
+    python cli.py validate maps/
+    python cli.py resize maps/level1.json --width 200 --height 150
+    python cli.py diff old_maps/ new_maps/
+    python cli.py export maps/ -o build/maps --compact
+    python cli.py generate build/maps/world.hexmap --width 2000 --height 2000 --seed 7
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from data.grid_manager import GridManager
+from data.models import Grid, FACTIONS, STRATEGIC_ROLES, NO_AREA
+from data.terrain_generator import TerrainSettings
+from data.validation import validate_grid
+from export.binary_format import BINARY_EXTENSION
+from export.map_io import MapIO, temp_map_path
+
+
+JSON_EXTENSION = ".json"
+MAP_EXTENSIONS = (JSON_EXTENSION, BINARY_EXTENSION)
+FORMAT_EXTENSIONS = {"json": JSON_EXTENSION, "hexmap": BINARY_EXTENSION}
+
+# Spalten für den Vergleich zweier Karten
+DIFF_COLUMNS = ("area_codes", "faction_codes", "role_codes", "land", "production")
+
+# Ergebnis einer Aufgabe: (Pfad, erfolgreich, Meldung)
+TaskResult = Tuple[str, bool, str]
+
+
+def load_map(file_path: str) -> MapIO:
+    """Lädt eine Karte in einen eigenen GridManager"""
+    map_io = MapIO(GridManager())
+    map_io.read_map(file_path)
+    return map_io
+
+
+def save_map(map_io: MapIO, file_path: str, indent: Optional[int]):
+    """
+    Schreibt eine Karte über eine temporäre Datei
+
+    Binärkarten werden per mmap gelesen; das Ersetzen per os.replace
+    verhindert, dass eine noch gemappte Quelldatei überschrieben wird.
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = temp_map_path(file_path, f".tmp{os.getpid()}")
+    try:
+        map_io.write_map(temp_path, indent=indent)
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def find_maps(paths: List[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Sammelt Karten-Dateien aus Dateien und Verzeichnissen (rekursiv)
+
+    Returns:
+        (Pfad, relativer Pfad zur Basis) Paare
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, subdirectories, files in os.walk(path):
+                subdirectories.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(MAP_EXTENSIONS):
+                        file_path = os.path.join(directory, name)
+                        yield file_path, os.path.relpath(file_path, path)
+        else:
+            yield path, os.path.basename(path)
+
+
+def output_path(source: str, relative: str, out_dir: Optional[str],
+                extension: Optional[str] = None) -> str:
+    """Ziel-Pfad im Ausgabe-Verzeichnis (bzw. neben der Quelle) mit optional neuer Endung"""
+    target = os.path.join(out_dir, relative) if out_dir else source
+    if extension:
+        target = os.path.splitext(target)[0] + extension
+    return target
+
+
+def grid_issues(grid: Grid) -> List[str]:
+    """
+    Strukturelle Prüfung eines Grids
+
+    Returns:
+        Liste der gefundenen Probleme (leer wenn gültig)
+    """
+    issues = []
+    count = grid.width * grid.height
+    for name in DIFF_COLUMNS:
+        if len(getattr(grid, name)) != count:
+            issues.append(f"column {name} has {len(getattr(grid, name))} entries, expected {count}")
+    if issues:
+        return issues
+
+    # Codes außerhalb der Tabellen zählen (bytes.translate: gültig -> 0, ungültig -> 1)
+    checks = (
+        ("area_codes", "area", len(grid.area_definitions), (NO_AREA,)),
+        ("faction_codes", "faction", len(FACTIONS), ()),
+        ("role_codes", "strategic role", len(STRATEGIC_ROLES), ()),
+    )
+    for name, label, valid_count, extra in checks:
+        table = bytes(0 if code < valid_count or code in extra else 1 for code in range(256))
+        invalid = bytes(getattr(grid, name)).translate(table).count(1)
+        if invalid:
+            issues.append(f"{invalid} tiles have an unknown {label} code")
+    return issues
+
+
+def convert_task(source: str, target: str, indent: Optional[int]) -> TaskResult:
+    """Konvertiert eine Karte ins Format der Ziel-Endung"""
+    map_io = load_map(source)
+    save_map(map_io, target, indent)
+    return source, True, f"-> {target}"
+
+
+def validate_task(source: str, check_rules: bool = True) -> TaskResult:
+    """Lädt und prüft eine Karte (Struktur und, wenn gültig, die Karten-Regeln)"""
+    grid = load_map(source).grid_manager.grid
+    issues = grid_issues(grid)
+    if not issues and check_rules:
+        issues = [issue.message for issue in validate_grid(grid)]
+    if issues:
+        return source, False, "; ".join(issues)
+    return source, True, f"ok ({grid.width}x{grid.height})"
+
+
+def resize_task(source: str, target: str, width: int, height: int,
+                indent: Optional[int]) -> TaskResult:
+    """Ändert die Größe einer Karte"""
+    map_io = load_map(source)
+    old_grid = map_io.grid_manager.grid
+    old_size = f"{old_grid.width}x{old_grid.height}"
+    map_io.grid_manager.resize_grid(width, height)
+    save_map(map_io, target, indent)
+    return source, True, f"{old_size} -> {width}x{height} -> {target}"
+
+
+def diff_task(source: str, other: str, max_listed: int) -> TaskResult:
+    """Vergleicht zwei Karten Tile für Tile"""
+    grid_a = load_map(source).grid_manager.grid
+    grid_b = load_map(other).grid_manager.grid
+    if (grid_a.width, grid_a.height) != (grid_b.width, grid_b.height):
+        return source, False, (f"size differs: {grid_a.width}x{grid_a.height} "
+                               f"vs {grid_b.width}x{grid_b.height}")
+
+    # Area-Codes von B über die Area-IDs in Codes von A übersetzen
+    table = bytearray([NO_AREA]) * 256
+    for code, area in enumerate(grid_b.area_definitions):
+        mapped = grid_a.area_registry.code_for_id(area.id)
+        table[code] = 0xFE if mapped is None else mapped
+
+    differences = []
+    for name in DIFF_COLUMNS:
+        data_a = memoryview(getattr(grid_a, name)).tobytes()
+        data_b = memoryview(getattr(grid_b, name)).tobytes()
+        if name == "area_codes":
+            data_b = data_b.translate(table)
+        if data_a == data_b:
+            continue
+        # Zeilen vergleichen, nur abweichende Zeilen Tile für Tile
+        item_size = len(data_a) // (grid_a.width * grid_a.height)
+        row_size = grid_a.width * item_size
+        changed = []
+        for y in range(grid_a.height):
+            start = y * row_size
+            if data_a[start:start + row_size] == data_b[start:start + row_size]:
+                continue
+            for x in range(grid_a.width):
+                offset = start + x * item_size
+                if data_a[offset:offset + item_size] != data_b[offset:offset + item_size]:
+                    changed.append(y * grid_a.width + x)
+        listed = ", ".join(
+            f"({index % grid_a.width}, {index // grid_a.width})" for index in changed[:max_listed]
+        )
+        more = " ..." if len(changed) > max_listed else ""
+        differences.append(f"{name}: {len(changed)} tiles [{listed}{more}]")
+
+    if differences:
+        return source, False, f"differs from {other}: " + "; ".join(differences)
+    return source, True, f"identical to {other}"
+
+
+def generate_task(target: str, width: int, height: int, settings: TerrainSettings,
+                  indent: Optional[int], workers: int = 1) -> TaskResult:
+    """Erzeugt eine Karte mit generiertem Terrain (workers > 1: Chunks im Prozess-Pool)"""
+    map_io = MapIO(GridManager())
+    map_io.grid_manager.generate_grid(width, height, settings, workers)
+    save_map(map_io, target, indent)
+    return target, True, f"{width}x{height} seed {settings.seed}"
+
+
+def _run_task(task: tuple) -> TaskResult:
+    """Führt eine Aufgabe aus (auch im Worker-Prozess) und fängt Fehler ab"""
+    function, arguments = task
+    try:
+        return function(*arguments)
+    except Exception as e:
+        return arguments[0], False, f"error: {e}"
+
+
+def run_tasks(tasks: List[tuple], jobs: int) -> int:
+    """
+    Führt die Aufgaben parallel in einem Prozess-Pool aus
+
+    Args:
+        tasks: (Funktion, Argumente) Paare
+        jobs: Anzahl Prozesse (1 = im aktuellen Prozess)
+
+    Returns:
+        Exit-Code (0 wenn alle Aufgaben erfolgreich waren)
+    """
+    if not tasks:
+        print("No maps found", file=sys.stderr)
+        return 1
+
+    failures = 0
+    if jobs <= 1 or len(tasks) == 1:
+        results = map(_run_task, tasks)
+        failures = _report(results)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            failures = _report(executor.map(_run_task, tasks))
+
+    print(f"{len(tasks) - failures}/{len(tasks)} succeeded", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def _report(results) -> int:
+    """Gibt die Ergebnisse aus und zählt die Fehlschläge"""
+    failures = 0
+    for path, ok, message in results:
+        print(f"{'OK  ' if ok else 'FAIL'} {path}: {message}")
+        if not ok:
+            failures += 1
+    return failures
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Erstellt den Argument-Parser mit allen Unterbefehlen"""
+    parser = argparse.ArgumentParser(description="Headless hex map batch tool")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: all cores)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_output_options(command, with_format: bool):
+        command.add_argument("paths", nargs="+", help="map files or directories")
+        command.add_argument("-o", "--out-dir", help="output directory (default: next to the source)")
+        command.add_argument("--compact", action="store_true", help="write JSON without indentation")
+        if with_format:
+            command.add_argument("--format", choices=sorted(FORMAT_EXTENSIONS),
+                                 help="output format (default: same as source)")
+
+    convert = commands.add_parser("convert", help="convert maps between JSON and .hexmap")
+    add_output_options(convert, with_format=False)
+    convert.add_argument("--to", required=True, choices=sorted(FORMAT_EXTENSIONS), help="target format")
+
+    validate = commands.add_parser("validate", help="load and check maps")
+    validate.add_argument("paths", nargs="+", help="map files or directories")
+    validate.add_argument("--structure-only", action="store_true",
+                          help="only check column sizes and codes, skip the map rules")
+
+    resize = commands.add_parser("resize", help="resize maps, keeping the overlapping area")
+    add_output_options(resize, with_format=False)
+    resize.add_argument("--width", type=int, required=True)
+    resize.add_argument("--height", type=int, required=True)
+
+    diff = commands.add_parser("diff", help="compare two maps or two directories of maps")
+    diff.add_argument("left", help="map file or directory")
+    diff.add_argument("right", help="map file or directory")
+    diff.add_argument("--max-listed", type=int, default=10,
+                      help="number of differing coordinates listed per column")
+
+    export = commands.add_parser("export", help="re-export maps (normalises the files)")
+    add_output_options(export, with_format=True)
+
+    defaults = TerrainSettings()
+    generate = commands.add_parser("generate", help="generate maps with procedural terrain")
+    generate.add_argument("targets", nargs="+",
+                          help="output files (.json or .hexmap); each gets the next seed")
+    generate.add_argument("--width", type=int, required=True)
+    generate.add_argument("--height", type=int, required=True)
+    generate.add_argument("--seed", type=int, default=defaults.seed, help="seed of the first map")
+    generate.add_argument("--land", type=float, default=defaults.land_ratio, help="share of land tiles")
+    generate.add_argument("--mountains", type=float, default=defaults.mountain_ratio,
+                          help="share of mountains on land")
+    generate.add_argument("--desert", type=float, default=defaults.desert_ratio,
+                          help="share of desert on lowland")
+    generate.add_argument("--feature-size", type=int, default=defaults.feature_size,
+                          help="continent scale in tiles")
+    generate.add_argument("--compact", action="store_true", help="write JSON without indentation")
+
+    return parser
+
+
+def build_tasks(args) -> List[tuple]:
+    """Erstellt die (Funktion, Argumente) Aufgaben für einen Befehl"""
+    indent = None if getattr(args, "compact", False) else 2
+
+    if args.command == "convert":
+        extension = FORMAT_EXTENSIONS[args.to]
+        return [
+            (convert_task, (source, output_path(source, relative, args.out_dir, extension), indent))
+            for source, relative in find_maps(args.paths)
+            if not source.lower().endswith(extension)
+        ]
+
+    if args.command == "validate":
+        return [(validate_task, (source, not args.structure_only)) for source, _ in find_maps(args.paths)]
+
+    if args.command == "resize":
+        if args.width < 1 or args.height < 1:
+            raise SystemExit("width and height must be positive")
+        return [
+            (resize_task, (source, output_path(source, relative, args.out_dir),
+                           args.width, args.height, indent))
+            for source, relative in find_maps(args.paths)
+        ]
+
+    if args.command == "diff":
+        if os.path.isdir(args.left):
+            return [
+                (diff_task, (source, os.path.join(args.right, relative), args.max_listed))
+                for source, relative in find_maps([args.left])
+            ]
+        return [(diff_task, (args.left, args.right, args.max_listed))]
+
+    if args.command == "export":
+        extension = FORMAT_EXTENSIONS.get(args.format) if args.format else None
+        return [
+            (convert_task, (source, output_path(source, relative, args.out_dir, extension), indent))
+            for source, relative in find_maps(args.paths)
+        ]
+
+    if args.command == "generate":
+        if args.width < 1 or args.height < 1:
+            raise SystemExit("width and height must be positive")
+        # Eine einzelne Karte nutzt die Kerne über Chunks, mehrere Karten über den Task-Pool
+        workers = args.jobs if len(args.targets) == 1 else 1
+        return [
+            (generate_task, (target, args.width, args.height,
+                             TerrainSettings(seed=args.seed + number, feature_size=args.feature_size,
+                                             land_ratio=args.land, mountain_ratio=args.mountains,
+                                             desert_ratio=args.desert),
+                             indent, workers))
+            for number, target in enumerate(args.targets)
+        ]
+
+    raise SystemExit(f"Unknown command: {args.command}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Einstiegspunkt der Kommandozeile"""
+    args = build_parser().parse_args(argv)
+    return run_tasks(build_tasks(args), args.jobs)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Flood Fill (Bucket-Tool) für Hex-Grids
+Füllt zusammenhängende Regionen gleichen Werts zeilenweise per Scanline-Verfahren
+"""
+from array import array
+from typing import List, Optional, Tuple
+
+from data.history import ColumnChange, HistoryEntry
+from data.models import Grid
+from data.paint_stroke import layer_writes
+
+
+# Zeilen-Spanne einer Region: (y, x_start, x_end) inklusive
+Span = Tuple[int, int, int]
+
+
+def find_region(grid: Grid, column_name: str, x: int, y: int) -> List[Span]:
+    """
+    Findet die zusammenhängende Region gleichen Werts um (x, y)
+
+    Args:
+        grid: Grid
+        column_name: Vergleichs-Spalte (z.B. 'area_codes')
+        x: Start X-Koordinate
+        y: Start Y-Koordinate
+
+    Returns:
+        Nach Zeile sortierte Spannen der Region (leer bei ungültigem Start)
+    """
+    width, height = grid.width, grid.height
+    if not (0 <= x < width and 0 <= y < height):
+        return []
+
+    column = getattr(grid, column_name)
+    target = column[y * width + x]
+    table = bytes(1 if code == target else 0 for code in range(256))
+    mask = bytearray(memoryview(column).tobytes().translate(table))
+    return take_region(mask, width, height, x, y)
+
+
+def take_region(mask: bytearray, width: int, height: int, x: int, y: int) -> List[Span]:
+    """
+    Findet die zusammenhängende Region gesetzter Masken-Einträge um (x, y)
+
+    Nachbarschaft wie GridManager.get_neighbors (odd-q): (x, y±1) sowie
+    (x±1, y) und (x±1, y-1) für gerade bzw. (x±1, y+1) für ungerade
+    Spalten. Horizontal benachbarte Tiles sind damit immer verbunden, die
+    Region wird als Zeilen-Spannen aufgebaut; Spannen werden mit
+    bytes.find/rfind in der Maske gesucht, ohne Rekursion und ohne
+    Nachbar-Listen. Gefundene Tiles werden in der Maske auf 0 gesetzt, so
+    dass wiederholte Aufrufe alle Regionen einer Maske zerlegen können.
+
+    Args:
+        mask: 0/1-Maske mit einem Eintrag pro Tile (wird verändert)
+        width: Grid-Breite
+        height: Grid-Höhe
+        x: Start X-Koordinate
+        y: Start Y-Koordinate
+
+    Returns:
+        Nach Zeile sortierte Spannen der Region (leer wenn (x, y) nicht gesetzt ist)
+    """
+    if not (0 <= x < width and 0 <= y < height) or not mask[y * width + x]:
+        return []
+
+    def take_run(row_start: int, position: int) -> Tuple[int, int]:
+        """Spanne aus 1-Bytes um position; wird als gefüllt (0) markiert"""
+        run_start = max(row_start, mask.rfind(0, row_start, position) + 1)
+        run_end = mask.find(0, position, row_start + width)
+        if run_end < 0:
+            run_end = row_start + width
+        mask[run_start:run_end] = bytes(run_end - run_start)
+        return run_start - row_start, run_end - 1 - row_start
+
+    spans: List[Span] = []
+    x_start, x_end = take_run(y * width, y * width + x)
+    stack = [(y, x_start, x_end)]
+    while stack:
+        row, x_start, x_end = stack.pop()
+        spans.append((row, x_start, x_end))
+
+        # Nach oben: gerade Spalten am Rand erreichen auch x±1
+        # Nach unten: ungerade Spalten am Rand erreichen auch x±1
+        for next_row, reach_parity in ((row - 1, 0), (row + 1, 1)):
+            if not 0 <= next_row < height:
+                continue
+            low = x_start - 1 if (x_start & 1) == reach_parity else x_start
+            high = x_end + 1 if (x_end & 1) == reach_parity else x_end
+            row_start = next_row * width
+            low = row_start + max(0, low)
+            high = row_start + min(width - 1, high)
+            position = mask.find(1, low, high + 1)
+            while position >= 0:
+                run_start, run_end = take_run(row_start, position)
+                stack.append((next_row, run_start, run_end))
+                run_end += row_start
+                position = mask.find(1, run_end + 1, high + 1) if run_end < high else -1
+
+    spans.sort()
+    return spans
+
+
+def flood_fill(grid: Grid, layer: str, value, x: int, y: int) -> Optional[HistoryEntry]:
+    """
+    Füllt die Region um (x, y) in einem Schritt
+
+    Verglichen wird die Spalte der Mal-Ebene; geschrieben werden alle
+    Spalten der Ebene (Terrain setzt auch is_land) per Slice-Zuweisung
+    je Spanne. Die Undo-Daten entstehen direkt aus den Spannen.
+
+    Args:
+        grid: Grid
+        layer: Mal-Ebene (siehe data.paint_stroke)
+        value: Area, FactionType bzw. StrategicRoleType
+        x: Start X-Koordinate
+        y: Start Y-Koordinate
+
+    Returns:
+        HistoryEntry der Füllung oder None wenn sich nichts ändert
+    """
+    writes = layer_writes(grid, layer, value)
+    region_column, region_code = writes[0]
+    if not (0 <= x < grid.width and 0 <= y < grid.height):
+        return None
+    if getattr(grid, region_column)[y * grid.width + x] == region_code:
+        return None
+
+    spans = find_region(grid, region_column, x, y)
+    starts = array('I', (row * grid.width + x_start for row, x_start, _ in spans))
+    lengths = array('I', (x_end - x_start + 1 for _, x_start, x_end in spans))
+    count = sum(lengths)
+
+    changes = []
+    for column_name, code in writes:
+        column = getattr(grid, column_name)
+        view = memoryview(column)
+        old_data = b"".join(view[start:start + length].tobytes() for start, length in zip(starts, lengths))
+        view.release()
+        if old_data.count(code) == count:
+            continue
+        changes.append(ColumnChange(column_name, 'B', starts, lengths, old_data, bytes([code]) * count))
+        for start, length in zip(starts, lengths):
+            column[start:start + length] = array('B', [code]) * length
+
+    return HistoryEntry(f"Fill {layer} ({count} tiles)", changes)
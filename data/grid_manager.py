@@ -2,9 +2,23 @@
 Grid-Manager für Hex-Karten
 Verwaltet die Erstellung und Manipulation von Hex-Grids
 """
-from typing import Optional, Tuple
-from data.models import Grid, Tile, Area, get_default_areas
-from utils.hex_math import HexMath
+from array import array
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
+from data.models import (
+    Grid, Tile, TileView, Area, FactionType, StrategicRoleType, get_default_areas,
+    FACTION_CODES, STRATEGIC_ROLE_CODES
+)
+from data.history import EditHistory, HistoryEntry, ColumnChange
+from data.paint_stroke import PaintStroke
+from data.flood_fill import flood_fill
+from data.neighbor_table import build_neighbor_table, NEIGHBOR_COUNT, NO_NEIGHBOR
+from data.spatial_query import (
+    rect_indices, hexagon_indices, ring_indices, line_indices, mask_indices, value_indices,
+    iter_tiles
+)
+
+if TYPE_CHECKING:
+    from data.terrain_generator import TerrainSettings
 
 
 class GridManager:
@@ -15,9 +29,34 @@ class GridManager:
         Initialisiert den GridManager
         
         Args:
-            grid: Bestehendes Grid oder None für neues Grid
+            grid: Bestehendes Grid oder None für ein (verzögert angelegtes) Standard-Grid
         """
-        self.grid = grid if grid is not None else Grid()
+        # Das Standard-Grid wird erst beim ersten Zugriff angelegt
+        self._grid = grid
+        
+        # Undo/Redo Verlauf des aktuellen Grids
+        self.history = EditHistory()
+        
+        # Nachbar-Tabelle; hängt nur von der Grid-Größe ab und wird erst
+        # bei einer Größenänderung neu gebaut
+        self._neighbor_table: Optional[array] = None
+        self._neighbor_table_size: Optional[Tuple[int, int]] = None
+    
+    @property
+    def grid(self) -> Grid:
+        """Aktuelles Grid (legt bei Bedarf ein Standard-Grid an)"""
+        if self._grid is None:
+            self._grid = Grid()
+        return self._grid
+    
+    @grid.setter
+    def grid(self, grid: Grid):
+        self._grid = grid
+    
+    @property
+    def has_grid(self) -> bool:
+        """True wenn bereits ein Grid angelegt oder gesetzt wurde"""
+        return self._grid is not None
     
     def create_new_grid(self, width: int, height: int) -> Grid:
         """
@@ -31,9 +70,76 @@ class GridManager:
             Neues Grid-Objekt
         """
         self.grid = Grid(width=width, height=height)
+        self.history.clear()
         return self.grid
     
-    def get_tile_at(self, x: int, y: int) -> Optional[Tile]:
+    def generate_grid(self, width: int, height: int, settings: Optional["TerrainSettings"] = None,
+                      workers: Optional[int] = None) -> Grid:
+        """
+        Erstellt ein neues Grid mit generiertem Terrain
+        
+        Args:
+            width: Breite des Grids
+            height: Höhe des Grids
+            settings: Generierungs-Parameter (Standard: TerrainSettings())
+            workers: Anzahl Prozesse (Standard: alle Kerne ab PARALLEL_MIN_TILES Tiles)
+            
+        Returns:
+            Neues Grid-Objekt
+        """
+        # Erst hier importiert: Generator und Prozess-Pool gehören nicht zum Start des Editors
+        from data.parallel import parallel_generate_terrain
+        
+        grid = self.create_new_grid(width, height)
+        parallel_generate_terrain(grid, settings, self.neighbor_table, workers)
+        return grid
+    
+    def set_grid(self, grid: Grid, neighbor_table: Optional[array] = None) -> Grid:
+        """
+        Ersetzt das aktuelle Grid (z.B. nach dem Laden einer Karte)
+        
+        Args:
+            grid: Neues Grid-Objekt
+            neighbor_table: Bereits gebaute Nachbar-Tabelle für die Größe des
+                Grids (z.B. von einem Hintergrund-Task) oder None
+            
+        Returns:
+            Das gesetzte Grid
+        """
+        self.grid = grid
+        self.history.clear()
+        if neighbor_table is not None:
+            self._neighbor_table = neighbor_table
+            self._neighbor_table_size = (grid.width, grid.height)
+        return self.grid
+    
+    def resize_grid(self, width: int, height: int) -> Grid:
+        """
+        Ändert die Grid-Größe und übernimmt den überlappenden Bereich
+        
+        Neue Tiles sind Wasser, wie bei einem neuen Grid. Die Spalten werden
+        zeilenweise per Slice kopiert.
+        
+        Args:
+            width: Neue Breite
+            height: Neue Höhe
+            
+        Returns:
+            Das neue Grid
+        """
+        old = self.grid
+        new = Grid(width=width, height=height, area_definitions=list(old.area_definitions))
+        copy_width = min(width, old.width)
+        for name in ("area_codes", "faction_codes", "role_codes", "land", "production"):
+            old_column = memoryview(getattr(old, name))
+            new_column = getattr(new, name)
+            for y in range(min(height, old.height)):
+                row = array(new_column.typecode)
+                row.frombytes(old_column[y * old.width:y * old.width + copy_width].tobytes())
+                new_column[y * width:y * width + copy_width] = row
+        return self.set_grid(new)
+    
+    def get_tile_at(self, x: int, y: int) -> Optional[TileView]:
         """
         Holt ein Tile an den gegebenen Koordinaten
         
@@ -42,15 +148,12 @@ class GridManager:
             y: Y-Koordinate
             
         Returns:
-            Tile-Objekt oder None falls außerhalb der Grenzen
+            TileView auf die Grid-Spalten oder None falls außerhalb der Grenzen
         """
         if not self._is_valid_coordinate(x, y):
             return None
         
-        index = y * self.grid.width + x
-        if 0 <= index < len(self.grid.tiles):
-            return self.grid.tiles[index]
-        return None
+        return TileView(self.grid, y * self.grid.width + x)
     
     def set_tile_area(self, x: int, y: int, area: Area) -> bool:
         """
@@ -64,13 +167,165 @@ class GridManager:
         Returns:
             True wenn erfolgreich, False sonst
         """
-        tile = self.get_tile_at(x, y)
-        if tile is not None:
-            tile.area = area
-            return True
-        return False
+        if not self._is_valid_coordinate(x, y):
+            return False
+        
+        grid = self.grid
+        grid.area_codes[y * grid.width + x] = grid.area_code(area)
+        return True
+    
+    def begin_paint_stroke(self, layer: str, value) -> PaintStroke:
+        """
+        Startet einen Pinselstrich auf dem aktuellen Grid
+        
+        Args:
+            layer: Mal-Ebene (siehe data.paint_stroke)
+            value: Area, FactionType bzw. StrategicRoleType
+            
+        Returns:
+            PaintStroke, der die Änderungen des Strichs sammelt
+        """
+        return PaintStroke(self.grid, layer, value)
+    
+    def commit_paint_stroke(self, stroke: PaintStroke, label: Optional[str] = None):
+        """
+        Nimmt einen abgeschlossenen Pinselstrich in den Undo-Verlauf auf
+        
+        Args:
+            stroke: Abgeschlossener PaintStroke
+            label: Beschreibung (Standard: "Paint <layer>")
+        """
+        if stroke.grid is self.grid and stroke.old_values:
+            self.history.push(HistoryEntry.from_stroke(stroke, label or f"Paint {stroke.layer}"))
+    
+    def fill_region(self, layer: str, value, x: int, y: int) -> Optional[HistoryEntry]:
+        """
+        Füllt die zusammenhängende Region gleichen Werts um (x, y) als ein Undo-Schritt
+        
+        Args:
+            layer: Mal-Ebene (siehe data.paint_stroke)
+            value: Area, FactionType bzw. StrategicRoleType
+            x: Start X-Koordinate
+            y: Start Y-Koordinate
+            
+        Returns:
+            Der Undo-Schritt der Füllung oder None wenn sich nichts geändert hat
+        """
+        entry = flood_fill(self.grid, layer, value, x, y)
+        if entry is not None:
+            self.history.push(entry)
+        return entry
+    
+    def apply_tile_changes(self, x: int, y: int, area: Optional[Area] = None,
+                           is_land: Optional[bool] = None,
+                           faction: Optional[FactionType] = None,
+                           strategic_role: Optional[StrategicRoleType] = None,
+                           production: Optional[int] = None) -> bool:
+        """
+        Ändert mehrere Eigenschaften eines Tiles als ein Undo-Schritt
+        
+        Args:
+            x: X-Koordinate
+            y: Y-Koordinate
+            area, is_land, faction, strategic_role, production: Neue Werte
+                (None = unverändert)
+            
+        Returns:
+            True wenn das Tile existiert, False sonst
+        """
+        if not self._is_valid_coordinate(x, y):
+            return False
+        
+        grid = self.grid
+        index = y * grid.width + x
+        new_values = {}
+        if area is not None:
+            new_values["area_codes"] = grid.area_code(area)
+        if is_land is not None:
+            new_values["land"] = 1 if is_land else 0
+        if faction is not None:
+            new_values["faction_codes"] = FACTION_CODES[faction]
+        if strategic_role is not None:
+            new_values["role_codes"] = STRATEGIC_ROLE_CODES[strategic_role]
+        if production is not None:
+            new_values["production"] = int(production)
+        
+        changes = []
+        for column_name, new_value in new_values.items():
+            column = getattr(grid, column_name)
+            old_value = column[index]
+            if old_value != new_value:
+                typecode = 'i' if column_name == "production" else 'B'
+                changes.append(ColumnChange.from_values(column_name, typecode, [index],
+                                                        [old_value], [new_value]))
+                column[index] = new_value
+        
+        self.history.push(HistoryEntry(f"Edit tile ({x}, {y})", changes))
+        return True
+    
+    def undo(self) -> Optional[HistoryEntry]:
+        """
+        Macht den letzten Schritt rückgängig
+        
+        Returns:
+            Der rückgängig gemachte Schritt oder None
+        """
+        return self.history.undo(self.grid)
+    
+    def redo(self) -> Optional[HistoryEntry]:
+        """
+        Wiederholt den zuletzt rückgängig gemachten Schritt
+        
+        Returns:
+            Der wiederholte Schritt oder None
+        """
+        return self.history.redo(self.grid)
+    
+    @property
+    def neighbor_table(self) -> array:
+        """
+        Nachbar-Tabelle des aktuellen Grids (siehe data.neighbor_table)
+        
+        Eintrag [index * 6 + richtung] ist der Index des Nachbarn oder
+        NO_NEIGHBOR außerhalb des Grids. Gebaut wird nur beim ersten Zugriff
+        und nach einer Größenänderung.
+        """
+        grid = self.grid
+        size = (grid.width, grid.height)
+        if self._neighbor_table is None or self._neighbor_table_size != size:
+            self._neighbor_table = build_neighbor_table(grid.width, grid.height)
+            self._neighbor_table_size = size
+        return self._neighbor_table
     
-    def get_neighbors(self, x: int, y: int) -> list[Tile]:
+    def neighbor_indices(self, index: int) -> array:
+        """
+        Nachbar-Indizes eines Tiles (6 Einträge, NO_NEIGHBOR außerhalb)
+        
+        Args:
+            index: Flacher Tile-Index (y * width + x)
+            
+        Returns:
+            array('i') mit 6 Einträgen in der Reihenfolge von HexMath.get_hex_neighbors
+        """
+        base = index * NEIGHBOR_COUNT
+        return self.neighbor_table[base:base + NEIGHBOR_COUNT]
+    
+    def get_neighbor_indices(self, x: int, y: int) -> list[int]:
+        """
+        Indizes aller Nachbarn eines Tiles innerhalb des Grids
+        
+        Args:
+            x: X-Koordinate
+            y: Y-Koordinate
+            
+        Returns:
+            Liste der flachen Nachbar-Indizes
+        """
+        if not self._is_valid_coordinate(x, y):
+            return []
+        return [index for index in self.neighbor_indices(y * self.grid.width + x) if index != NO_NEIGHBOR]
+    
+    def get_neighbors(self, x: int, y: int) -> list[TileView]:
         """
         Holt alle Nachbar-Tiles eines Tiles
         
@@ -81,15 +336,101 @@ class GridManager:
         Returns:
             Liste der Nachbar-Tiles
         """
-        neighbors = []
-        neighbor_coords = HexMath.get_hex_neighbors(x, y)
+        grid = self.grid
+        return [TileView(grid, index) for index in self.get_neighbor_indices(x, y)]
+    
+    def query_rect(self, x0: int, y0: int, x1: int, y1: int) -> array:
+        """
+        Indizes aller Tiles im Rechteck (inklusive, auf das Grid beschnitten)
+        
+        Args:
+            x0, y0: Erste Ecke
+            x1, y1: Gegenüberliegende Ecke
+            
+        Returns:
+            array('I') der flachen Indizes (y * width + x)
+        """
+        return rect_indices(self.grid.width, self.grid.height, x0, y0, x1, y1)
+    
+    def query_hexagon(self, center_x: int, center_y: int, radius: int) -> array:
+        """
+        Indizes aller Tiles mit Hex-Abstand <= radius zum Zentrum
         
-        for nx, ny in neighbor_coords:
-            tile = self.get_tile_at(nx, ny)
-            if tile is not None:
-                neighbors.append(tile)
-                
-        return neighbors
+        Args:
+            center_x: Zentrum X-Koordinate
+            center_y: Zentrum Y-Koordinate
+            radius: Radius (0 = nur Zentrum)
+            
+        Returns:
+            array('I') der flachen Indizes
+        """
+        return hexagon_indices(self.grid.width, self.grid.height, center_x, center_y, radius)
+    
+    def query_ring(self, center_x: int, center_y: int, radius: int) -> array:
+        """
+        Indizes aller Tiles mit Hex-Abstand genau radius zum Zentrum
+        
+        Args:
+            center_x: Zentrum X-Koordinate
+            center_y: Zentrum Y-Koordinate
+            radius: Radius des Rings
+            
+        Returns:
+            array('I') der flachen Indizes
+        """
+        return ring_indices(self.grid.width, self.grid.height, center_x, center_y, radius)
+    
+    def query_line(self, x0: int, y0: int, x1: int, y1: int) -> array:
+        """
+        Indizes der Hex-Linie zwischen zwei Tiles (in Laufrichtung)
+        
+        Args:
+            x0, y0: Start-Koordinate
+            x1, y1: End-Koordinate
+            
+        Returns:
+            array('I') der flachen Indizes
+        """
+        return line_indices(self.grid.width, self.grid.height, x0, y0, x1, y1)
+    
+    def query_mask(self, mask) -> array:
+        """
+        Indizes aller Tiles, deren Masken-Eintrag ungleich 0 ist
+        
+        Args:
+            mask: Byte-Maske mit einem Eintrag pro Tile
+            
+        Returns:
+            array('I') der flachen Indizes
+        """
+        if len(mask) != self.grid.width * self.grid.height:
+            raise ValueError("Maske passt nicht zur Grid-Größe")
+        return mask_indices(mask)
+    
+    def query_values(self, column_name: str, values) -> array:
+        """
+        Indizes aller Tiles mit einem der Codes in einer Spalte
+        
+        Args:
+            column_name: Spalte (z.B. 'role_codes')
+            values: Gesuchte Codes
+            
+        Returns:
+            array('I') der flachen Indizes
+        """
+        return value_indices(getattr(self.grid, column_name), values)
+    
+    def iter_tiles(self, indices) -> Iterator[TileView]:
+        """
+        Iteriert die Tiles zu einer Index-Abfrage
+        
+        Args:
+            indices: Flache Indizes (z.B. aus query_rect)
+            
+        Returns:
+            Iterator über TileViews
+        """
+        return iter_tiles(self.grid, indices)
     
     def _is_valid_coordinate(self, x: int, y: int) -> bool:
         """
@@ -113,11 +454,11 @@ class GridManager:
         """
         return 0, 0, self.grid.width - 1, self.grid.height - 1
     
-    def get_all_tiles(self) -> list[Tile]:
+    def get_all_tiles(self) -> list[TileView]:
         """
         Gibt alle Tiles des Grids zurück
         
         Returns:
-            Liste aller Tiles
+            Liste aller Tiles (als TileViews)
         """
         return self.grid.tiles.copy()
\ No newline at end of file
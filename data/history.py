@@ -0,0 +1,269 @@
+"""
+Undo/Redo Verlauf für Grid-Änderungen
+Speichert Änderungen als kompakte Spalten-Deltas statt als Tile-Kopien
+"""
+import zlib
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from data.models import Grid
+
+
+# Payloads ab dieser Größe (Bytes) werden zlib-komprimiert
+COMPRESS_THRESHOLD = 4096
+
+
+class ColumnChange:
+    """
+    Änderung einer Grid-Spalte
+
+    Die geänderten Indizes werden als Runs (Start, Länge) zusammenhängender
+    Tiles gespeichert, alte und neue Werte als gepackte Bytes in derselben
+    Reihenfolge. Undo/Redo schreibt jeden Run per Slice-Zuweisung zurück.
+    """
+    __slots__ = ("column", "typecode", "starts", "lengths", "old_data", "new_data", "compressed")
+
+    def __init__(self, column: str, typecode: str, starts: array, lengths: array,
+                 old_data: bytes, new_data: bytes):
+        self.column = column
+        self.typecode = typecode
+        self.starts = starts
+        self.lengths = lengths
+        self.compressed = len(old_data) >= COMPRESS_THRESHOLD
+        if self.compressed:
+            old_data = zlib.compress(old_data)
+            new_data = zlib.compress(new_data)
+        self.old_data = old_data
+        self.new_data = new_data
+
+    @classmethod
+    def from_values(cls, column: str, typecode: str, indices: Sequence[int],
+                    old_values: Sequence[int], new_values: Sequence[int]) -> "ColumnChange":
+        """
+        Erstellt eine Änderung aus aufsteigend sortierten Indizes
+
+        Args:
+            column: Name der Grid-Spalte (z.B. 'area_codes')
+            typecode: array-Typecode der Spalte
+            indices: Geänderte Tile-Indizes (aufsteigend)
+            old_values: Alte Werte in Reihenfolge der Indizes
+            new_values: Neue Werte in Reihenfolge der Indizes
+        """
+        starts = array('I')
+        lengths = array('I')
+        run_start = previous = None
+        for index in indices:
+            if previous is not None and index == previous + 1:
+                previous = index
+                continue
+            if run_start is not None:
+                starts.append(run_start)
+                lengths.append(previous - run_start + 1)
+            run_start = previous = index
+        if run_start is not None:
+            starts.append(run_start)
+            lengths.append(previous - run_start + 1)
+        return cls(column, typecode, starts, lengths,
+                   array(typecode, old_values).tobytes(), array(typecode, new_values).tobytes())
+
+    @property
+    def nbytes(self) -> int:
+        """Ungefährer Speicherbedarf in Bytes"""
+        return (len(self.old_data) + len(self.new_data)
+                + self.starts.itemsize * (len(self.starts) + len(self.lengths)))
+
+    def _values(self, data: bytes) -> array:
+        """Entpackt eine Payload in ein array"""
+        values = array(self.typecode)
+        values.frombytes(zlib.decompress(data) if self.compressed else data)
+        return values
+
+    def apply(self, grid: Grid, undo: bool):
+        """Schreibt die alten (undo) bzw. neuen Werte zurück ins Grid"""
+        values = self._values(self.old_data if undo else self.new_data)
+        column = getattr(grid, self.column)
+        position = 0
+        for start, length in zip(self.starts, self.lengths):
+            column[start:start + length] = values[position:position + length]
+            position += length
+
+    def items(self) -> Iterator[Tuple[int, int, int]]:
+        """Iteriert über (Index, alter Wert, neuer Wert)"""
+        old_values = self._values(self.old_data)
+        new_values = self._values(self.new_data)
+        position = 0
+        for start, length in zip(self.starts, self.lengths):
+            for offset in range(length):
+                yield start + offset, old_values[position], new_values[position]
+                position += 1
+
+    def indices(self) -> Iterator[int]:
+        """Iteriert über alle geänderten Tile-Indizes"""
+        for start, length in zip(self.starts, self.lengths):
+            yield from range(start, start + length)
+
+    def row_spans(self, width: int) -> Iterator[Tuple[int, int, int]]:
+        """
+        Iteriert die Runs als Zeilen-Spannen (y, x_start, x_end) inklusive
+
+        Ein Run über mehrere Zeilen wird an den Zeilen-Grenzen geteilt; der
+        Aufwand hängt von der Anzahl Runs und Zeilen ab, nicht der Tiles.
+        """
+        for start, length in zip(self.starts, self.lengths):
+            first_y, first_x = divmod(start, width)
+            last_y, last_x = divmod(start + length - 1, width)
+            for y in range(first_y, last_y + 1):
+                yield (y, first_x if y == first_y else 0,
+                       last_x if y == last_y else width - 1)
+
+
+class HistoryEntry:
+    """Ein Undo-Schritt (Pinselstrich, Tile-Editor Änderung, ...)"""
+
+    def __init__(self, label: str, changes: List[ColumnChange]):
+        self.label = label
+        self.changes = changes
+        self.nbytes = sum(change.nbytes for change in changes)
+
+    def apply(self, grid: Grid, undo: bool):
+        """Macht den Schritt rückgängig bzw. wiederholt ihn"""
+        for change in self.changes:
+            change.apply(grid, undo)
+
+    @classmethod
+    def from_stroke(cls, stroke, label: str) -> "HistoryEntry":
+        """
+        Erstellt einen Undo-Schritt aus einem abgeschlossenen PaintStroke
+
+        Args:
+            stroke: data.paint_stroke.PaintStroke
+            label: Beschreibung des Schritts
+        """
+        indices = sorted(stroke.old_values)
+        changes = []
+        for position, (column, code) in enumerate(stroke.writes):
+            old_values = [stroke.old_values[index][position] for index in indices]
+            # Nur Tiles aufnehmen, deren Wert in dieser Spalte sich geändert hat
+            changed = [i for i, old in enumerate(old_values) if old != code]
+            if not changed:
+                continue
+            if len(changed) != len(indices):
+                column_indices = [indices[i] for i in changed]
+                old_values = [old_values[i] for i in changed]
+            else:
+                column_indices = indices
+            changes.append(ColumnChange.from_values(
+                column, 'B', column_indices, old_values, bytes([code]) * len(column_indices)
+            ))
+        return cls(label, changes)
+
+    @classmethod
+    def merge(cls, entries: Sequence["HistoryEntry"], label: Optional[str] = None) -> "HistoryEntry":
+        """
+        Fasst aufeinanderfolgende Schritte zu einem Schritt zusammen
+
+        Pro Tile bleibt der älteste alte und der jüngste neue Wert erhalten;
+        Tiles, die am Ende wieder ihren Ausgangswert haben, entfallen.
+        """
+        merged: Dict[str, Dict[int, list]] = {}
+        typecodes: Dict[str, str] = {}
+        for entry in entries:
+            for change in entry.changes:
+                typecodes[change.column] = change.typecode
+                values = merged.setdefault(change.column, {})
+                for index, old, new in change.items():
+                    pair = values.get(index)
+                    if pair is None:
+                        values[index] = [old, new]
+                    else:
+                        pair[1] = new
+
+        changes = []
+        for column, values in merged.items():
+            indices = sorted(index for index, (old, new) in values.items() if old != new)
+            if indices:
+                changes.append(ColumnChange.from_values(
+                    column, typecodes[column], indices,
+                    [values[index][0] for index in indices],
+                    [values[index][1] for index in indices]
+                ))
+        if label is None:
+            label = f"{len(entries)} edits"
+        return cls(label, changes)
+
+
+class EditHistory:
+    """
+    Begrenzter Undo/Redo Verlauf
+
+    Überschreitet der Verlauf max_entries Schritte, werden die ältesten
+    merge_count Schritte zu einem Schritt zusammengefasst. Überschreitet
+    er max_bytes, werden die ältesten Schritte verworfen.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 500,
+                 merge_count: int = 50):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.merge_count = merge_count
+
+        self.undo_stack: List[HistoryEntry] = []
+        self.redo_stack: List[HistoryEntry] = []
+        self.nbytes = 0
+
+    def clear(self):
+        """Verwirft den gesamten Verlauf (z.B. bei neuem Grid)"""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.nbytes = 0
+
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def push(self, entry: HistoryEntry):
+        """Nimmt einen neuen Schritt auf und verwirft den Redo-Verlauf"""
+        if not entry.changes:
+            return
+        for dropped in self.redo_stack:
+            self.nbytes -= dropped.nbytes
+        self.redo_stack.clear()
+
+        self.undo_stack.append(entry)
+        self.nbytes += entry.nbytes
+        self._enforce_limits()
+
+    def undo(self, grid: Grid) -> Optional[HistoryEntry]:
+        """Macht den letzten Schritt rückgängig"""
+        if not self.undo_stack:
+            return None
+        entry = self.undo_stack.pop()
+        entry.apply(grid, undo=True)
+        self.redo_stack.append(entry)
+        return entry
+
+    def redo(self, grid: Grid) -> Optional[HistoryEntry]:
+        """Wiederholt den zuletzt rückgängig gemachten Schritt"""
+        if not self.redo_stack:
+            return None
+        entry = self.redo_stack.pop()
+        entry.apply(grid, undo=False)
+        self.undo_stack.append(entry)
+        return entry
+
+    def _enforce_limits(self):
+        """Fasst alte Schritte zusammen bzw. verwirft sie"""
+        if len(self.undo_stack) > self.max_entries:
+            count = min(self.merge_count, len(self.undo_stack) - 1)
+            if count > 1:
+                oldest = self.undo_stack[:count]
+                merged = HistoryEntry.merge(oldest)
+                self.undo_stack[:count] = [merged]
+                self.nbytes += merged.nbytes - sum(entry.nbytes for entry in oldest)
+
+        # Mindestens den neuesten Schritt behalten
+        while self.nbytes > self.max_bytes and len(self.undo_stack) > 1:
+            self.nbytes -= self.undo_stack.pop(0).nbytes
+
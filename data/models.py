@@ -2,9 +2,11 @@
 Datenmodelle für den Hex Map Editor
 Basiert auf den Godot-Projektstrukturen
 """
-from typing import Optional, List, Tuple
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Optional, List, Tuple
 from enum import Enum
-from dataclasses import dataclass, field, field
+from dataclasses import dataclass, field
 
 
 class ResourceType(Enum):
@@ -31,9 +33,28 @@ class StrategicRoleType(Enum):
     NONE = "none"
 
 
-@dataclass
+# Enum-Codes für die spaltenbasierte Speicherung (Code = Position im Tuple)
+FACTIONS: Tuple[FactionType, ...] = tuple(FactionType)
+FACTION_CODES = {faction: code for code, faction in enumerate(FACTIONS)}
+STRATEGIC_ROLES: Tuple[StrategicRoleType, ...] = tuple(StrategicRoleType)
+STRATEGIC_ROLE_CODES = {role: code for code, role in enumerate(STRATEGIC_ROLES)}
+
+# Enum-Wert (z.B. aus JSON oder Dropdowns) -> Enum-Member
+FACTIONS_BY_VALUE = {faction.value: faction for faction in FactionType}
+STRATEGIC_ROLES_BY_VALUE = {role.value: role for role in StrategicRoleType}
+
+# Area-Code für Tiles ohne Terrain
+NO_AREA = 0xFF
+
+
+@dataclass(eq=False)
 class Area:
-    """Terrain-Typ Definition"""
+    """
+    Terrain-Typ Definition
+    
+    Areas werden über die AreaRegistry des Grids geteilt; Vergleiche sind
+    daher Identitäts-Vergleiche.
+    """
     id: str
     display_name: str
     color: str = "#ffffff"  # Hex-Farbe für Darstellung
@@ -50,46 +71,259 @@ class Tile:
     production: int = 0  # Produktion für firepower, intel, mobility
 
 
+class AreaRegistry:
+    """
+    Nachschlage-Index für die Areas eines Grids
+    
+    Hält id -> Area, display_name -> Area und id -> Code, damit Loader,
+    Editor und Paint-Tools Areas in O(1) finden und immer dieselben
+    Area-Objekte verwenden. Außerdem stellt sie die Wert -> Member Maps
+    für FactionType und StrategicRoleType bereit.
+    """
+    
+    def __init__(self, areas: List[Area]):
+        """
+        Args:
+            areas: Area-Liste des Grids (wird bei register() erweitert)
+        """
+        self.areas = areas
+        self.by_id: Dict[str, Area] = {}
+        self.by_display_name: Dict[str, Area] = {}
+        self.codes: Dict[str, int] = {}
+        for code, area in enumerate(areas):
+            self._index(area, code)
+    
+    def _index(self, area: Area, code: int):
+        self.by_id[area.id] = area
+        self.by_display_name.setdefault(area.display_name, area)
+        self.codes[area.id] = code
+    
+    def get(self, area_id: str) -> Optional[Area]:
+        """Area zu einer id oder None"""
+        return self.by_id.get(area_id)
+    
+    def get_by_display_name(self, display_name: str) -> Optional[Area]:
+        """Area zu einem Anzeigenamen oder None"""
+        return self.by_display_name.get(display_name)
+    
+    def code_of(self, area: Optional[Area]) -> int:
+        """
+        Code einer Area; unbekannte Areas werden registriert
+        
+        Raises:
+            ValueError: Wenn keine weiteren Area-Codes frei sind
+        """
+        if area is None:
+            return NO_AREA
+        code = self.codes.get(area.id)
+        if code is None:
+            code = self.register(area)
+        return code
+    
+    def code_for_id(self, area_id: str) -> Optional[int]:
+        """Code zu einer Area-id oder None wenn unbekannt"""
+        return self.codes.get(area_id)
+    
+    def area_for_code(self, code: int) -> Optional[Area]:
+        """Area zu einem Code (NO_AREA -> None)"""
+        if code == NO_AREA:
+            return None
+        return self.areas[code]
+    
+    def register(self, area: Area) -> int:
+        """Hängt eine neue Area an und gibt ihren Code zurück"""
+        code = len(self.areas)
+        if code >= NO_AREA:
+            raise ValueError("Too many area definitions")
+        self.areas.append(area)
+        self._index(area, code)
+        return code
+    
+    @staticmethod
+    def faction(value: str, default: FactionType = FactionType.NEUTRAL) -> FactionType:
+        """FactionType zu einem Wert (unbekannt -> default)"""
+        return FACTIONS_BY_VALUE.get(value, default)
+    
+    @staticmethod
+    def strategic_role(value: str,
+                       default: StrategicRoleType = StrategicRoleType.NONE) -> StrategicRoleType:
+        """StrategicRoleType zu einem Wert (unbekannt -> default)"""
+        return STRATEGIC_ROLES_BY_VALUE.get(value, default)
+
+
+class TileView:
+    """
+    Leichtgewichtiger Tile-Proxy auf die Spalten eines Grids
+    
+    Bietet dieselben Attribute wie Tile, liest und schreibt aber direkt
+    in die gepackten Spalten. Views werden bei Bedarf erzeugt und sind
+    gleich, wenn sie auf dasselbe Tile desselben Grids zeigen.
+    """
+    __slots__ = ("grid", "index")
+    
+    def __init__(self, grid: "Grid", index: int):
+        self.grid = grid
+        self.index = index
+    
+    @property
+    def coordinates(self) -> Tuple[int, int]:
+        y, x = divmod(self.index, self.grid.width)
+        return x, y
+    
+    @property
+    def area(self) -> Optional[Area]:
+        return self.grid.get_area(self.grid.area_codes[self.index])
+    
+    @area.setter
+    def area(self, area: Optional[Area]):
+        self.grid.area_codes[self.index] = self.grid.area_code(area)
+    
+    @property
+    def is_land(self) -> bool:
+        return self.grid.land[self.index] != 0
+    
+    @is_land.setter
+    def is_land(self, is_land: bool):
+        self.grid.land[self.index] = 1 if is_land else 0
+    
+    @property
+    def faction(self) -> FactionType:
+        return FACTIONS[self.grid.faction_codes[self.index]]
+    
+    @faction.setter
+    def faction(self, faction: FactionType):
+        self.grid.faction_codes[self.index] = FACTION_CODES[faction]
+    
+    @property
+    def strategic_role(self) -> StrategicRoleType:
+        return STRATEGIC_ROLES[self.grid.role_codes[self.index]]
+    
+    @strategic_role.setter
+    def strategic_role(self, strategic_role: StrategicRoleType):
+        self.grid.role_codes[self.index] = STRATEGIC_ROLE_CODES[strategic_role]
+    
+    @property
+    def production(self) -> int:
+        return self.grid.production[self.index]
+    
+    @production.setter
+    def production(self, production: int):
+        self.grid.production[self.index] = int(production)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TileView):
+            return NotImplemented
+        return self.grid is other.grid and self.index == other.index
+    
+    def __hash__(self) -> int:
+        return hash((id(self.grid), self.index))
+    
+    def __repr__(self) -> str:
+        return (f"TileView(coordinates={self.coordinates}, area={self.area!r}, "
+                f"is_land={self.is_land}, faction={self.faction}, "
+                f"strategic_role={self.strategic_role}, production={self.production})")
+
+
+class TileSequence(Sequence):
+    """Sequenz-Ansicht auf alle Tiles eines Grids (erzeugt TileViews bei Bedarf)"""
+    
+    def __init__(self, grid: "Grid"):
+        self.grid = grid
+    
+    def __len__(self) -> int:
+        return len(self.grid.area_codes)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [TileView(self.grid, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("tile index out of range")
+        return TileView(self.grid, index)
+    
+    def __iter__(self):
+        grid = self.grid
+        for index in range(len(self)):
+            yield TileView(grid, index)
+    
+    def copy(self) -> List[TileView]:
+        """Gibt eine Liste aller Tile-Views zurück"""
+        return list(self)
+
+
 @dataclass
 class Grid:
-    """Hex-Grid Container"""
+    """
+    Hex-Grid Container
+    
+    Die Tile-Daten liegen spaltenweise in gepackten Arrays (ein Eintrag pro
+    Tile, Index = y * width + x). Enums und Areas werden als kleine
+    Integer-Codes gespeichert; `tiles` liefert TileViews auf diese Spalten.
+    """
     width: int = 50
     height: int = 50
-    tiles: List[Tile] = field(default_factory=list)
     area_definitions: List[Area] = field(default_factory=list)
+    area_codes: Optional[array] = field(default=None, repr=False)
+    faction_codes: Optional[array] = field(default=None, repr=False)
+    role_codes: Optional[array] = field(default=None, repr=False)
+    land: Optional[array] = field(default=None, repr=False)
+    production: Optional[array] = field(default=None, repr=False)
     
     def __post_init__(self):
         """Initialisiere Standard-Terrain-Typen"""
         if not self.area_definitions:
             self.area_definitions = get_default_areas()
+        self.area_registry = AreaRegistry(self.area_definitions)
         
-        # Tiles initialisieren falls leer
-        if not self.tiles:
+        # Spalten initialisieren falls leer
+        if self.area_codes is None:
             self._initialize_tiles()
     
     def _initialize_tiles(self):
-        """Erstelle leere Tiles für das Grid"""
-        water_area = next(
-            (area for area in self.area_definitions if area.id == "water"),
-            self.area_definitions[0] if self.area_definitions else None
-        )
+        """Erstelle leere Tiles (Wasser) für das Grid"""
+        water_code = self.area_registry.code_for_id("water")
+        if water_code is None:
+            water_code = 0 if self.area_definitions else NO_AREA
+        count = self.width * self.height
         
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = Tile(
-                    coordinates=(x, y),
-                    area=water_area,
-                    is_land=False  # Wasser ist kein Land
-                )
-                self.tiles.append(tile)
+        self.area_codes = array('B', [water_code]) * count
+        self.faction_codes = array('B', [FACTION_CODES[FactionType.NEUTRAL]]) * count
+        self.role_codes = array('B', [STRATEGIC_ROLE_CODES[StrategicRoleType.NONE]]) * count
+        self.land = array('B', [0]) * count  # Wasser ist kein Land
+        self.production = array('i', [0]) * count
+    
+    @property
+    def tiles(self) -> TileSequence:
+        """Alle Tiles als Sequenz von TileViews"""
+        return TileSequence(self)
+    
+    def index_of(self, x: int, y: int) -> int:
+        """Flacher Spalten-Index für die Koordinaten (ohne Grenzprüfung)"""
+        return y * self.width + x
+    
+    def area_code(self, area: Optional[Area]) -> int:
+        """
+        Gibt den Code einer Area zurück
+        
+        Unbekannte Areas werden an die area_definitions angehängt.
+        """
+        return self.area_registry.code_of(area)
+    
+    def get_area(self, code: int) -> Optional[Area]:
+        """Gibt die Area zu einem Code zurück"""
+        return self.area_registry.area_for_code(code)
+
+
+DEFAULT_AREAS: Tuple[Area, ...] = (
+    Area("desert", "Desert", "#f4e3a5"),
+    Area("plain", "Plain", "#90c695"),
+    Area("mountains", "Mountains", "#8b7355"),
+    Area("city", "City", "#888888"),
+    Area("water", "Water", "#4682b4"),
+)
 
 
 def get_default_areas() -> List[Area]:
-    """Standard Terrain-Typen"""
-    return [
-        Area("desert", "Desert", "#f4e3a5"),
-        Area("plain", "Plain", "#90c695"),
-        Area("mountains", "Mountains", "#8b7355"),
-        Area("city", "City", "#888888"),
-        Area("water", "Water", "#4682b4"),
-    ]
\ No newline at end of file
+    """Standard Terrain-Typen (geteilte Area-Objekte, neue Liste)"""
+    return list(DEFAULT_AREAS)
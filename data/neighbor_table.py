@@ -0,0 +1,67 @@
+"""
+Vorberechnete Nachbar-Tabelle für Hex-Grids
+Flaches int32-Array mit 6 Nachbar-Indizes pro Tile, gemeinsam genutzt von Graph-Algorithmen
+"""
+from array import array
+from typing import Tuple
+
+
+NEIGHBOR_COUNT = 6
+
+# Eintrag für Nachbarn außerhalb des Grids
+NO_NEIGHBOR = -1
+
+# Nachbar-Offsets (dx, dy) je Spalten-Parität, Reihenfolge wie HexMath.get_hex_neighbors
+NEIGHBOR_OFFSETS: Tuple[Tuple[Tuple[int, int], ...], Tuple[Tuple[int, int], ...]] = (
+    ((0, -1), (0, 1), (-1, -1), (-1, 0), (1, -1), (1, 0)),  # gerade Spalten
+    ((0, -1), (0, 1), (-1, 0), (-1, 1), (1, 0), (1, 1)),    # ungerade Spalten
+)
+
+
+def build_neighbor_table(width: int, height: int) -> array:
+    """
+    Baut die Nachbar-Tabelle eines Grids
+
+    Eintrag [index * 6 + richtung] ist der flache Index des Nachbarn in
+    dieser Richtung oder NO_NEIGHBOR. Die Einträge werden pro Zeile,
+    Spalten-Parität und Richtung als Slice-Zuweisung mit Schrittweite
+    geschrieben, nicht Tile für Tile.
+
+    Args:
+        width: Grid-Breite
+        height: Grid-Höhe
+
+    Returns:
+        array('i') der Länge width * height * 6
+    """
+    count_tiles = width * height
+    table = array('i', [NO_NEIGHBOR]) * (count_tiles * NEIGHBOR_COUNT)
+    if count_tiles == 0:
+        return table
+    # Alle Indizes mit einem Eintrag Rand links/rechts; Nachbar-Spannen
+    # werden daraus per Slice kopiert statt als Python-Zahlen erzeugt
+    indices = array('i', range(-1, count_tiles + 1))
+    stride = 2 * NEIGHBOR_COUNT
+    row_stride = width * NEIGHBOR_COUNT
+    for parity, offsets in enumerate(NEIGHBOR_OFFSETS):
+        count = len(range(parity, width, 2))
+        if count == 0:
+            continue
+        for direction, (dx, dy) in enumerate(offsets):
+            rows = range(max(0, -dy), min(height, height - dy))
+            if width % 2 == 0:
+                # Bei gerader Breite schließen die Zeilen lückenlos im Schritt 2 an
+                runs = [(rows.start, count * len(rows))] if rows else []
+            else:
+                runs = [(y, count) for y in rows]
+            for y, run in runs:
+                start = y * width + parity
+                first = start + dy * width + dx + 1
+                slot = start * NEIGHBOR_COUNT + direction
+                table[slot:slot + (run - 1) * stride + 1:stride] = indices[first:first + 2 * run - 1:2]
+            # Spalten am linken/rechten Rand haben keinen Nachbarn in dx-Richtung
+            edge_x = 0 if dx < 0 else width - 1
+            if dx != 0 and edge_x & 1 == parity:
+                slot = edge_x * NEIGHBOR_COUNT + direction
+                table[slot::row_stride] = array('i', [NO_NEIGHBOR]) * height
+    return table
@@ -0,0 +1,171 @@
+"""
+Mal-Striche als Transaktion
+Sammelt alle Änderungen eines Pinselstrichs und schreibt sie zeilenweise in die Grid-Spalten
+"""
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from data.models import Grid, FACTION_CODES, STRATEGIC_ROLE_CODES
+from utils.hex_math import HexMath
+
+
+# Mal-Ebenen eines Strichs
+LAYER_AREA = "area"
+LAYER_FACTION = "faction"
+LAYER_STRATEGIC_ROLE = "strategic_role"
+
+
+def layer_writes(grid: Grid, layer: str, value) -> List[Tuple[str, int]]:
+    """
+    Zu schreibende (Spalten-Name, Code) Paare einer Mal-Ebene
+
+    Die erste Spalte ist die Spalte der Ebene selbst; Terrain setzt
+    zusätzlich is_land.
+
+    Args:
+        grid: Zu bemalendes Grid
+        layer: LAYER_AREA, LAYER_FACTION oder LAYER_STRATEGIC_ROLE
+        value: Area, FactionType bzw. StrategicRoleType
+    """
+    if layer == LAYER_AREA:
+        return [("area_codes", grid.area_code(value)),
+                ("land", 0 if value.id == "water" else 1)]
+    if layer == LAYER_FACTION:
+        return [("faction_codes", FACTION_CODES[value])]
+    if layer == LAYER_STRATEGIC_ROLE:
+        return [("role_codes", STRATEGIC_ROLE_CODES[value])]
+    raise ValueError(f"Unknown paint layer: {layer}")
+
+
+class PaintStroke:
+    """
+    Ein Pinselstrich vom Drücken bis zum Loslassen der Maus
+
+    Zwischen zwei Maus-Positionen wird eine Hex-Linie gerastert, damit
+    bei schnellen Bewegungen keine Lücken entstehen. Die Pinsel-Abdrücke
+    entlang der Linie werden aus den gecachten Zeilen-Spannen zu einer
+    Spanne pro Zeile vereinigt und als Slice-Zuweisung auf die Spalten
+    geschrieben. Für jedes geänderte Tile werden die
+    ursprünglichen Codes einmal gemerkt.
+    """
+
+    def __init__(self, grid: Grid, layer: str, value):
+        """
+        Args:
+            grid: Zu bemalendes Grid
+            layer: LAYER_AREA, LAYER_FACTION oder LAYER_STRATEGIC_ROLE
+            value: Area, FactionType bzw. StrategicRoleType
+        """
+        self.grid = grid
+        self.layer = layer
+        self.value = value
+
+        # Zu schreibende (Spalten-Name, Code) Paare; Terrain setzt auch is_land
+        self.writes = layer_writes(grid, layer, value)
+
+        # Pro Spalte: Übersetzungstabelle Code -> 0 (bereits gesetzt) bzw. 1
+        self.mismatch_tables = [
+            bytes(0 if value == code else 1 for value in range(256)) for _, code in self.writes
+        ]
+
+        # Tile-Index -> ursprüngliche Codes (in Reihenfolge von writes)
+        self.old_values: Dict[int, Tuple[int, ...]] = {}
+        self.last_position: Optional[Tuple[int, int]] = None
+
+    @property
+    def column_names(self) -> List[str]:
+        """Namen der Spalten, die der Strich verändert"""
+        return [name for name, _ in self.writes]
+
+    def paint_to(self, x: int, y: int, radius: int) -> List[int]:
+        """
+        Malt von der letzten Position bis (x, y)
+
+        Args:
+            x: Hex X-Koordinate
+            y: Hex Y-Koordinate
+            radius: Pinsel-Radius (0 = ein Hex)
+
+        Returns:
+            Indizes der Tiles, die durch diesen Aufruf geändert wurden
+        """
+        if self.last_position is None:
+            positions = [(x, y)]
+        else:
+            positions = HexMath.hex_line(self.last_position[0], self.last_position[1], x, y)[1:]
+        self.last_position = (x, y)
+
+        # Pinsel-Abdrücke entlang der Linie zu Zeilen-Spannen vereinigen,
+        # damit jedes Tile pro Aufruf nur einmal geprüft und geschrieben wird
+        spans: Dict[int, List[List[int]]] = {}
+        for center_x, center_y in positions:
+            for dy, dx_min, dx_max in HexMath.get_radius_rows(radius, center_x & 1):
+                row_spans = spans.setdefault(center_y + dy, [])
+                x_start = center_x + dx_min
+                x_end = center_x + dx_max
+                if row_spans and row_spans[-1][0] - 1 <= x_end and x_start <= row_spans[-1][1] + 1:
+                    last = row_spans[-1]
+                    last[0] = min(last[0], x_start)
+                    last[1] = max(last[1], x_end)
+                else:
+                    row_spans.append([x_start, x_end])
+
+        changed = []
+        for y, row_spans in spans.items():
+            if 0 <= y < self.grid.height:
+                for x_start, x_end in _merge_spans(row_spans):
+                    self._paint_span(y, x_start, x_end, changed)
+        return changed
+
+    def _paint_span(self, y: int, x_start: int, x_end: int, changed: List[int]):
+        """Schreibt eine Zeilen-Spanne (auf das Grid beschnitten) in die Spalten"""
+        grid = self.grid
+        x_start = max(0, x_start)
+        x_end = min(grid.width - 1, x_end)
+        if x_start > x_end:
+            return
+        start = y * grid.width + x_start
+        end = start + x_end - x_start + 1
+        count = end - start
+
+        # Alte Werte der Zeile; bereits gesetzte Spannen überspringen
+        columns = [(getattr(grid, name), code) for name, code in self.writes]
+        rows = [bytes(column[start:end]) for column, _ in columns]
+        if all(row.count(code) == count for row, (_, code) in zip(rows, columns)):
+            return
+
+        # Maske der abweichenden Tiles (1 = ändert sich), über alle Spalten verodert
+        mask = 0
+        for row, table in zip(rows, self.mismatch_tables):
+            mask |= int.from_bytes(row.translate(table), "little")
+        mask = mask.to_bytes(count, "little")
+
+        old_values = self.old_values
+        offset = mask.find(1)
+        while offset >= 0:
+            index = start + offset
+            if index not in old_values:
+                old_values[index] = tuple(row[offset] for row in rows)
+            changed.append(index)
+            offset = mask.find(1, offset + 1)
+
+        for column, code in columns:
+            column[start:end] = array('B', [code]) * count
+
+    @property
+    def changed_count(self) -> int:
+        """Anzahl der im Strich geänderten Tiles"""
+        return len(self.old_values)
+
+
+def _merge_spans(spans: List[List[int]]) -> List[List[int]]:
+    """Vereinigt überlappende oder angrenzende [start, end] Spannen"""
+    if len(spans) <= 1:
+        return spans
+    merged = []
+    for x_start, x_end in sorted(spans):
+        if merged and x_start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], x_end)
+        else:
+            merged.append([x_start, x_end])
+    return merged
@@ -0,0 +1,409 @@
+"""
+Parallele Verarbeitung großer Grids in Chunks
+Zerlegt das Grid in Zeilen-Bänder mit Halo-Zeilen und verteilt Chunk-Jobs über einen Prozess-Pool
+"""
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from data.models import Grid
+from data.neighbor_table import build_neighbor_table, NEIGHBOR_COUNT
+from data.pathfinding import MovementCosts, IMPASSABLE, UNREACHABLE, distance_field
+from data.terrain_generator import (
+    TerrainSettings, TerrainThresholds, generate_terrain, terrain_codes, noise_fields,
+    terrain_thresholds, classify_terrain, write_terrain
+)
+
+
+# Chunks pro Worker (mehr Chunks gleichen unterschiedlich teure Bänder aus)
+CHUNKS_PER_WORKER = 2
+
+# Mindesthöhe eines Chunks in Zeilen
+MIN_CHUNK_ROWS = 16
+
+# Ab dieser Tile-Anzahl lohnt der Prozess-Pool (darunter überwiegt der Start der Prozesse)
+PARALLEL_MIN_TILES = 1000000
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """Rechteckiger Ausschnitt des Grids (volle Breite) mit Halo-Zeilen"""
+    index: int
+    y_start: int  # Erste eigene Zeile
+    y_end: int  # Erste Zeile nach dem Chunk
+    halo_start: int  # Erste Zeile inklusive Halo
+    halo_end: int  # Erste Zeile nach dem Halo
+
+    @property
+    def rows(self) -> range:
+        """Eigene Zeilen (nur diese schreibt der Chunk-Job)"""
+        return range(self.y_start, self.y_end)
+
+    @property
+    def halo_rows(self) -> range:
+        """Gelesene Zeilen inklusive Halo"""
+        return range(self.halo_start, self.halo_end)
+
+
+def split_rows(height: int, chunk_count: int, halo: int = 0) -> List[Chunk]:
+    """
+    Zerlegt die Zeilen in gleich hohe Bänder
+
+    Args:
+        height: Grid-Höhe
+        chunk_count: Gewünschte Anzahl Chunks (höchstens eine pro MIN_CHUNK_ROWS Zeilen)
+        halo: Zusätzlich gelesene Zeilen über und unter jedem Band
+
+    Returns:
+        Chunks von oben nach unten
+    """
+    chunk_count = max(1, min(chunk_count, height // MIN_CHUNK_ROWS))
+    chunks = []
+    for index in range(chunk_count):
+        y_start = height * index // chunk_count
+        y_end = height * (index + 1) // chunk_count
+        chunks.append(Chunk(index, y_start, y_end, max(0, y_start - halo), min(height, y_end + halo)))
+    return chunks
+
+
+@dataclass(frozen=True)
+class ColumnBuffer:
+    """Shared-Memory Block einer Spalte"""
+    name: str
+    typecode: str
+    length: int
+
+
+@dataclass(frozen=True)
+class SharedGridHandle:
+    """Picklebare Beschreibung der geteilten Spalten (wird statt der Daten an die Worker geschickt)"""
+    width: int
+    height: int
+    columns: Dict[str, ColumnBuffer]
+
+
+class SharedColumns:
+    """
+    Spalten-Puffer in Shared Memory
+
+    Der Hauptprozess legt die Blöcke an und gibt sie beim Schließen frei;
+    Worker öffnen sie über attach_columns() anhand des Handles. Die Spalten
+    werden als memoryview mit dem Typecode der Grid-Spalte bereitgestellt,
+    Chunk-Jobs lesen und schreiben also direkt in die gemeinsamen Daten.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+        self._buffers: Dict[str, ColumnBuffer] = {}
+        self._views: Dict[str, memoryview] = {}
+
+    def add(self, name: str, typecode: str, source=None) -> memoryview:
+        """
+        Legt eine Spalte an
+
+        Args:
+            name: Spalten-Name
+            typecode: array-Typecode
+            source: Startwerte (array oder bytes-artig, gleiche Länge) oder None für Nullen
+
+        Returns:
+            memoryview der Spalte
+        """
+        length = self.width * self.height
+        item_size = array(typecode).itemsize
+        block = shared_memory.SharedMemory(create=True, size=max(1, length * item_size))
+        self._blocks[name] = block
+        self._buffers[name] = ColumnBuffer(block.name, typecode, length)
+        view = block.buf[:length * item_size].cast(typecode)
+        if source is not None:
+            view.cast('B')[:] = memoryview(source).cast('B')
+        self._views[name] = view
+        return view
+
+    def view(self, name: str) -> memoryview:
+        """memoryview einer Spalte"""
+        return self._views[name]
+
+    @property
+    def handle(self) -> SharedGridHandle:
+        """Handle für die Worker"""
+        return SharedGridHandle(self.width, self.height, dict(self._buffers))
+
+    def close(self):
+        """Gibt alle Blöcke frei"""
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+        self._buffers.clear()
+
+    def __enter__(self) -> "SharedColumns":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@contextmanager
+def attach_columns(handle: SharedGridHandle) -> Iterator[Dict[str, memoryview]]:
+    """Öffnet die geteilten Spalten im Worker (Spalten-Name -> memoryview)"""
+    blocks = []
+    views = {}
+    try:
+        for name, buffer in handle.columns.items():
+            block = shared_memory.SharedMemory(name=buffer.name)
+            blocks.append(block)
+            item_size = array(buffer.typecode).itemsize
+            views[name] = block.buf[:buffer.length * item_size].cast(buffer.typecode)
+        yield views
+    finally:
+        for view in views.values():
+            view.release()
+        for block in blocks:
+            block.close()
+
+
+def default_workers(tile_count: Optional[int] = None) -> int:
+    """
+    Anzahl Worker-Prozesse
+
+    Args:
+        tile_count: Tile-Anzahl des Grids; kleine Grids laufen im aktuellen Prozess
+
+    Returns:
+        Alle Kerne bzw. 1 unter PARALLEL_MIN_TILES
+    """
+    if tile_count is not None and tile_count < PARALLEL_MIN_TILES:
+        return 1
+    return os.cpu_count() or 1
+
+
+def run_chunks(job: Callable, handle: SharedGridHandle, chunks: Iterable[Chunk], *args,
+               executor: Optional[ProcessPoolExecutor] = None) -> list:
+    """
+    Führt job(handle, chunk, *args) für alle Chunks aus
+
+    Args:
+        job: Modul-Funktion (picklebar), liest und schreibt über attach_columns
+        handle: Handle der geteilten Spalten
+        chunks: Chunks
+        args: Weitere (picklebare) Argumente für jeden Job
+        executor: Prozess-Pool oder None (im aktuellen Prozess ausführen)
+
+    Returns:
+        Rückgabewerte der Jobs in Chunk-Reihenfolge
+    """
+    chunks = list(chunks)
+    if executor is None:
+        return [job(handle, chunk, *args) for chunk in chunks]
+    futures = [executor.submit(job, handle, chunk, *args) for chunk in chunks]
+    return [future.result() for future in futures]
+
+
+@contextmanager
+def _pool(workers: int) -> Iterator[Optional[ProcessPoolExecutor]]:
+    """Prozess-Pool oder None bei einem Worker"""
+    if workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield executor
+
+
+def _noise_job(handle: SharedGridHandle, chunk: Chunk, settings: TerrainSettings):
+    """Berechnet Höhe und Feuchtigkeit für die Zeilen eines Chunks"""
+    width = handle.width
+    elevation, moisture = noise_fields(width, handle.height, settings, chunk.rows)
+    with attach_columns(handle) as columns:
+        columns["elevation"][chunk.y_start * width:chunk.y_end * width] = elevation
+        columns["moisture"][chunk.y_start * width:chunk.y_end * width] = moisture
+
+
+def _classify_job(handle: SharedGridHandle, chunk: Chunk, codes: Dict[str, int],
+                  thresholds: TerrainThresholds):
+    """Klassifiziert die Zeilen eines Chunks in area_codes und land"""
+    start, end = chunk.y_start * handle.width, chunk.y_end * handle.width
+    with attach_columns(handle) as columns:
+        area, land = classify_terrain(columns["elevation"][start:end].tobytes(),
+                                      columns["moisture"][start:end].tobytes(), codes, thresholds)
+        columns["area_codes"][start:end] = area
+        columns["land"][start:end] = land
+
+
+def parallel_generate_terrain(grid: Grid, settings: Optional[TerrainSettings] = None,
+                              neighbors: Optional[array] = None,
+                              workers: Optional[int] = None) -> Dict[str, int]:
+    """
+    Terrain-Generierung wie generate_terrain, Noise und Klassifizierung in Chunks parallel
+
+    Die Noise-Felder landen in geteilten Puffern; die Schwellwerte werden
+    im Hauptprozess aus den ganzen Feldern bestimmt, danach klassifiziert
+    jeder Chunk seine Zeilen. Städte und das Schreiben ins Grid laufen wie
+    in generate_terrain. Das Ergebnis ist identisch mit generate_terrain.
+
+    Args:
+        grid: Ziel-Grid
+        settings: Generierungs-Parameter (Standard: TerrainSettings())
+        neighbors: Nachbar-Tabelle (sonst neu gebaut)
+        workers: Anzahl Prozesse (Standard: default_workers für die Grid-Größe)
+
+    Returns:
+        Anzahl Tiles pro Area-ID
+    """
+    width, height = grid.width, grid.height
+    workers = default_workers(width * height) if workers is None else workers
+    if workers <= 1 or width * height == 0:
+        return generate_terrain(grid, settings, neighbors)
+    if settings is None:
+        settings = TerrainSettings()
+    if neighbors is None:
+        neighbors = build_neighbor_table(width, height)
+    chunks = split_rows(height, workers * CHUNKS_PER_WORKER)
+    codes = terrain_codes(grid)
+
+    with SharedColumns(width, height) as shared, _pool(workers) as executor:
+        for name in ("elevation", "moisture", "area_codes", "land"):
+            shared.add(name, 'B')
+        run_chunks(_noise_job, shared.handle, chunks, settings, executor=executor)
+        thresholds = terrain_thresholds(shared.view("elevation").tobytes(),
+                                        shared.view("moisture").tobytes(), settings)
+        run_chunks(_classify_job, shared.handle, chunks, codes, thresholds, executor=executor)
+        area = bytearray(shared.view("area_codes"))
+        land = shared.view("land").tobytes()
+    return write_terrain(grid, area, land, codes, settings, neighbors)
+
+
+def _copy_column(view: memoryview, start: int, end: int) -> array:
+    """Kopiert einen Bereich einer geteilten Spalte in ein lokales array"""
+    values = array(view.format)
+    values.frombytes(view[start:end].tobytes())
+    return values
+
+
+@lru_cache(maxsize=8)
+def _region_neighbor_table(width: int, rows: int) -> array:
+    """Nachbar-Tabelle eines Zeilen-Bands (gecacht im Worker-Prozess über alle Runden)"""
+    return build_neighbor_table(width, rows)
+
+
+def _distance_job(handle: SharedGridHandle, chunk: Chunk, seed_all: bool, limit: int) -> bool:
+    """
+    Entspannt das Distanz-Feld eines Chunks (Dijkstra im Band inklusive Halo)
+
+    Startwerte sind die bekannten Distanzen aller Tiles des Bands (erste
+    Runde) bzw. der Halo-Zeilen, über die Verbesserungen der Nachbar-Chunks
+    hereinkommen. Gelesen wird der Stand der letzten Runde ("distances"),
+    geschrieben werden nur die eigenen Zeilen in "updated"; kein Job liest
+    also Zeilen, die gleichzeitig geschrieben werden.
+
+    Returns:
+        True wenn sich eine eigene Distanz verbessert hat
+    """
+    width = handle.width
+    offset = chunk.halo_start * width
+    start, end = chunk.y_start * width, chunk.y_end * width
+    with attach_columns(handle) as columns:
+        costs = _copy_column(columns["costs"], offset, chunk.halo_end * width)
+        distances = _copy_column(columns["distances"], offset, chunk.halo_end * width)
+        previous = distances[start - offset:end - offset]
+        neighbors = _region_neighbor_table(width, len(chunk.halo_rows))
+
+        if seed_all:
+            seeds = range(len(distances))
+        else:
+            seeds = [index for part in (range(0, start - offset), range(end - offset, len(distances)))
+                     for index in part]
+        heap = [(distances[index], index) for index in seeds if distances[index] >= 0]
+        heapq.heapify(heap)
+
+        push = heapq.heappush
+        pop = heapq.heappop
+        while heap:
+            cost, index = pop(heap)
+            if cost != distances[index]:
+                continue
+            base = index * NEIGHBOR_COUNT
+            for neighbor in neighbors[base:base + NEIGHBOR_COUNT]:
+                if neighbor < 0:
+                    continue
+                step = costs[neighbor]
+                if step < 0:
+                    continue
+                new_cost = cost + step
+                if new_cost > limit:
+                    continue
+                known = distances[neighbor]
+                if known < 0 or new_cost < known:
+                    distances[neighbor] = new_cost
+                    push(heap, (new_cost, neighbor))
+
+        own = distances[start - offset:end - offset]
+        if own == previous:
+            return False
+        columns["updated"][start:end] = own
+        return True
+
+
+def parallel_distance_field(grid: Grid, sources: Iterable[int], costs: Optional[array] = None,
+                            max_cost: Optional[int] = None, neighbors: Optional[array] = None,
+                            workers: Optional[int] = None,
+                            progress: Optional[Callable[[float], None]] = None) -> array:
+    """
+    Distanz-Feld wie pathfinding.distance_field, in Chunks parallel berechnet
+
+    Jeder Chunk rechnet Dijkstra auf seinem Band mit einer Halo-Zeile oben
+    und unten. Runden werden wiederholt, bis kein Chunk mehr eine Distanz
+    verbessert; das Ergebnis ist dann identisch mit distance_field. Wege,
+    die viele Bänder kreuzen, brauchen entsprechend viele Runden.
+
+    Args:
+        grid: Grid
+        sources: Start-Indizes
+        costs: Kosten-Feld (Standard: MovementCosts().build(grid))
+        max_cost: Suche ab diesen Kosten abbrechen (None = ganzes Grid)
+        neighbors: Nachbar-Tabelle für die Berechnung im aktuellen Prozess (bei einem Worker)
+        workers: Anzahl Prozesse (Standard: default_workers für die Grid-Größe)
+        progress: Fortschritts-Callback (Anteil erreichter Tiles, nach jeder Runde);
+            darf eine Exception werfen, um abzubrechen
+
+    Returns:
+        array('i') mit den minimalen Kosten pro Tile (UNREACHABLE = nicht erreichbar)
+    """
+    width, height = grid.width, grid.height
+    workers = default_workers(width * height) if workers is None else workers
+    if workers <= 1:
+        return distance_field(grid, sources, costs, neighbors, max_cost, progress)
+    if costs is None:
+        costs = MovementCosts().build(grid)
+    limit = max_cost if max_cost is not None else 2 ** 31 - 1
+    chunks = split_rows(height, workers * CHUNKS_PER_WORKER, halo=1)
+
+    distances = array('i', [UNREACHABLE]) * (width * height)
+    for source in sources:
+        if costs[source] != IMPASSABLE:
+            distances[source] = 0
+
+    with SharedColumns(width, height) as shared, _pool(workers) as executor:
+        shared.add("costs", 'i', costs)
+        current = shared.add("distances", 'i', distances)
+        updated = shared.add("updated", 'i', distances)
+        seed_all = True
+        while any(run_chunks(_distance_job, shared.handle, chunks, seed_all, limit, executor=executor)):
+            current[:] = updated
+            seed_all = False
+            if progress is not None:
+                unreached = _copy_column(current, 0, width * height).count(UNREACHABLE)
+                progress(1.0 - unreached / (width * height))
+        distances = _copy_column(current, 0, width * height)
+    return distances
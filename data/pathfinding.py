@@ -0,0 +1,229 @@
+"""
+Wegfindung und Bewegungskosten auf Hex-Grids
+A*/Dijkstra über flache Tile-Indizes mit vorberechneter Nachbar-Tabelle und Binär-Heap
+"""
+import heapq
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from data.models import Grid, StrategicRoleType, STRATEGIC_ROLE_CODES
+from data.neighbor_table import build_neighbor_table, NEIGHBOR_COUNT
+
+
+# Kosten für das Betreten eines Tiles; IMPASSABLE sperrt das Tile
+IMPASSABLE = -1
+DEFAULT_AREA_COSTS: Dict[str, int] = {
+    "plain": 10,
+    "city": 10,
+    "desert": 15,
+    "mountains": 40,
+    "water": IMPASSABLE,
+}
+DEFAULT_ROLE_COSTS: Dict[StrategicRoleType, int] = {
+    StrategicRoleType.RAILWAY: 2,
+}
+DEFAULT_COST = 10
+
+# Wert im Distanz-Feld für nicht erreichbare Tiles
+UNREACHABLE = -1
+
+# Fortschritt von distance_field wird alle so viele abgeschlossene Tiles gemeldet
+PROGRESS_INTERVAL = 1 << 16
+
+
+class MovementCosts:
+    """
+    Bewegungskosten pro Tile
+
+    Die Kosten gelten für das Betreten eines Tiles und richten sich nach
+    der Area; strategische Rollen (z.B. Railway) ersetzen die Kosten
+    begehbarer Tiles.
+    """
+
+    def __init__(self, area_costs: Optional[Dict[str, int]] = None,
+                 role_costs: Optional[Dict[StrategicRoleType, int]] = None,
+                 default_cost: int = DEFAULT_COST):
+        """
+        Args:
+            area_costs: Area-ID -> Kosten (IMPASSABLE = gesperrt)
+            role_costs: Rolle -> Kosten auf begehbaren Tiles
+            default_cost: Kosten für Areas ohne Eintrag
+        """
+        self.area_costs = dict(DEFAULT_AREA_COSTS if area_costs is None else area_costs)
+        self.role_costs = dict(DEFAULT_ROLE_COSTS if role_costs is None else role_costs)
+        self.default_cost = default_cost
+
+    def build(self, grid: Grid) -> array:
+        """
+        Kosten-Feld des Grids
+
+        Returns:
+            array('i') mit einem Eintrag pro Tile (IMPASSABLE = gesperrt)
+        """
+        table = [self.default_cost] * 256
+        for code, area in enumerate(grid.area_definitions):
+            table[code] = self.area_costs.get(area.id, self.default_cost)
+        costs = array('i', [table[code] for code in memoryview(grid.area_codes).tobytes()])
+
+        roles = memoryview(grid.role_codes).tobytes()
+        for role, cost in self.role_costs.items():
+            code = STRATEGIC_ROLE_CODES[role]
+            index = roles.find(code)
+            while index >= 0:
+                if costs[index] != IMPASSABLE:
+                    costs[index] = cost
+                index = roles.find(code, index + 1)
+        return costs
+
+
+def min_passable_cost(costs: array) -> int:
+    """Kleinste Kosten eines begehbaren Tiles (untere Schranke für die A*-Heuristik)"""
+    values = [cost for cost in set(costs) if cost >= 0]
+    return min(values) if values else 0
+
+
+@dataclass
+class PathResult:
+    """Ergebnis einer Wegsuche"""
+    path: List[int] = field(default_factory=list)  # Tile-Indizes vom Start zum Ziel
+    cost: int = 0  # Summe der Kosten der betretenen Tiles (ohne Start)
+    explored: int = 0  # Anzahl expandierter Tiles
+
+
+def _cube(index: int, width: int):
+    """Cube-Koordinaten (q, r) eines Index (odd-q, wie HexMath.offset_to_cube)"""
+    y, x = divmod(index, width)
+    return x, y - (x - (x & 1)) // 2
+
+
+def find_path(grid: Grid, start: int, goal: int, costs: Optional[array] = None,
+              neighbors: Optional[array] = None, min_step_cost: Optional[int] = None) -> Optional[PathResult]:
+    """
+    Kürzester Weg per A*
+
+    Args:
+        grid: Grid
+        start: Start-Index
+        goal: Ziel-Index
+        costs: Kosten-Feld (Standard: MovementCosts().build(grid))
+        neighbors: Nachbar-Tabelle (z.B. GridManager.neighbor_table; sonst neu gebaut)
+        min_step_cost: Untere Schranke der Schrittkosten für die Heuristik
+            (Standard: aus dem Kosten-Feld, 0 = Dijkstra)
+
+    Returns:
+        PathResult oder None wenn das Ziel nicht erreichbar ist
+    """
+    width = grid.width
+    if costs is None:
+        costs = MovementCosts().build(grid)
+    if min_step_cost is None:
+        min_step_cost = min_passable_cost(costs)
+    if neighbors is None:
+        neighbors = build_neighbor_table(width, grid.height)
+    if costs[start] == IMPASSABLE or costs[goal] == IMPASSABLE:
+        return None
+
+    goal_q, goal_r = _cube(goal, width)
+
+    def heuristic(index: int) -> int:
+        q, r = _cube(index, width)
+        dq = q - goal_q
+        dr = r - goal_r
+        return min_step_cost * max(abs(dq), abs(dr), abs(dq + dr))
+
+    # Heap-Einträge (f, -g, index): bei gleichem f wird der Knoten näher am Ziel zuerst expandiert
+    best = {start: 0}
+    came_from = {start: -1}
+    heap = [(heuristic(start), 0, start)]
+    explored = 0
+    push = heapq.heappush
+    pop = heapq.heappop
+    while heap:
+        _, cost, index = pop(heap)
+        cost = -cost
+        if cost > best[index]:
+            continue
+        explored += 1
+        if index == goal:
+            path = []
+            while index != -1:
+                path.append(index)
+                index = came_from[index]
+            path.reverse()
+            return PathResult(path, cost, explored)
+
+        base = index * NEIGHBOR_COUNT
+        for neighbor in neighbors[base:base + NEIGHBOR_COUNT]:
+            if neighbor < 0:
+                continue
+            step = costs[neighbor]
+            if step < 0:
+                continue
+            new_cost = cost + step
+            known = best.get(neighbor)
+            if known is None or new_cost < known:
+                best[neighbor] = new_cost
+                came_from[neighbor] = index
+                push(heap, (new_cost + heuristic(neighbor), -new_cost, neighbor))
+    return None
+
+
+def distance_field(grid: Grid, sources: Iterable[int], costs: Optional[array] = None,
+                   neighbors: Optional[array] = None, max_cost: Optional[int] = None,
+                   progress: Optional[Callable[[float], None]] = None) -> array:
+    """
+    Kosten-Feld von mehreren Quellen aus (Multi-Source Dijkstra)
+
+    Args:
+        grid: Grid
+        sources: Start-Indizes (z.B. alle Headquarter)
+        costs: Kosten-Feld (Standard: MovementCosts().build(grid))
+        neighbors: Nachbar-Tabelle (z.B. GridManager.neighbor_table; sonst neu gebaut)
+        max_cost: Suche ab diesen Kosten abbrechen (None = ganzes Grid)
+        progress: Fortschritts-Callback (Anteil abgeschlossener Tiles am Grid);
+            darf eine Exception werfen, um abzubrechen
+
+    Returns:
+        array('i') mit den minimalen Kosten pro Tile (UNREACHABLE = nicht erreichbar)
+    """
+    if costs is None:
+        costs = MovementCosts().build(grid)
+    if neighbors is None:
+        neighbors = build_neighbor_table(grid.width, grid.height)
+
+    limit = max_cost if max_cost is not None else 2 ** 31 - 1
+    distances = array('i', [UNREACHABLE]) * (grid.width * grid.height)
+    heap = []
+    for source in sources:
+        if costs[source] != IMPASSABLE and distances[source] != 0:
+            distances[source] = 0
+            heap.append((0, source))
+    heapq.heapify(heap)
+
+    push = heapq.heappush
+    pop = heapq.heappop
+    settled = 0
+    while heap:
+        cost, index = pop(heap)
+        if cost != distances[index]:
+            continue
+        if progress is not None:
+            settled += 1
+            if settled % PROGRESS_INTERVAL == 0:
+                progress(settled / len(distances))
+        base = index * NEIGHBOR_COUNT
+        for neighbor in neighbors[base:base + NEIGHBOR_COUNT]:
+            if neighbor < 0:
+                continue
+            step = costs[neighbor]
+            if step < 0:
+                continue
+            new_cost = cost + step
+            if new_cost > limit:
+                continue
+            known = distances[neighbor]
+            if known < 0 or new_cost < known:
+                distances[neighbor] = new_cost
+                push(heap, (new_cost, neighbor))
+    return distances
@@ -0,0 +1,137 @@
+"""
+Räumliche Abfragen auf Hex-Grids
+Liefert flache Tile-Indizes für Rechtecke, Hexagone, Ringe, Linien und Masken
+"""
+from array import array
+from typing import Iterable, Iterator, List, Tuple
+
+from data.models import TileView
+from utils.hex_math import HexMath
+
+
+# Flache Index-Arrays (y * width + x), zeilenweise sortiert
+INDEX_TYPECODE = 'I'
+
+# Übersetzungstabelle Byte -> 1 wenn ungleich 0
+_NONZERO_TABLE = bytes([0]) + bytes([1]) * 255
+
+
+def spans_to_indices(width: int, height: int, spans: Iterable[Tuple[int, int, int]]) -> array:
+    """
+    Wandelt Zeilen-Spannen in ein Index-Array um
+
+    Jede Spanne wird einmal auf das Grid beschnitten; die Indizes einer
+    Spanne werden als range am Stück angehängt.
+
+    Args:
+        width: Grid-Breite
+        height: Grid-Höhe
+        spans: (y, x_start, x_end) inklusive
+
+    Returns:
+        array('I') der Indizes in Reihenfolge der Spannen
+    """
+    indices = array(INDEX_TYPECODE)
+    last_x = width - 1
+    for y, x_start, x_end in spans:
+        if 0 <= y < height:
+            x_start = max(0, x_start)
+            x_end = min(last_x, x_end)
+            if x_start <= x_end:
+                row_start = y * width
+                indices.extend(range(row_start + x_start, row_start + x_end + 1))
+    return indices
+
+
+def rect_indices(width: int, height: int, x0: int, y0: int, x1: int, y1: int) -> array:
+    """Alle Tiles im Rechteck (x0, y0)..(x1, y1) inklusive"""
+    if x0 > x1:
+        x0, x1 = x1, x0
+    if y0 > y1:
+        y0, y1 = y1, y0
+    return spans_to_indices(width, height, ((y, x0, x1) for y in range(max(0, y0), min(height - 1, y1) + 1)))
+
+
+def hexagon_spans(center_x: int, center_y: int, radius: int) -> List[Tuple[int, int, int]]:
+    """Zeilen-Spannen des gefüllten Hexagons (Abstand <= radius) um das Zentrum"""
+    return [
+        (center_y + dy, center_x + dx_min, center_x + dx_max)
+        for dy, dx_min, dx_max in HexMath.get_radius_rows(radius, center_x & 1)
+    ]
+
+
+def hexagon_indices(width: int, height: int, center_x: int, center_y: int, radius: int) -> array:
+    """Alle Tiles mit Hex-Abstand <= radius zum Zentrum"""
+    if radius < 0:
+        return array(INDEX_TYPECODE)
+    return spans_to_indices(width, height, hexagon_spans(center_x, center_y, radius))
+
+
+def ring_indices(width: int, height: int, center_x: int, center_y: int, radius: int) -> array:
+    """
+    Alle Tiles mit Hex-Abstand genau radius zum Zentrum
+
+    Der Ring ergibt sich zeilenweise als Differenz der Hexagone mit
+    radius und radius - 1.
+    """
+    if radius <= 0:
+        return hexagon_indices(width, height, center_x, center_y, 0 if radius == 0 else -1)
+    inner = {y: (x_start, x_end) for y, x_start, x_end in hexagon_spans(center_x, center_y, radius - 1)}
+    spans = []
+    for y, x_start, x_end in hexagon_spans(center_x, center_y, radius):
+        hole = inner.get(y)
+        if hole is None:
+            spans.append((y, x_start, x_end))
+        else:
+            spans.append((y, x_start, hole[0] - 1))
+            spans.append((y, hole[1] + 1, x_end))
+    return spans_to_indices(width, height, spans)
+
+
+def line_indices(width: int, height: int, x0: int, y0: int, x1: int, y1: int) -> array:
+    """Tiles der Hex-Linie von (x0, y0) nach (x1, y1) in Laufrichtung (außerhalb liegende entfallen)"""
+    return array(INDEX_TYPECODE, (
+        y * width + x for x, y in HexMath.hex_line(x0, y0, x1, y1)
+        if 0 <= x < width and 0 <= y < height
+    ))
+
+
+def mask_indices(mask) -> array:
+    """
+    Indizes aller Einträge ungleich 0 einer Byte-Maske
+
+    Args:
+        mask: bytes/bytearray/array('B') mit einem Eintrag pro Tile
+    """
+    data = bytes(mask).translate(_NONZERO_TABLE)
+    indices = array(INDEX_TYPECODE)
+    position = data.find(1)
+    while position >= 0:
+        end = data.find(0, position)
+        if end < 0:
+            end = len(data)
+        indices.extend(range(position, end))
+        position = data.find(1, end)
+    return indices
+
+
+def value_indices(column, values: Iterable[int]) -> array:
+    """
+    Indizes aller Tiles, deren Code in der Spalte einer der values ist
+
+    Byte-Spalten werden per bytes.translate als Ganzes geprüft, breitere
+    Spalten (z.B. production als 'i') Wert für Wert. Die Elementgröße kommt
+    aus dem memoryview, da Spalten einer Binärkarte selbst memoryviews sind.
+    """
+    wanted = set(values)
+    view = memoryview(column)
+    if view.itemsize != 1:
+        return array('I', (index for index, value in enumerate(view) if value in wanted))
+    table = bytes(1 if code in wanted else 0 for code in range(256))
+    return mask_indices(view.tobytes().translate(table))
+
+
+def iter_tiles(grid, indices: Iterable[int]) -> Iterator[TileView]:
+    """Erzeugt TileViews für die Indizes (ohne die Tile-Liste zu kopieren)"""
+    for index in indices:
+        yield TileView(grid, index)
@@ -0,0 +1,188 @@
+"""
+Prozeduraler Terrain-Generator
+Erzeugt Höhen- und Feuchtigkeitsfelder aus Noise und schreibt Terrain und is_land in einem Schritt ins Grid
+"""
+import random
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from data.models import Grid, DEFAULT_AREAS
+from data.neighbor_table import build_neighbor_table, NEIGHBOR_COUNT, NO_NEIGHBOR
+from utils.noise import fractal_noise, percentile
+
+
+# Areas, in die klassifiziert wird (fehlende werden im Grid registriert)
+GENERATED_AREA_IDS = ("water", "plain", "desert", "mountains", "city")
+
+
+@dataclass
+class TerrainSettings:
+    """Parameter der Terrain-Generierung"""
+    seed: int = 0
+    feature_size: int = 128  # Größe der Kontinente (Zellgröße der gröbsten Noise-Oktave)
+    octaves: int = 5
+    persistence: float = 0.5
+    land_ratio: float = 0.45  # Anteil Land an allen Tiles
+    mountain_ratio: float = 0.15  # Anteil Gebirge am Land (die höchsten Tiles)
+    desert_ratio: float = 0.25  # Anteil Wüste am Flachland (die trockensten Tiles)
+    city_density: float = 0.0005  # Städte pro Land-Tile
+
+
+def _threshold_table(threshold: int, below: int, above: int) -> bytes:
+    """Übersetzungstabelle Wert -> below für Werte < threshold, sonst above"""
+    return bytes([below]) * threshold + bytes([above]) * (256 - threshold)
+
+
+@dataclass
+class TerrainThresholds:
+    """Schwellwerte (0-256) der Klassifizierung, aus den Verteilungen der Noise-Felder"""
+    sea_level: int  # Höhe darunter = Wasser
+    mountain_level: int  # Höhe ab hier = Gebirge
+    dry_level: int  # Feuchtigkeit darunter = Wüste (auf Flachland)
+
+
+def terrain_codes(grid: Grid) -> Dict[str, int]:
+    """Area-Codes der generierten Areas (fehlende Areas werden im Grid registriert)"""
+    defaults = {area.id: area for area in DEFAULT_AREAS}
+    codes = {}
+    for area_id in GENERATED_AREA_IDS:
+        area = grid.area_registry.get(area_id) or defaults[area_id]
+        codes[area_id] = grid.area_code(area)
+    return codes
+
+
+def noise_fields(width: int, height: int, settings: TerrainSettings,
+                 rows: Optional[range] = None) -> Tuple[bytes, bytes]:
+    """
+    Höhen- und Feuchtigkeitsfeld
+
+    Args:
+        width: Grid-Breite
+        height: Grid-Höhe
+        settings: Generierungs-Parameter
+        rows: Nur diese Zeilen berechnen (None = alle)
+
+    Returns:
+        (elevation, moisture) als bytes, Werte 0-255
+    """
+    elevation = fractal_noise(width, height, settings.seed * 2, settings.feature_size,
+                              settings.octaves, settings.persistence, rows)
+    moisture = fractal_noise(width, height, settings.seed * 2 + 1, settings.feature_size,
+                             settings.octaves, settings.persistence, rows)
+    return elevation, moisture
+
+
+def terrain_thresholds(elevation: bytes, moisture: bytes, settings: TerrainSettings) -> TerrainThresholds:
+    """Schwellwerte für die gewünschten Anteile von Land, Gebirge und Wüste"""
+    return TerrainThresholds(
+        sea_level=percentile(elevation, 1.0 - settings.land_ratio),
+        mountain_level=percentile(elevation, 1.0 - settings.land_ratio * settings.mountain_ratio),
+        dry_level=percentile(moisture, settings.desert_ratio),
+    )
+
+
+def classify_terrain(elevation: bytes, moisture: bytes, codes: Dict[str, int],
+                     thresholds: TerrainThresholds) -> Tuple[bytearray, bytes]:
+    """
+    Klassifiziert (Teil-)Felder in Area-Codes und is_land
+
+    Args:
+        elevation: Höhenfeld
+        moisture: Feuchtigkeitsfeld (gleiche Länge)
+        codes: Area-Codes (siehe terrain_codes)
+        thresholds: Schwellwerte (siehe terrain_thresholds)
+
+    Returns:
+        (area_codes, land) mit einem Byte pro Tile
+    """
+    water, plain, desert = codes["water"], codes["plain"], codes["desert"]
+    sea_level, mountain_level = thresholds.sea_level, thresholds.mountain_level
+
+    # Höhe -> Wasser / Flachland / Gebirge
+    table = bytearray(_threshold_table(sea_level, water, plain))
+    table[mountain_level:] = bytes([codes["mountains"]]) * (256 - mountain_level)
+    area = elevation.translate(bytes(table))
+    land = elevation.translate(_threshold_table(sea_level, 0, 1))
+
+    # Trockenes Flachland wird Wüste: Maske (0/1) * (plain ^ desert) per XOR über das ganze Feld
+    lowland = int.from_bytes(area.translate(bytes(1 if code == plain else 0 for code in range(256))), "little")
+    dry = int.from_bytes(moisture.translate(_threshold_table(thresholds.dry_level, 1, 0)), "little")
+    area = bytearray((int.from_bytes(area, "little") ^ ((lowland & dry) * (plain ^ desert)))
+                     .to_bytes(len(area), "little"))
+    return area, land
+
+
+def generate_terrain(grid: Grid, settings: Optional[TerrainSettings] = None,
+                     neighbors: Optional[array] = None) -> Dict[str, int]:
+    """
+    Erzeugt Terrain für das ganze Grid
+
+    Höhe und Feuchtigkeit sind zwei fraktale Noise-Felder. Die Schwellwerte
+    für Wasser, Gebirge und Wüste werden aus den Verteilungen der Felder
+    bestimmt, damit die Anteile unabhängig vom Seed stimmen. Klassifiziert
+    wird per bytes.translate über das ganze Feld; Städte werden als kleine
+    Gruppen (Tile und Nachbarn) auf Flachland gesetzt. area_codes und land
+    werden am Ende je in einer Slice-Zuweisung geschrieben, Fraktionen,
+    Rollen und Produktion bleiben unverändert.
+
+    Args:
+        grid: Ziel-Grid
+        settings: Generierungs-Parameter (Standard: TerrainSettings())
+        neighbors: Nachbar-Tabelle (z.B. GridManager.neighbor_table; sonst neu gebaut)
+
+    Returns:
+        Anzahl Tiles pro Area-ID
+    """
+    if settings is None:
+        settings = TerrainSettings()
+    width, height = grid.width, grid.height
+    if width * height == 0:
+        return {}
+    if neighbors is None:
+        neighbors = build_neighbor_table(width, height)
+
+    codes = terrain_codes(grid)
+    elevation, moisture = noise_fields(width, height, settings)
+    thresholds = terrain_thresholds(elevation, moisture, settings)
+    area, land = classify_terrain(elevation, moisture, codes, thresholds)
+    return write_terrain(grid, area, land, codes, settings, neighbors)
+
+
+def write_terrain(grid: Grid, area: bytearray, land: bytes, codes: Dict[str, int],
+                  settings: TerrainSettings, neighbors: array) -> Dict[str, int]:
+    """
+    Setzt die Städte und schreibt area_codes und land je in einer Slice-Zuweisung ins Grid
+
+    Returns:
+        Anzahl Tiles pro Area-ID
+    """
+    _place_cities(area, codes, settings, land.count(1), neighbors)
+
+    grid.area_codes[:] = array('B', area)
+    grid.land[:] = array('B', land)
+
+    return {area_id: area.count(code) for area_id, code in codes.items()}
+
+
+def _place_cities(area: bytearray, codes: Dict[str, int], settings: TerrainSettings,
+                  land_count: int, neighbors: array):
+    """Setzt Städte (Tile und angrenzendes Flachland/Wüste) auf zufällige Flachland-Tiles"""
+    city_count = int(land_count * settings.city_density)
+    if city_count == 0:
+        return
+    rng = random.Random(settings.seed)
+    plain, desert, city = codes["plain"], codes["desert"], codes["city"]
+    placed = 0
+    for _ in range(city_count * 20):
+        index = rng.randrange(len(area))
+        if area[index] != plain:
+            continue
+        area[index] = city
+        base = index * NEIGHBOR_COUNT
+        for neighbor in neighbors[base:base + NEIGHBOR_COUNT]:
+            if neighbor != NO_NEIGHBOR and area[neighbor] in (plain, desert) and rng.random() < 0.5:
+                area[neighbor] = city
+        placed += 1
+        if placed >= city_count:
+            break
@@ -0,0 +1,671 @@
+"""
+Regelbasierte Prüfung von Hex-Karten
+Prüft Karten-Invarianten vollständig in einem Durchlauf und danach nur noch geänderte Tiles
+"""
+import heapq
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from data.flood_fill import Span, take_region
+from data.grid_manager import GridManager
+from data.models import (
+    Grid, FactionType, StrategicRoleType, FACTIONS, FACTION_CODES, STRATEGIC_ROLE_CODES, NO_AREA
+)
+from data.neighbor_table import NEIGHBOR_COUNT, NO_NEIGHBOR
+from data.spatial_query import mask_indices
+from utils.profiling import timed
+
+
+RULE_LAND = "land_mismatch"
+RULE_PRODUCTION = "production_without_producer"
+RULE_HEADQUARTER = "faction_without_headquarter"
+RULE_TERRITORY = "disconnected_territory"
+
+RULES = (RULE_LAND, RULE_PRODUCTION, RULE_HEADQUARTER, RULE_TERRITORY)
+
+# Rollen, für die ein Produktionswert gesetzt sein darf
+PRODUCING_ROLES = (StrategicRoleType.FIREPOWER, StrategicRoleType.MOBILITY, StrategicRoleType.INTEL)
+
+# Areas ohne Land (alle anderen bekannten Areas sind Land)
+WATER_AREA_IDS = ("water",)
+
+# Spalten, deren Änderung die jeweilige Regel betrifft
+RULE_COLUMNS = {
+    RULE_LAND: ("area_codes", "land"),
+    RULE_PRODUCTION: ("role_codes", "production"),
+    RULE_HEADQUARTER: ("faction_codes", "role_codes"),
+    RULE_TERRITORY: ("faction_codes", "role_codes"),
+}
+
+# Eintrag in der Teilgebiets-Zuordnung für neutrale Tiles
+NO_COMPONENT = -1
+
+# Nachbar-Richtungen (siehe data.neighbor_table) im Uhrzeigersinn: N, NO, SO, S, SW, NW;
+# im Ring aufeinander folgende Nachbarn sind auch untereinander benachbart
+RING_DIRECTIONS = (0, 4, 5, 1, 3, 2)
+
+# Übersetzungstabelle Byte -> 1 wenn ungleich 0
+_NONZERO_TABLE = bytes([0]) + bytes([1]) * 255
+
+
+@dataclass
+class ValidationIssue:
+    """Ein gefundenes Problem einer Regel"""
+    rule: str
+    message: str
+    count: int = 0  # Anzahl betroffener Tiles (0 = betrifft die ganze Karte)
+    first_index: Optional[int] = None  # Erstes betroffenes Tile (zum Anspringen)
+
+    def __str__(self) -> str:
+        return self.message
+
+
+@dataclass
+class TerritoryComponent:
+    """Zusammenhängendes Teilgebiet einer Fraktion"""
+    faction: int
+    spans: List[Span]
+    size: int
+    headquarters: int  # Anzahl Headquarter-Tiles
+    first_index: int  # Kleinster Tile-Index
+
+    def heap_key(self, component_id: int) -> Tuple[bool, int, int]:
+        """Heap-Schlüssel für die Wahl des Hauptgebiets: mit Headquarter, dann das größte, dann das älteste"""
+        return not self.headquarters, -self.size, component_id
+
+
+def _code_table(codes: Iterable[int]) -> bytes:
+    """Übersetzungstabelle Code -> 1 für die angegebenen Codes, sonst 0"""
+    wanted = set(codes)
+    return bytes(1 if code in wanted else 0 for code in range(256))
+
+
+def _and(mask_a: bytes, mask_b: bytes) -> bytes:
+    """Byteweises UND zweier gleich langer 0/1-Masken (über Python-Ganzzahlen, ohne Schleife)"""
+    value = int.from_bytes(mask_a, "little") & int.from_bytes(mask_b, "little")
+    return value.to_bytes(len(mask_a), "little")
+
+
+def _or(mask_a: bytes, mask_b: bytes) -> bytes:
+    """Byteweises ODER zweier gleich langer 0/1-Masken"""
+    value = int.from_bytes(mask_a, "little") | int.from_bytes(mask_b, "little")
+    return value.to_bytes(len(mask_a), "little")
+
+
+def _xor(mask_a: bytes, mask_b: bytes) -> bytes:
+    """Byteweises XOR zweier gleich langer 0/1-Masken"""
+    value = int.from_bytes(mask_a, "little") ^ int.from_bytes(mask_b, "little")
+    return value.to_bytes(len(mask_a), "little")
+
+
+def _nonzero_mask(column) -> bytes:
+    """0/1-Maske der Einträge ungleich 0 einer Spalte beliebiger Elementgröße"""
+    view = memoryview(column)
+    data = view.cast('B').tobytes().translate(_NONZERO_TABLE)
+    item_size = view.itemsize
+    view.release()
+    mask = data[0::item_size]
+    for offset in range(1, item_size):
+        mask = _or(mask, data[offset::item_size])
+    return mask
+
+
+class MapValidator:
+    """
+    Prüft die Invarianten der Karte eines GridManagers
+
+    validate() prüft alle Regeln über die ganzen Spalten (bytes.translate
+    und bitweise Verknüpfung der Masken statt Tile-Schleifen) und zerlegt
+    das Gebiet jeder Fraktion in zusammenhängende Teilgebiete. recheck()
+    arbeitet danach nur auf den geänderten Tiles: Masken, Zähler und erste
+    Indizes der Tile-Regeln werden pro Tile nachgeführt. Teilgebiete werden
+    Tile für Tile angepasst: ein neues Tile wird angehängt bzw. verbindet
+    seine Nachbar-Teilgebiete (die kleineren werden ins größte umbenannt),
+    ein entferntes Tile kann sein Teilgebiet nur teilen, wenn dessen übrige
+    Nachbarn im Ring nicht zusammenhängen; nur dann wird dieses eine
+    Teilgebiet neu gefüllt.
+    """
+
+    def __init__(self, grid_manager):
+        """
+        Args:
+            grid_manager: GridManager mit der zu prüfenden Karte
+        """
+        self.grid_manager = grid_manager
+        self.grid: Optional[Grid] = None
+
+        # Tile-Regeln: 1 = Tile verletzt die Regel, dazu Anzahl und erstes Tile
+        self.land_mask = bytearray()
+        self.production_mask = bytearray()
+        self.land_count = 0
+        self.production_count = 0
+        self.land_first = -1
+        self.production_first = -1
+
+        # Stand von Fraktion und Headquarter je Tile bei der letzten Prüfung
+        # (recheck() vergleicht geänderte Tiles damit)
+        self.checked_factions = bytearray()
+        self.headquarter_mask = bytearray()
+
+        # Teilgebiete der Fraktionen: Tile -> Teilgebiet-ID, ID -> Teilgebiet,
+        # Hauptgebiet je Fraktion und 1 für Tiles außerhalb des Hauptgebiets
+        self.component_ids = array('i')
+        self.components: Dict[int, TerritoryComponent] = {}
+        self.faction_components: Dict[int, Set[int]] = {}
+        self.main_components: Dict[int, int] = {}
+        # Kandidaten für das Hauptgebiet und für das erste abgetrennte Tile je
+        # Fraktion; veraltete Einträge bleiben liegen, bis sie oben ankommen
+        self.main_candidates: Dict[int, List[Tuple[bool, int, int]]] = {}
+        self.first_candidates: Dict[int, List[Tuple[int, int]]] = {}
+        self.faction_sizes: Dict[int, int] = {}
+        self.headquarter_counts: Dict[int, int] = {}
+        self.detached_first: Dict[int, int] = {}
+        self.detached_mask = bytearray()
+        self.next_component_id = 0
+
+        # 1 für Tiles mit mindestens einem Problem (wird mit den Masken nachgeführt)
+        self.flagged = bytearray()
+        # Arbeits-Maske für das Neu-Füllen geteilter Teilgebiete (bleibt zwischen Aufrufen 0)
+        self._scratch = bytearray()
+        self._build_tables()
+
+    def _build_tables(self):
+        """Übersetzungstabellen für die aktuellen Area-Definitionen"""
+        grid = self.grid_manager.grid
+        water = [code for code, area in enumerate(grid.area_definitions) if area.id in WATER_AREA_IDS]
+        known = range(len(grid.area_definitions))
+        # Soll-Wert von is_land je Area-Code und ob der Code überhaupt geprüft wird
+        self.expected_land_table = _code_table(code for code in known if code not in water)
+        self.known_area_table = _code_table(code for code in known if code != NO_AREA)
+        self.non_producer_table = _code_table(
+            code for role, code in STRATEGIC_ROLE_CODES.items() if role not in PRODUCING_ROLES)
+        self.headquarter_code = STRATEGIC_ROLE_CODES[StrategicRoleType.HEADQUARTER]
+        self.neutral_code = FACTION_CODES[FactionType.NEUTRAL]
+        self.area_count = len(grid.area_definitions)
+
+    @property
+    def is_current(self) -> bool:
+        """True wenn die Ergebnisse zum aktuellen Grid gehören"""
+        grid = self.grid_manager.grid
+        return (grid is self.grid and len(self.land_mask) == grid.width * grid.height
+                and self.area_count == len(grid.area_definitions))
+
+    @timed("validate")
+    def validate(self) -> List[ValidationIssue]:
+        """
+        Prüft alle Regeln über die ganze Karte
+
+        Returns:
+            Liste der gefundenen Probleme
+        """
+        grid = self.grid_manager.grid
+        self.grid = grid
+        self._build_tables()
+
+        area = memoryview(grid.area_codes).tobytes()
+        expected_land = area.translate(self.expected_land_table)
+        known = area.translate(self.known_area_table)
+        land = _nonzero_mask(grid.land)
+        self.land_mask = bytearray(_and(_xor(expected_land, land), known))
+        self.land_count = self.land_mask.count(1)
+        self.land_first = self.land_mask.find(1)
+
+        roles = memoryview(grid.role_codes).tobytes()
+        self.production_mask = bytearray(_and(roles.translate(self.non_producer_table),
+                                              _nonzero_mask(grid.production)))
+        self.production_count = self.production_mask.count(1)
+        self.production_first = self.production_mask.find(1)
+
+        self.checked_factions = bytearray(memoryview(grid.faction_codes).tobytes())
+        self.headquarter_mask = bytearray(roles.translate(_code_table([self.headquarter_code])))
+        self._scratch = bytearray(len(self.land_mask))
+
+        self.flagged = bytearray()
+        self._label_territories()
+        self.flagged = bytearray(_or(_or(self.land_mask, self.production_mask), self.detached_mask))
+        return self.issues()
+
+    @timed("validate.recheck")
+    def recheck(self, indices: Iterable[int], columns: Optional[Iterable[str]] = None) -> List[ValidationIssue]:
+        """
+        Prüft nach einer Änderung nur die betroffenen Tiles neu
+
+        Args:
+            indices: Geänderte Tiles (flache Indizes)
+            columns: Geänderte Spalten (None = alle)
+
+        Returns:
+            Liste aller aktuellen Probleme (leer solange validate() noch nicht lief)
+        """
+        if self.grid is None:
+            return []
+        if not self.is_current:
+            return self.validate()
+
+        if columns is None:
+            columns = {name for names in RULE_COLUMNS.values() for name in names}
+        else:
+            columns = set(columns)
+        indices = sorted(set(indices))
+        if not indices:
+            return self.issues()
+
+        grid = self.grid
+        flagged, detached = self.flagged, self.detached_mask
+        if columns.intersection(RULE_COLUMNS[RULE_LAND]):
+            area_codes, land, mask = grid.area_codes, grid.land, self.land_mask
+            expected, known = self.expected_land_table, self.known_area_table
+            for index in indices:
+                code = area_codes[index]
+                value = 1 if known[code] and expected[code] != (1 if land[index] else 0) else 0
+                if mask[index] != value:
+                    mask[index] = value
+                    self.land_count += 1 if value else -1
+                    self.land_first = self._next_first(mask, self.land_first, index, value)
+                    flagged[index] = value | self.production_mask[index] | detached[index]
+
+        if columns.intersection(RULE_COLUMNS[RULE_PRODUCTION]):
+            role_codes, production, mask = grid.role_codes, grid.production, self.production_mask
+            non_producer = self.non_producer_table
+            for index in indices:
+                value = 1 if non_producer[role_codes[index]] and production[index] else 0
+                if mask[index] != value:
+                    mask[index] = value
+                    self.production_count += 1 if value else -1
+                    self.production_first = self._next_first(mask, self.production_first, index, value)
+                    flagged[index] = self.land_mask[index] | value | detached[index]
+
+        if columns.intersection(RULE_COLUMNS[RULE_TERRITORY]):
+            self._update_territories(indices)
+
+        return self.issues()
+
+    @staticmethod
+    def _next_first(mask: bytearray, first: int, index: int, value: int) -> int:
+        """Erstes gesetztes Tile einer Maske, nachdem mask[index] auf value gesetzt wurde"""
+        if value:
+            return index if first < 0 or index < first else first
+        if index == first:
+            return mask.find(1, first)
+        return first
+
+    def recheck_entry(self, entry) -> List[ValidationIssue]:
+        """Prüft die Tiles eines Undo-Schritts (HistoryEntry) neu"""
+        indices: Set[int] = set()
+        columns = set()
+        for change in entry.changes:
+            columns.add(change.column)
+            for start, length in zip(change.starts, change.lengths):
+                indices.update(range(start, start + length))
+        return self.recheck(indices, columns)
+
+    def _label_territories(self):
+        """Zerlegt das Gebiet aller Fraktionen in Teilgebiete"""
+        grid = self.grid
+        count = grid.width * grid.height
+        self.component_ids = array('i', [NO_COMPONENT]) * count
+        self.components = {}
+        self.faction_components = {}
+        self.main_components = {}
+        self.main_candidates = {}
+        self.first_candidates = {}
+        self.faction_sizes = {}
+        self.headquarter_counts = {}
+        self.detached_first = {}
+        self.detached_mask = bytearray(count)
+
+        factions = bytes(self.checked_factions)
+        for code in range(len(FACTIONS)):
+            if code == self.neutral_code or factions.find(code) < 0:
+                continue
+            remaining = bytearray(factions.translate(_code_table([code])))
+            position = remaining.find(1)
+            while position >= 0:
+                self._add_component(code, remaining, position)
+                position = remaining.find(1, position)
+            self._update_main_component(code)
+
+    def _update_territories(self, indices: List[int]):
+        """
+        Führt die Teilgebiete für geänderte Tiles nach
+
+        Die Tiles werden vom geprüften Stand (checked_factions,
+        headquarter_mask) auf den aktuellen gebracht: zuerst verlassen alle
+        Tiles mit neuer Fraktion ihr Teilgebiet, dann wird jedes Teilgebiet,
+        das sich dabei geteilt haben kann, einmal neu gefüllt, zuletzt werden
+        die Tiles in ihre neue Fraktion aufgenommen.
+        """
+        grid = self.grid
+        faction_codes, role_codes = grid.faction_codes, grid.role_codes
+        checked, headquarters = self.checked_factions, self.headquarter_mask
+        neutral, headquarter_code = self.neutral_code, self.headquarter_code
+        affected = set()
+        splitting: Set[int] = set()
+        added = []
+        for index in indices:
+            old_faction, new_faction = checked[index], faction_codes[index]
+            new_headquarter = 1 if role_codes[index] == headquarter_code else 0
+            if old_faction == new_faction:
+                difference = new_headquarter - headquarters[index]
+                headquarters[index] = new_headquarter
+                if difference and new_faction != neutral:
+                    component_id = self.component_ids[index]
+                    self.components[component_id].headquarters += difference
+                    self.headquarter_counts[new_faction] += difference
+                    self._push_main_candidate(component_id)
+                    affected.add(new_faction)
+                continue
+
+            if old_faction != neutral:
+                self._remove_tile(index, splitting)
+                affected.add(old_faction)
+            checked[index] = new_faction
+            headquarters[index] = new_headquarter
+            if new_faction != neutral:
+                added.append(index)
+                affected.add(new_faction)
+
+        for component_id in splitting:
+            if component_id in self.components:
+                self._split_component(component_id)
+        for index in added:
+            self._add_tile(index, checked[index])
+
+        for code in affected:
+            self._update_main_component(code)
+
+    def _ring_neighbors(self, index: int) -> List[int]:
+        """Nachbarn eines Tiles im Uhrzeigersinn (NO_NEIGHBOR außerhalb des Grids)"""
+        table = self.grid_manager.neighbor_table
+        base = index * NEIGHBOR_COUNT
+        return [table[base + direction] for direction in RING_DIRECTIONS]
+
+    def _add_tile(self, index: int, code: int):
+        """Nimmt ein Tile der Fraktion code auf: anhängen, Nachbar-Teilgebiete verbinden oder neu anlegen"""
+        component_ids, components = self.component_ids, self.components
+        touching = set()
+        for neighbor in self._ring_neighbors(index):
+            if neighbor != NO_NEIGHBOR:
+                component_id = component_ids[neighbor]
+                if component_id != NO_COMPONENT and components[component_id].faction == code:
+                    touching.add(component_id)
+
+        width = self.grid.width
+        y, x = divmod(index, width)
+        if not touching:
+            self._scratch[index] = 1
+            self._add_component(code, self._scratch, index)
+            return
+
+        # Die kleineren Teilgebiete werden ins größte umbenannt
+        target_id = max(touching, key=lambda component_id: (components[component_id].size, -component_id))
+        target = components[target_id]
+        detached = 0 if self.main_components.get(code) == target_id else 1
+        for component_id in touching - {target_id}:
+            component = self._drop_component(component_id)
+            for row, x_start, x_end in component.spans:
+                start = row * width + x_start
+                length = x_end - x_start + 1
+                component_ids[start:start + length] = array('i', [target_id]) * length
+                self._set_detached(start, length, detached)
+            target.spans.extend(component.spans)
+            target.size += component.size
+            target.headquarters += component.headquarters
+            target.first_index = min(target.first_index, component.first_index)
+
+        component_ids[index] = target_id
+        self._set_detached(index, 1, detached)
+        target.spans.append((y, x, x))
+        target.size += 1
+        headquarter = self.headquarter_mask[index]
+        target.headquarters += headquarter
+        self.faction_sizes[code] += 1
+        self.headquarter_counts[code] += headquarter
+        if index < target.first_index:
+            target.first_index = index
+        self._push_main_candidate(target_id)
+        self._push_first_candidate(target_id)
+
+    def _remove_tile(self, index: int, splitting: Set[int]):
+        """
+        Entfernt ein Tile aus seinem Teilgebiet
+
+        Args:
+            index: Tile
+            splitting: Teilgebiete, die sich geteilt haben können (werden
+                danach neu gefüllt); wird ergänzt
+        """
+        component_id = self.component_ids[index]
+        component = self.components[component_id]
+        width = self.grid.width
+        y, x = divmod(index, width)
+        for position, (row, x_start, x_end) in enumerate(component.spans):
+            if row == y and x_start <= x <= x_end:
+                component.spans[position:position + 1] = [
+                    span for span in ((row, x_start, x - 1), (row, x + 1, x_end)) if span[1] <= span[2]]
+                break
+        self.component_ids[index] = NO_COMPONENT
+        self._set_detached(index, 1, 0)
+        headquarter = self.headquarter_mask[index]
+        component.size -= 1
+        component.headquarters -= headquarter
+        self.faction_sizes[component.faction] -= 1
+        self.headquarter_counts[component.faction] -= headquarter
+        if component.size == 0:
+            self._drop_component(component_id)
+            return
+        if component_id in splitting:
+            return
+
+        # Geteilt werden kann nur, wenn die verbliebenen Nachbarn im Ring nicht zusammenhängen
+        ring = [neighbor != NO_NEIGHBOR and self.component_ids[neighbor] == component_id
+                for neighbor in self._ring_neighbors(index)]
+        arcs = sum(1 for position in range(len(ring)) if ring[position] and not ring[position - 1])
+        if arcs > 1:
+            splitting.add(component_id)
+            return
+
+        if index == component.first_index:
+            component.first_index = min(row * width + x_start for row, x_start, _ in component.spans)
+            self._push_first_candidate(component_id)
+        self._push_main_candidate(component_id)
+
+    def _split_component(self, component_id: int):
+        """Füllt ein Teilgebiet, das sich geteilt haben kann, neu (nur dessen Tiles)"""
+        width = self.grid.width
+        scratch = self._scratch
+        spans = self.components[component_id].spans
+        for row, x_start, x_end in spans:
+            start = row * width + x_start
+            scratch[start:start + x_end - x_start + 1] = b"\x01" * (x_end - x_start + 1)
+        code = self._remove_component(component_id)
+        for row, x_start, _ in spans:
+            start = row * width + x_start
+            if scratch[start]:
+                self._add_component(code, scratch, start)
+
+    def _add_component(self, code: int, mask: bytearray, position: int):
+        """Löst das Teilgebiet um position aus der Maske und nimmt es auf (zunächst als abgetrennt)"""
+        grid = self.grid
+        width = grid.width
+        y, x = divmod(position, width)
+        spans = take_region(mask, width, grid.height, x, y)
+
+        component_id = self.next_component_id
+        self.next_component_id += 1
+        size = 0
+        headquarters = 0
+        for row, x_start, x_end in spans:
+            start = row * width + x_start
+            length = x_end - x_start + 1
+            self.component_ids[start:start + length] = array('i', [component_id]) * length
+            self._set_detached(start, length, 1)
+            size += length
+            headquarters += self.headquarter_mask.count(1, start, start + length)
+
+        component = TerritoryComponent(code, spans, size, headquarters, spans[0][0] * width + spans[0][1])
+        self.components[component_id] = component
+        self.faction_components.setdefault(code, set()).add(component_id)
+        self._push_main_candidate(component_id)
+        self._push_first_candidate(component_id)
+        self.faction_sizes[code] = self.faction_sizes.get(code, 0) + size
+        self.headquarter_counts[code] = self.headquarter_counts.get(code, 0) + headquarters
+
+    def _remove_component(self, component_id: int) -> int:
+        """Verwirft ein Teilgebiet samt seiner Tiles und gibt dessen Fraktion zurück"""
+        component = self._drop_component(component_id)
+        width = self.grid.width
+        for row, x_start, x_end in component.spans:
+            start = row * width + x_start
+            length = x_end - x_start + 1
+            self.component_ids[start:start + length] = array('i', [NO_COMPONENT]) * length
+            self._set_detached(start, length, 0)
+        self.faction_sizes[component.faction] -= component.size
+        self.headquarter_counts[component.faction] -= component.headquarters
+        return component.faction
+
+    def _drop_component(self, component_id: int) -> TerritoryComponent:
+        """Nimmt ein Teilgebiet aus den Tabellen (die Tiles bleiben unverändert)"""
+        component = self.components.pop(component_id)
+        self.faction_components[component.faction].discard(component_id)
+        if self.main_components.get(component.faction) == component_id:
+            del self.main_components[component.faction]
+        return component
+
+    def _push_main_candidate(self, component_id: int):
+        """Trägt den aktuellen Heap-Schlüssel eines Teilgebiets ein"""
+        component = self.components[component_id]
+        heapq.heappush(self.main_candidates.setdefault(component.faction, []), component.heap_key(component_id))
+
+    def _push_first_candidate(self, component_id: int):
+        """Trägt das aktuelle erste Tile eines Teilgebiets ein"""
+        component = self.components[component_id]
+        heapq.heappush(self.first_candidates.setdefault(component.faction, []),
+                       (component.first_index, component_id))
+
+    def _update_main_component(self, code: int):
+        """Bestimmt Hauptgebiet und erstes abgetrennte Tile einer Fraktion neu"""
+        component_ids = self.faction_components.get(code)
+        if not component_ids:
+            for table in (self.faction_components, self.main_components, self.main_candidates,
+                          self.first_candidates, self.faction_sizes, self.headquarter_counts,
+                          self.detached_first):
+                table.pop(code, None)
+            return
+        components = self.components
+
+        candidates = self.main_candidates[code]
+        if len(candidates) > 2 * len(component_ids) + 64:
+            # Veraltete Einträge überwiegen: Heap aus den bestehenden Teilgebieten neu aufbauen
+            candidates[:] = [components[component_id].heap_key(component_id) for component_id in component_ids]
+            heapq.heapify(candidates)
+        while (candidates[0][2] not in component_ids
+               or components[candidates[0][2]].heap_key(candidates[0][2]) != candidates[0]):
+            heapq.heappop(candidates)
+        main = candidates[0][2]
+
+        previous = self.main_components.get(code)
+        if previous != main:
+            if previous is not None:
+                self._mark_detached(previous, True)
+            self._mark_detached(main, False)
+            self.main_components[code] = main
+
+        firsts = self.first_candidates[code]
+        if len(firsts) > 2 * len(component_ids) + 64:
+            firsts[:] = [(components[component_id].first_index, component_id) for component_id in component_ids]
+            heapq.heapify(firsts)
+        # Kleinster gültiger Eintrag außer dem Hauptgebiet
+        main_entry = None
+        while firsts:
+            first_index, component_id = firsts[0]
+            if component_id not in component_ids or components[component_id].first_index != first_index:
+                heapq.heappop(firsts)
+            elif component_id == main:
+                main_entry = heapq.heappop(firsts)
+            else:
+                break
+        self.detached_first[code] = firsts[0][0] if firsts else -1
+        if main_entry is not None:
+            heapq.heappush(firsts, main_entry)
+
+    def _mark_detached(self, component_id: int, detached: bool):
+        """Setzt die Tiles eines Teilgebiets in der Maske der abgetrennten Tiles"""
+        width = self.grid.width
+        value = 1 if detached else 0
+        for row, x_start, x_end in self.components[component_id].spans:
+            self._set_detached(row * width + x_start, x_end - x_start + 1, value)
+
+    def _set_detached(self, start: int, length: int, value: int):
+        """Setzt eine Spanne der Maske abgetrennter Tiles und führt die Problem-Maske nach"""
+        if length == 1:
+            self.detached_mask[start] = value
+            if self.flagged:
+                self.flagged[start] = value | self.land_mask[start] | self.production_mask[start]
+            return
+        end = start + length
+        self.detached_mask[start:end] = bytes([value]) * length
+        if not self.flagged:
+            # Noch in validate(): die Problem-Maske wird danach als Ganzes berechnet
+            return
+        if value:
+            self.flagged[start:end] = self.detached_mask[start:end]
+        else:
+            self.flagged[start:end] = _or(self.land_mask[start:end], self.production_mask[start:end])
+
+    def flagged_mask(self) -> bytearray:
+        """
+        0/1-Maske aller Tiles mit mindestens einem Problem (für die Anzeige)
+
+        Returns:
+            bytearray mit einem Eintrag pro Tile
+        """
+        if not self.is_current:
+            self.validate()
+        return self.flagged
+
+    def flagged_indices(self) -> array:
+        """Indizes aller Tiles mit mindestens einem Problem"""
+        return mask_indices(self.flagged_mask())
+
+    def issues(self) -> List[ValidationIssue]:
+        """Probleme der letzten Prüfung (aus den nachgeführten Zählern, ohne neu zu prüfen)"""
+        if self.grid is None:
+            return []
+        issues = []
+
+        if self.land_count:
+            issues.append(ValidationIssue(
+                RULE_LAND, f"{self.land_count} tiles have is_land inconsistent with their terrain",
+                self.land_count, self.land_first))
+
+        if self.production_count:
+            issues.append(ValidationIssue(
+                RULE_PRODUCTION, f"{self.production_count} tiles have production on a role that does not produce",
+                self.production_count, self.production_first))
+
+        for code in sorted(self.faction_components):
+            if not self.headquarter_counts[code]:
+                issues.append(ValidationIssue(
+                    RULE_HEADQUARTER, f"faction {FACTIONS[code].value} has no headquarter"))
+
+        for code in sorted(self.faction_components):
+            count = self.faction_sizes[code] - self.components[self.main_components[code]].size
+            if not count:
+                continue
+            issues.append(ValidationIssue(
+                RULE_TERRITORY,
+                f"faction {FACTIONS[code].value} has {count} tiles disconnected from its main territory",
+                count, self.detached_first[code]))
+        return issues
+
+
+def validate_grid(grid: Grid) -> List[ValidationIssue]:
+    """
+    Prüft alle Regeln für ein einzelnes Grid (z.B. aus Skripten)
+
+    Returns:
+        Liste der gefundenen Probleme (leer wenn gültig)
+    """
+    return MapValidator(GridManager(grid)).validate()
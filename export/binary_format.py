@@ -0,0 +1,223 @@
+"""
+Kompaktes Binärformat für Hex-Karten (.hexmap)
+Spaltenweise gepackte Tile-Daten, per mmap ohne Parsen ladbar
+
+Aufbau (little-endian):
+    Header:  Magic "HXMP", Version (u16), reserviert (u16),
+             Breite (u32), Höhe (u32), hex_size (f64)
+    Tabellen: Areas (u16 Anzahl; je id, display_name, color),
+              Factions (u8 Anzahl; je value), Strategic Roles (u8 Anzahl; je value)
+              Strings als u16 Länge + UTF-8
+    Spalten: area, faction, strategic_role, is_land (je 1 Byte pro Tile),
+             production (int32 pro Tile, 4-Byte ausgerichtet)
+"""
+import mmap
+import struct
+import sys
+from array import array
+from typing import List, Optional, Tuple
+
+from data.models import (
+    Area, Grid, FactionType, StrategicRoleType, FACTIONS, FACTION_CODES,
+    STRATEGIC_ROLES, STRATEGIC_ROLE_CODES, DEFAULT_AREAS
+)
+
+
+BINARY_EXTENSION = ".hexmap"
+MAGIC = b"HXMP"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIId")
+_COUNT16 = struct.Struct("<H")
+_COUNT8 = struct.Struct("<B")
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def write_binary_map(grid: Grid, file_path: str, hex_size: float = 15.0):
+    """
+    Schreibt ein Grid im Binärformat
+
+    Args:
+        grid: Zu schreibendes Grid
+        file_path: Ziel-Datei
+        hex_size: Canvas Hex-Größe für die Metadaten
+    """
+    header = bytearray(_HEADER.pack(MAGIC, VERSION, 0, grid.width, grid.height, float(hex_size)))
+
+    header += _COUNT16.pack(len(grid.area_definitions))
+    for area in grid.area_definitions:
+        for text in (area.id, area.display_name, area.color):
+            header += _pack_string(text)
+
+    header += _COUNT8.pack(len(FACTIONS))
+    for faction in FACTIONS:
+        header += _pack_string(faction.value)
+
+    header += _COUNT8.pack(len(STRATEGIC_ROLES))
+    for role in STRATEGIC_ROLES:
+        header += _pack_string(role.value)
+
+    production = grid.production
+    if not _LITTLE_ENDIAN:
+        production = array('i', production)
+        production.byteswap()
+
+    count = grid.width * grid.height
+    with open(file_path, 'wb') as f:
+        f.write(header)
+        for column in (grid.area_codes, grid.faction_codes, grid.role_codes, grid.land):
+            f.write(column)
+        f.write(b"\0" * (_align(len(header) + 4 * count, 4) - len(header) - 4 * count))
+        f.write(production)
+
+
+def read_binary_map(file_path: str) -> Tuple[Grid, dict]:
+    """
+    Öffnet eine Binärkarte per mmap
+
+    Die Spalten des zurückgegebenen Grids sind Sichten auf die gemappte
+    Datei (copy-on-write): es wird nichts geparst oder kopiert, Seiten
+    werden erst beim Zugriff geladen und Änderungen bleiben im Speicher.
+
+    Args:
+        file_path: Quell-Datei
+
+    Returns:
+        (Grid, Metadaten-Dict im Format der JSON-Metadaten)
+
+    Raises:
+        ValueError: Wenn die Datei kein gültiges Binärformat hat
+    """
+    with open(file_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    if len(mapped) < _HEADER.size:
+        raise ValueError("File is too short for a hex map header")
+    magic, version, _, width, height, hex_size = _HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a hex map binary file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported hex map binary version: {version}")
+
+    offset = _HEADER.size
+    (area_count,) = _COUNT16.unpack_from(mapped, offset)
+    offset += _COUNT16.size
+    # Standard-Areas wiederverwenden, damit Area-Identitäten stabil bleiben
+    default_areas = {(area.id, area.display_name, area.color): area for area in DEFAULT_AREAS}
+    areas = []
+    for _ in range(area_count):
+        area_id, offset = _unpack_string(mapped, offset)
+        display_name, offset = _unpack_string(mapped, offset)
+        color, offset = _unpack_string(mapped, offset)
+        key = (area_id, display_name, color)
+        areas.append(default_areas.get(key) or Area(*key))
+
+    faction_values, offset = _unpack_table(mapped, offset)
+    role_values, offset = _unpack_table(mapped, offset)
+
+    count = width * height
+    production_offset = _align(offset + 4 * count, 4)
+    if len(mapped) < production_offset + 4 * count:
+        raise ValueError("Hex map binary file is truncated")
+
+    view = memoryview(mapped)
+    columns = [view[offset + i * count:offset + (i + 1) * count] for i in range(4)]
+    area_codes, faction_codes, role_codes, land = columns
+
+    production_bytes = view[production_offset:production_offset + 4 * count]
+    if _LITTLE_ENDIAN:
+        production = production_bytes.cast('i')
+    else:
+        production = array('i', production_bytes.tobytes())
+        production.byteswap()
+
+    # Enum-Codes nur umschreiben, wenn die Datei andere Tabellen verwendet
+    faction_codes = _remap_codes(faction_codes, faction_values, FactionType,
+                                 FACTION_CODES, FactionType.NEUTRAL)
+    role_codes = _remap_codes(role_codes, role_values, StrategicRoleType,
+                              STRATEGIC_ROLE_CODES, StrategicRoleType.NONE)
+
+    grid = Grid(
+        width=width,
+        height=height,
+        area_definitions=areas,
+        area_codes=area_codes,
+        faction_codes=faction_codes,
+        role_codes=role_codes,
+        land=land,
+        production=production
+    )
+    metadata = {
+        "grid_width": width,
+        "grid_height": height,
+        "canvas_settings": {"hex_size": hex_size}
+    }
+    return grid, metadata
+
+
+def json_to_binary(json_path: str, binary_path: str):
+    """Konvertiert eine JSON-Karte verlustfrei ins Binärformat"""
+    from data.grid_manager import GridManager
+    from export.map_io import MapIO
+
+    map_io = MapIO(GridManager())
+    map_io.read_map(json_path)
+    write_binary_map(map_io.grid_manager.grid, binary_path, map_io.hex_size)
+
+
+def binary_to_json(binary_path: str, json_path: str, indent: Optional[int] = 2):
+    """Konvertiert eine Binärkarte verlustfrei ins JSON-Format"""
+    from data.grid_manager import GridManager
+    from export.map_io import MapIO
+
+    map_io = MapIO(GridManager())
+    map_io.read_map(binary_path)
+    map_io.write_map(json_path, indent=indent)
+
+
+def _align(offset: int, alignment: int) -> int:
+    """Rundet einen Offset auf ein Vielfaches von alignment auf"""
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _pack_string(text: str) -> bytes:
+    """Kodiert einen String als u16 Länge + UTF-8"""
+    encoded = text.encode("utf-8")
+    return _COUNT16.pack(len(encoded)) + encoded
+
+
+def _unpack_string(buffer, offset: int) -> Tuple[str, int]:
+    """Dekodiert einen String ab offset"""
+    (length,) = _COUNT16.unpack_from(buffer, offset)
+    offset += _COUNT16.size
+    return bytes(buffer[offset:offset + length]).decode("utf-8"), offset + length
+
+
+def _unpack_table(buffer, offset: int) -> Tuple[List[str], int]:
+    """Dekodiert eine Enum-Tabelle (u8 Anzahl + Strings)"""
+    (count,) = _COUNT8.unpack_from(buffer, offset)
+    offset += _COUNT8.size
+    values = []
+    for _ in range(count):
+        value, offset = _unpack_string(buffer, offset)
+        values.append(value)
+    return values, offset
+
+
+def _remap_codes(column, file_values: List[str], enum_type, codes: dict, default):
+    """
+    Übersetzt Enum-Codes der Datei in die aktuellen Codes
+
+    Stimmen die Tabellen überein, wird die Spalte unverändert (ohne Kopie)
+    zurückgegeben.
+    """
+    current_values = [member.value for member in enum_type]
+    if file_values == current_values:
+        return column
+
+    values_to_members = {member.value: member for member in enum_type}
+    table = bytearray([codes[default]]) * 256
+    for file_code, value in enumerate(file_values):
+        table[file_code] = codes[values_to_members.get(value, default)]
+    return array('B', bytes(column).translate(bytes(table)))
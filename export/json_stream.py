@@ -0,0 +1,175 @@
+"""
+Streaming JSON für Karten-Dateien
+Schreibt und liest das 'map' Array Tile für Tile mit konstantem Speicherbedarf
+"""
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional, TextIO, Tuple
+
+
+# Standard-Blockgröße beim Lesen (Zeichen)
+READ_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def write_map_json(file: TextIO, header: dict, records: Iterable[dict],
+                   indent: Optional[int] = 2):
+    """
+    Schreibt ein Karten-Dokument {<header>..., "map": [records...]}
+
+    Die Records werden einzeln kodiert und direkt in die Datei geschrieben,
+    es wird also nie das ganze Dokument im Speicher aufgebaut. Mit indent=2
+    ist die Ausgabe identisch zu json.dump(..., indent=2).
+
+    Args:
+        file: Geöffnete Text-Datei
+        header: Top-Level Einträge vor dem 'map' Array (z.B. metadata)
+        records: Iterable/Generator der Tile-Dicts
+        indent: Einrückung oder None für kompakte Ausgabe ohne Whitespace
+    """
+    if indent is None:
+        separators = (",", ":")
+        file.write("{")
+        for key, value in header.items():
+            file.write(json.dumps(key, ensure_ascii=False) + ":")
+            file.write(json.dumps(value, ensure_ascii=False, separators=separators))
+            file.write(",")
+        file.write('"map":[')
+        first = True
+        for record in records:
+            if not first:
+                file.write(",")
+            file.write(json.dumps(record, ensure_ascii=False, separators=separators))
+            first = False
+        file.write("]}")
+        return
+
+    pad = " " * indent
+    record_pad = pad * 2
+    file.write("{")
+    for key, value in header.items():
+        encoded = json.dumps(value, ensure_ascii=False, indent=indent)
+        file.write("\n" + pad + json.dumps(key, ensure_ascii=False) + ": ")
+        file.write(encoded.replace("\n", "\n" + pad) + ",")
+    file.write("\n" + pad + '"map": [')
+    first = True
+    for record in records:
+        encoded = json.dumps(record, ensure_ascii=False, indent=indent)
+        file.write(("\n" if first else ",\n") + record_pad + encoded.replace("\n", "\n" + record_pad))
+        first = False
+    file.write("]" if first else "\n" + pad + "]")
+    file.write("\n}")
+
+
+def iter_map_json(file: TextIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Liest ein Karten-Dokument inkrementell
+
+    Liefert für jeden Top-Level Eintrag außer 'map' ein (key, value) Paar.
+    Für das 'map' Array folgt auf ein ("map", None) Paar je Element ein
+    ("tile", record) Paar, alles in der Reihenfolge der Datei. Es wird
+    immer nur ein Block der Datei und ein einzelnes Element gleichzeitig
+    im Speicher gehalten.
+
+    Args:
+        file: Geöffnete Text-Datei
+        chunk_size: Anzahl Zeichen pro Lesevorgang
+
+    Raises:
+        ValueError: Bei ungültigem JSON oder fehlendem Top-Level Objekt
+    """
+    reader = _StreamReader(file, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.decode_value()
+        if not isinstance(key, str):
+            raise ValueError("Expected a string key in map document")
+        reader.expect(":")
+
+        if key == "map":
+            reader.expect("[")
+            yield "map", None
+            if reader.peek() == "]":
+                reader.advance()
+            else:
+                while True:
+                    yield "tile", reader.decode_value()
+                    if reader.next_char(",]") == "]":
+                        break
+        else:
+            yield key, reader.decode_value()
+
+        if reader.next_char(",}") == "}":
+            return
+
+
+class _StreamReader:
+    """Gepufferter Lese-Cursor über eine Text-Datei für iter_map_json"""
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Liest den nächsten Block; verwirft bereits konsumierte Zeichen"""
+        if self.eof:
+            return False
+        data = self.file.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Nächstes Nicht-Whitespace Zeichen (ohne es zu konsumieren), '' am Dateiende"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def advance(self):
+        """Konsumiert das aktuelle Zeichen"""
+        self.pos += 1
+
+    def expect(self, char: str):
+        """Konsumiert ein erwartetes Zeichen"""
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos} of read buffer")
+        self.advance()
+
+    def next_char(self, allowed: str) -> str:
+        """Konsumiert und liefert eines der erlaubten Zeichen"""
+        char = self.peek()
+        if not char or char not in allowed:
+            raise ValueError(f"Expected one of '{allowed}' in map document")
+        self.advance()
+        return char
+
+    def decode_value(self) -> Any:
+        """Dekodiert den nächsten JSON-Wert, liest bei Bedarf weitere Blöcke nach"""
+        if not self.peek():
+            raise ValueError("Unexpected end of map document")
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"Invalid JSON in map document: {e.msg}") from e
+            # Zahlen am Pufferende könnten abgeschnitten sein
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
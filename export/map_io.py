@@ -0,0 +1,295 @@
+"""
+Lesen und Schreiben von Karten-Dateien ohne GUI-Abhängigkeiten
+Gemeinsame Basis für den MapExporter der GUI und die Kommandozeile
+"""
+import os
+from typing import Callable, Iterable, Iterator, Optional
+from data.grid_manager import GridManager
+from data.models import FACTION_CODES, STRATEGIC_ROLE_CODES
+from export.json_stream import write_map_json, iter_map_json
+from export.binary_format import BINARY_EXTENSION, write_binary_map, read_binary_map
+from utils.profiling import PROFILER
+
+
+# Fortschritts-Callback (Anteil 0.0 - 1.0); darf eine Exception werfen, um abzubrechen
+ProgressCallback = Callable[[float], None]
+
+# Fortschritt wird alle so viele Tiles gemeldet
+PROGRESS_INTERVAL = 1 << 16
+
+
+def _report_records(records: Iterable[dict], total: int, progress: ProgressCallback) -> Iterator[dict]:
+    """Reicht Records durch und meldet alle PROGRESS_INTERVAL Records den Fortschritt"""
+    for count, record in enumerate(records, 1):
+        yield record
+        if count % PROGRESS_INTERVAL == 0:
+            progress(count / total)
+
+
+def temp_map_path(file_path: str, tag: str) -> str:
+    """
+    Name einer temporären Datei neben file_path
+
+    Die Endung bleibt erhalten, da write_map und read_map das Format
+    danach wählen (z.B. "welt.hexmap" -> "welt.part.hexmap").
+
+    Args:
+        file_path: Ziel-Datei
+        tag: Zusatz vor der Endung (z.B. ".part")
+    """
+    root, extension = os.path.splitext(file_path)
+    return f"{root}{tag}{extension}"
+
+
+class MapIO:
+    """Liest und schreibt Hex-Karten als JSON oder Binär-Dateien (.hexmap)"""
+    
+    def __init__(self, grid_manager: GridManager, map_canvas=None):
+        self.grid_manager = grid_manager
+        self.map_canvas = map_canvas
+        # Einrückung der JSON-Ausgabe (None = kompakt, für große Karten)
+        self.json_indent: Optional[int] = 2
+        # Hex-Größe der zuletzt geladenen Karte (ohne Canvas)
+        self.hex_size = 15.0
+    
+    def read_map(self, file_path: str, progress: Optional[ProgressCallback] = None) -> dict:
+        """
+        Lädt eine Karte, das Format wird anhand der Endung gewählt
+        
+        Args:
+            file_path: Quell-Datei (.json oder .hexmap)
+            progress: Fortschritts-Callback (z.B. für einen Hintergrund-Task)
+            
+        Returns:
+            Die Metadaten der Datei
+        """
+        with PROFILER.section("io.read"):
+            if file_path.lower().endswith(BINARY_EXTENSION):
+                metadata = self._read_binary_file(file_path)
+            else:
+                metadata = self._read_json_file(file_path, progress)
+        if progress:
+            progress(1.0)
+        return metadata
+    
+    def write_map(self, file_path: str, indent: Optional[int] = 2,
+                  progress: Optional[ProgressCallback] = None):
+        """
+        Schreibt die Karte, das Format wird anhand der Endung gewählt
+        
+        Args:
+            file_path: Ziel-Datei (.json oder .hexmap)
+            indent: JSON-Einrückung oder None für kompakte Ausgabe
+            progress: Fortschritts-Callback (z.B. für einen Hintergrund-Task)
+        """
+        with PROFILER.section("io.write"):
+            if file_path.lower().endswith(BINARY_EXTENSION):
+                self._write_binary_file(file_path)
+            else:
+                self._write_json_file(file_path, indent=indent, progress=progress)
+        if progress:
+            progress(1.0)
+    
+    def _write_json_file(self, file_path: str, indent: Optional[int] = 2,
+                         hex_size: Optional[float] = None, progress: Optional[ProgressCallback] = None):
+        """
+        Schreibt die Karte als JSON Datei
+        
+        Die Tiles werden einzeln kodiert und gestreamt, der Speicherbedarf
+        bleibt unabhängig von der Grid-Größe konstant.
+        
+        Args:
+            file_path: Ziel-Datei
+            indent: Einrückung oder None für kompakte Ausgabe
+            hex_size: Hex-Größe für die Metadaten (Standard: vom Canvas)
+            progress: Fortschritts-Callback
+        """
+        grid = self.grid_manager.grid
+        
+        canvas_settings = {"hex_size": self._current_hex_size() if hex_size is None else hex_size}
+        
+        header = {
+            "metadata": {
+                "grid_width": grid.width,
+                "grid_height": grid.height,
+                "canvas_settings": canvas_settings
+            }
+        }
+        
+        # Tile-Daten als Generator (keine Liste aller Tiles)
+        map_data = (self._extract_tile_data(tile) for tile in grid.tiles)
+        if progress:
+            map_data = _report_records(map_data, max(1, grid.width * grid.height), progress)
+        
+        # Schreibe JSON Datei
+        with open(file_path, 'w', encoding='utf-8') as f:
+            write_map_json(f, header, map_data, indent=indent)
+    
+    def _write_binary_file(self, file_path: str):
+        """Schreibt die Karte im kompakten Binärformat"""
+        write_binary_map(self.grid_manager.grid, file_path, self._current_hex_size())
+    
+    def _read_binary_file(self, file_path: str) -> dict:
+        """Lädt eine Binärkarte per mmap (ohne Parsen der Tile-Daten)"""
+        grid, metadata = read_binary_map(file_path)
+        self.grid_manager.set_grid(grid)
+        self._apply_metadata(metadata)
+        return metadata
+    
+    def _current_hex_size(self) -> float:
+        """Hex-Größe des Canvas (bzw. der geladenen Karte) für die Metadaten"""
+        if self.map_canvas and hasattr(self.map_canvas, 'hex_size'):
+            return self.map_canvas.hex_size
+        return self.hex_size
+    
+    def _extract_tile_data(self, tile):
+        """Extrahiert die relevanten Daten aus einem Tile"""
+        # Koordinaten extrahieren
+        coords = [0, 0]
+        if hasattr(tile, 'coordinates') and tile.coordinates:
+            coords = [tile.coordinates[0], tile.coordinates[1]]
+        
+        # Area extrahieren
+        area = None
+        if hasattr(tile, 'area') and tile.area and hasattr(tile.area, 'id'):
+            area = tile.area.id
+        
+        # Faction extrahieren
+        faction = "neutral"
+        if hasattr(tile, 'faction'):
+            if hasattr(tile.faction, 'value'):
+                faction = tile.faction.value
+            else:
+                faction = str(tile.faction).lower()
+
+        # Strategic Role extrahieren
+        strategic_role = "none"
+        if hasattr(tile, 'strategic_role'):
+            if hasattr(tile.strategic_role, 'value'):
+                strategic_role = tile.strategic_role.value
+            else:
+                strategic_role = str(tile.strategic_role).lower()
+        
+        # Production extrahieren
+        production = 0
+        if hasattr(tile, 'production'):
+            production = tile.production
+        
+        return {
+            "coords": coords,
+            "area": area,
+            "faction": faction,
+            "strategic_role": strategic_role,
+            "production": production
+        }
+    
+    def _read_json_file(self, file_path: str, progress: Optional[ProgressCallback] = None) -> dict:
+        """
+        Lädt Karten-Daten aus einer JSON Datei
+        
+        Das 'map' Array wird inkrementell gelesen und Tile für Tile
+        angewendet. Nur wenn die Metadaten erst nach dem 'map' Array stehen,
+        müssen die Tile-Daten bis zum Dateiende zwischengespeichert werden.
+        
+        Args:
+            file_path: Quell-Datei
+            progress: Fortschritts-Callback (erst sobald die Grid-Größe bekannt ist)
+            
+        Returns:
+            Die Metadaten der Datei (leer falls keine vorhanden)
+        """
+        has_map = False
+        metadata = {}
+        metadata_seen = False
+        pending_tiles = []
+        
+        tile_count = 0
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for key, value in iter_map_json(f):
+                if key == "tile":
+                    if metadata_seen:
+                        self._update_tile_from_data(value, self.grid_manager.grid)
+                    else:
+                        pending_tiles.append(value)
+                    tile_count += 1
+                    if progress and tile_count % PROGRESS_INTERVAL == 0 and metadata_seen:
+                        grid = self.grid_manager.grid
+                        progress(min(1.0, tile_count / max(1, grid.width * grid.height)))
+                elif key == "metadata":
+                    metadata = value
+                    self._apply_metadata(metadata)
+                    metadata_seen = True
+                elif key == "map":
+                    has_map = True
+        
+        if not has_map:
+            raise ValueError("JSON file must contain a 'map' array")
+        
+        grid = self.grid_manager.grid
+        for tile_data in pending_tiles:
+            self._update_tile_from_data(tile_data, grid)
+        
+        return metadata
+    
+    def _apply_metadata(self, metadata: dict):
+        """Wendet die Metadaten (Grid-Größe, Canvas-Einstellungen) an"""
+        # Grid-Größe anpassen falls nötig
+        if "grid_width" in metadata and "grid_height" in metadata:
+            new_width = metadata["grid_width"]
+            new_height = metadata["grid_height"]
+            
+            # Grid neu erstellen falls Größe sich geändert hat (bzw. noch keines existiert)
+            if not self.grid_manager.has_grid:
+                self.grid_manager.create_new_grid(new_width, new_height)
+            else:
+                current_grid = self.grid_manager.grid
+                if current_grid.width != new_width or current_grid.height != new_height:
+                    self.grid_manager.create_new_grid(new_width, new_height)
+        
+        # Canvas-Einstellungen anwenden
+        canvas_settings = metadata.get("canvas_settings", {})
+        if "hex_size" in canvas_settings:
+            self.hex_size = canvas_settings["hex_size"]
+            if self.map_canvas:
+                self.map_canvas.set_hex_size(canvas_settings["hex_size"])
+    
+    def _update_tile_from_data(self, tile_data: dict, grid):
+        """Aktualisiert ein Tile mit Daten aus der JSON"""
+        if "coords" not in tile_data:
+            return
+        
+        coords = tile_data["coords"]
+        if len(coords) != 2:
+            return
+            
+        x, y = coords[0], coords[1]
+        
+        # Finde das entsprechende Tile im Grid
+        tile_index = y * grid.width + x
+        if 0 <= tile_index < len(grid.area_codes):
+            registry = grid.area_registry
+            
+            # Update Area (O(1) über die Area-Registry); is_land wird nicht
+            # gespeichert und wie beim Malen aus dem Terrain abgeleitet
+            if "area" in tile_data and tile_data["area"]:
+                area_code = registry.code_for_id(tile_data["area"])
+                if area_code is not None:
+                    grid.area_codes[tile_index] = area_code
+                    grid.land[tile_index] = 0 if tile_data["area"] == "water" else 1
+            
+            # Update Faction
+            if "faction" in tile_data:
+                faction = registry.faction(tile_data["faction"])
+                grid.faction_codes[tile_index] = FACTION_CODES[faction]
+
+            # Update Strategic Role
+            if "strategic_role" in tile_data:
+                role = registry.strategic_role(tile_data["strategic_role"])
+                grid.role_codes[tile_index] = STRATEGIC_ROLE_CODES[role]
+            
+            # Update Production
+            if "production" in tile_data:
+                try:
+                    grid.production[tile_index] = int(tile_data["production"])
+                except (ValueError, TypeError, OverflowError):
+                    grid.production[tile_index] = 0
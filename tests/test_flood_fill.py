@@ -0,0 +1,84 @@
+"""
+Vergleichstests für das Scanline-Füllen
+take_region muss dieselben Tiles liefern wie eine Breitensuche über HexMath.get_hex_neighbors
+"""
+import random
+import unittest
+from collections import deque
+from typing import Set
+
+from data.flood_fill import take_region
+from utils.hex_math import HexMath
+
+
+def bfs_region(mask: bytearray, width: int, height: int, x: int, y: int) -> Set[int]:
+    """Referenz: Breitensuche über die gesetzten Masken-Einträge um (x, y)"""
+    start = y * width + x
+    if not mask[start]:
+        return set()
+    region = {start}
+    queue = deque([(x, y)])
+    while queue:
+        tile_x, tile_y = queue.popleft()
+        for next_x, next_y in HexMath.get_hex_neighbors(tile_x, tile_y):
+            if not (0 <= next_x < width and 0 <= next_y < height):
+                continue
+            index = next_y * width + next_x
+            if mask[index] and index not in region:
+                region.add(index)
+                queue.append((next_x, next_y))
+    return region
+
+
+def span_tiles(spans, width: int) -> Set[int]:
+    """Tile-Indizes einer Spannen-Liste"""
+    return {row * width + x for row, x_start, x_end in spans for x in range(x_start, x_end + 1)}
+
+
+class TakeRegionTest(unittest.TestCase):
+    """take_region gegen die Breitensuche auf zufälligen Masken"""
+
+    def test_matches_bfs(self):
+        rng = random.Random(19)
+        for _ in range(300):
+            width, height = rng.randint(1, 24), rng.randint(1, 24)
+            density = rng.choice((0.3, 0.5, 0.7, 0.9))
+            mask = bytearray(1 if rng.random() < density else 0 for _ in range(width * height))
+            x, y = rng.randrange(width), rng.randrange(height)
+
+            expected = bfs_region(mask, width, height, x, y)
+            remaining = bytearray(mask)
+            spans = take_region(remaining, width, height, x, y)
+
+            self.assertEqual(span_tiles(spans, width), expected, (width, height, x, y))
+            self.assertEqual(spans, sorted(spans))
+            self.assertEqual(sum(x_end - x_start + 1 for _, x_start, x_end in spans), len(expected))
+            # Genau die Tiles der Region werden aus der Maske genommen
+            for index in range(width * height):
+                self.assertEqual(remaining[index], 0 if index in expected else mask[index])
+
+    def test_repeated_calls_partition_mask(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            width, height = rng.randint(1, 30), rng.randint(1, 30)
+            mask = bytearray(1 if rng.random() < 0.55 else 0 for _ in range(width * height))
+            reference = bytearray(mask)
+            while True:
+                start = mask.find(1)
+                if start < 0:
+                    break
+                y, x = divmod(start, width)
+                expected = bfs_region(reference, width, height, x, y)
+                self.assertEqual(span_tiles(take_region(mask, width, height, x, y), width), expected)
+                for index in expected:
+                    reference[index] = 0
+
+    def test_unset_or_outside_start(self):
+        mask = bytearray([0, 1, 1, 0])
+        self.assertEqual(take_region(bytearray(mask), 2, 2, 0, 0), [])
+        self.assertEqual(take_region(bytearray(mask), 2, 2, 2, 0), [])
+        self.assertEqual(take_region(bytearray(mask), 2, 2, 0, -1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
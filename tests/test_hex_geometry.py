@@ -0,0 +1,71 @@
+"""
+Vergleichstests für das Viewport-Culling
+HexGeometry.visible_range muss genau die Hexes liefern, deren Eckpunkte den Bildschirm berühren
+"""
+import random
+import unittest
+from typing import Set, Tuple
+
+from utils.hex_geometry import HexGeometry
+from utils.hex_math import HexMath
+
+
+def brute_force_visible(scale: float, offset_x: float, offset_y: float,
+                        screen_width: float, screen_height: float,
+                        grid_width: int, grid_height: int) -> Set[Tuple[int, int]]:
+    """Referenz: jedes Hex einzeln über das Begrenzungsrechteck seiner Eckpunkte prüfen"""
+    visible = set()
+    for y in range(grid_height):
+        for x in range(grid_width):
+            center_x, center_y = HexMath.hex_to_pixel(x, y, scale)
+            vertices = HexMath.get_hex_vertices(center_x + offset_x, center_y + offset_y, scale)
+            xs = [vertex_x for vertex_x, _ in vertices]
+            ys = [vertex_y for _, vertex_y in vertices]
+            if max(xs) > 0 and min(xs) < screen_width and max(ys) > 0 and min(ys) < screen_height:
+                visible.add((x, y))
+    return visible
+
+
+class VisibleRangeTest(unittest.TestCase):
+    """visible_range gegen die Einzelprüfung aller Hexes"""
+
+    def test_matches_per_tile_bounds(self):
+        rng = random.Random(17)
+        geometry = HexGeometry()
+        for _ in range(300):
+            grid_width, grid_height = rng.randint(1, 40), rng.randint(1, 40)
+            scale = rng.uniform(0.5, 60.0)
+            screen_width, screen_height = rng.uniform(1.0, 900.0), rng.uniform(1.0, 700.0)
+            # Kamera auch teilweise oder ganz neben dem Grid
+            world_width = grid_width * scale * 1.8
+            world_height = grid_height * scale * 1.5
+            offset_x = rng.uniform(-world_width - scale, screen_width + scale)
+            offset_y = rng.uniform(-world_height - scale, screen_height + scale)
+            geometry.update(scale, offset_x, offset_y)
+
+            expected = brute_force_visible(scale, offset_x, offset_y, screen_width, screen_height,
+                                           grid_width, grid_height)
+            visible_range = geometry.visible_range(screen_width, screen_height, grid_width, grid_height)
+            case = (grid_width, grid_height, scale, offset_x, offset_y, screen_width, screen_height)
+            if visible_range is None:
+                self.assertEqual(expected, set(), case)
+                continue
+
+            tiles = list(visible_range.tiles())
+            self.assertEqual(set(tiles), expected, case)
+            self.assertEqual(len(tiles), len(expected))
+            self.assertEqual(visible_range.tile_count(), len(expected))
+            for y in range(-1, grid_height + 1):
+                for x in range(-1, grid_width + 1):
+                    self.assertEqual(visible_range.contains(x, y), (x, y) in expected)
+
+    def test_empty_grid_or_scale(self):
+        geometry = HexGeometry()
+        geometry.update(20.0, 0.0, 0.0)
+        self.assertIsNone(geometry.visible_range(800, 600, 0, 10))
+        geometry.update(0.0, 0.0, 0.0)
+        self.assertIsNone(geometry.visible_range(800, 600, 10, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
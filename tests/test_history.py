@@ -0,0 +1,31 @@
+"""
+Tests für die Spalten-Deltas des Undo-Verlaufs
+row_spans muss genau die Tiles von indices() als Zeilen-Spannen liefern
+"""
+import random
+import unittest
+
+from data.history import ColumnChange
+
+
+class RowSpansTest(unittest.TestCase):
+    """ColumnChange.row_spans gegen die einzelnen Indizes"""
+
+    def test_matches_indices(self):
+        rng = random.Random(19)
+        for _ in range(200):
+            width, height = rng.randint(1, 20), rng.randint(1, 20)
+            count = width * height
+            indices = sorted(rng.sample(range(count), rng.randint(1, count)))
+            change = ColumnChange.from_values("area_codes", 'B', indices,
+                                              [0] * len(indices), [1] * len(indices))
+
+            tiles = []
+            for y, x_start, x_end in change.row_spans(width):
+                self.assertTrue(0 <= x_start <= x_end < width)
+                tiles.extend(y * width + x for x in range(x_start, x_end + 1))
+            self.assertEqual(tiles, list(change.indices()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Round-Trip-Tests für das Schreiben über eine temporäre Datei
+Export wie in der GUI und der CLI: erst temp_map_path schreiben, dann per os.replace umbenennen
+"""
+import os
+import random
+import tempfile
+import unittest
+
+from data.grid_manager import GridManager
+from data.models import Grid, FACTIONS, STRATEGIC_ROLE_CODES
+from data.terrain_generator import TerrainSettings, generate_terrain
+from export.binary_format import BINARY_EXTENSION
+from export.map_io import MapIO, temp_map_path
+
+
+COLUMNS = ("area_codes", "faction_codes", "role_codes", "land", "production")
+
+
+def sample_grid() -> Grid:
+    """Generiertes Terrain mit zufälligen Fraktionen, Rollen und Produktion"""
+    grid = Grid(width=23, height=17)
+    generate_terrain(grid, TerrainSettings(seed=3, feature_size=8))
+    rng = random.Random(3)
+    for index in range(grid.width * grid.height):
+        grid.faction_codes[index] = rng.randrange(len(FACTIONS))
+        grid.role_codes[index] = rng.randrange(len(STRATEGIC_ROLE_CODES))
+        grid.production[index] = rng.choice((0, 7, 300))
+    return grid
+
+
+class TempFileRoundTripTest(unittest.TestCase):
+    """Karten überstehen das Schreiben in die temporäre Datei und das Umbenennen"""
+
+    def round_trip(self, file_name: str):
+        grid = sample_grid()
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, file_name)
+            temp_path = temp_map_path(file_path, ".part")
+            self.assertEqual(os.path.splitext(temp_path)[1], os.path.splitext(file_path)[1])
+
+            MapIO(GridManager(grid)).write_map(temp_path, indent=None)
+            os.replace(temp_path, file_path)
+
+            reader = MapIO(GridManager())
+            reader.read_map(file_path)
+            loaded = reader.grid_manager.grid
+            self.assertEqual((loaded.width, loaded.height), (grid.width, grid.height))
+            for name in COLUMNS:
+                self.assertEqual(list(getattr(loaded, name)), list(getattr(grid, name)), name)
+            self.assertFalse(os.path.exists(temp_path))
+
+    def test_binary_map(self):
+        self.round_trip("world" + BINARY_EXTENSION)
+
+    def test_json_map(self):
+        self.round_trip("world.json")
+
+    def test_temp_name_keeps_extension(self):
+        self.assertEqual(temp_map_path("maps/world.hexmap", ".part"), "maps/world.part.hexmap")
+        self.assertEqual(temp_map_path("maps/world.json", ".tmp42"), "maps/world.tmp42.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
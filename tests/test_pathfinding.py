@@ -0,0 +1,137 @@
+"""
+Vergleichstests für Wegsuche und Distanz-Felder
+find_path, distance_field und parallel_distance_field gegen einen einfachen Dijkstra
+"""
+import heapq
+import random
+import unittest
+from array import array
+from typing import Dict, Iterable, Optional
+
+from data.models import Grid
+from data.parallel import parallel_distance_field
+from data.pathfinding import IMPASSABLE, UNREACHABLE, MovementCosts, distance_field, find_path
+from data.terrain_generator import TerrainSettings, generate_terrain
+from utils.hex_math import HexMath
+
+
+def dijkstra(width: int, height: int, costs: array, sources: Iterable[int],
+             max_cost: Optional[int] = None) -> Dict[int, int]:
+    """Referenz: Dijkstra über HexMath.get_hex_neighbors mit Kosten für das Betreten eines Tiles"""
+    best: Dict[int, int] = {}
+    heap = [(0, source) for source in set(sources) if costs[source] != IMPASSABLE]
+    heapq.heapify(heap)
+    while heap:
+        cost, index = heapq.heappop(heap)
+        if index in best:
+            continue
+        best[index] = cost
+        y, x = divmod(index, width)
+        for next_x, next_y in HexMath.get_hex_neighbors(x, y):
+            if not (0 <= next_x < width and 0 <= next_y < height):
+                continue
+            neighbor = next_y * width + next_x
+            step = costs[neighbor]
+            if step == IMPASSABLE or neighbor in best:
+                continue
+            if max_cost is None or cost + step <= max_cost:
+                heapq.heappush(heap, (cost + step, neighbor))
+    return best
+
+
+def random_costs(rng: random.Random, count: int) -> array:
+    """Zufälliges Kosten-Feld mit gesperrten Tiles"""
+    blocked = rng.choice((0.0, 0.15, 0.35))
+    return array('i', [IMPASSABLE if rng.random() < blocked else rng.randint(1, 20)
+                       for _ in range(count)])
+
+
+def as_field(best: Dict[int, int], count: int) -> array:
+    """Referenz-Ergebnis im Format von distance_field"""
+    field = array('i', [UNREACHABLE]) * count
+    for index, cost in best.items():
+        field[index] = cost
+    return field
+
+
+class FindPathTest(unittest.TestCase):
+    """find_path (A*) gegen Dijkstra"""
+
+    def assert_valid_path(self, grid: Grid, costs: array, result, start: int, goal: int):
+        """Weg beginnt am Start, endet am Ziel, geht nur über Nachbarn und summiert die Kosten"""
+        path = result.path
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        for index, next_index in zip(path, path[1:]):
+            y, x = divmod(index, grid.width)
+            next_y, next_x = divmod(next_index, grid.width)
+            self.assertIn((next_x, next_y), HexMath.get_hex_neighbors(x, y))
+            self.assertNotEqual(costs[next_index], IMPASSABLE)
+        self.assertEqual(sum(costs[index] for index in path[1:]), result.cost)
+
+    def test_matches_dijkstra(self):
+        rng = random.Random(20)
+        for _ in range(120):
+            grid = Grid(width=rng.randint(1, 30), height=rng.randint(1, 30))
+            count = grid.width * grid.height
+            costs = random_costs(rng, count)
+            start = rng.randrange(count)
+            reference = dijkstra(grid.width, grid.height, costs, [start])
+            for goal in rng.sample(range(count), min(count, 8)):
+                result = find_path(grid, start, goal, costs)
+                if goal not in reference:
+                    self.assertIsNone(result)
+                    continue
+                self.assertIsNotNone(result)
+                self.assertEqual(result.cost, reference[goal])
+                self.assert_valid_path(grid, costs, result, start, goal)
+
+    def test_generated_terrain(self):
+        grid = Grid(width=60, height=45)
+        generate_terrain(grid, TerrainSettings(seed=5, feature_size=12))
+        costs = MovementCosts().build(grid)
+        rng = random.Random(5)
+        count = grid.width * grid.height
+        for _ in range(20):
+            start, goal = rng.randrange(count), rng.randrange(count)
+            reference = dijkstra(grid.width, grid.height, costs, [start])
+            result = find_path(grid, start, goal)
+            if goal not in reference:
+                self.assertIsNone(result)
+            else:
+                self.assertEqual(result.cost, reference[goal])
+                self.assert_valid_path(grid, costs, result, start, goal)
+
+
+class DistanceFieldTest(unittest.TestCase):
+    """distance_field und parallel_distance_field gegen Dijkstra"""
+
+    def test_distance_field_matches_dijkstra(self):
+        rng = random.Random(21)
+        for _ in range(100):
+            grid = Grid(width=rng.randint(1, 30), height=rng.randint(1, 30))
+            count = grid.width * grid.height
+            costs = random_costs(rng, count)
+            sources = [rng.randrange(count) for _ in range(rng.randint(1, 4))]
+            max_cost = rng.choice((None, 30, 100))
+            expected = as_field(dijkstra(grid.width, grid.height, costs, sources, max_cost), count)
+            self.assertEqual(distance_field(grid, sources, costs, max_cost=max_cost), expected)
+
+    def test_parallel_matches_dijkstra(self):
+        rng = random.Random(22)
+        for _ in range(6):
+            # Hoch genug für mehrere Bänder, damit Wege Chunk-Grenzen kreuzen
+            grid = Grid(width=rng.randint(10, 50), height=rng.randint(40, 90))
+            count = grid.width * grid.height
+            costs = random_costs(rng, count)
+            sources = [rng.randrange(count) for _ in range(rng.randint(1, 3))]
+            max_cost = rng.choice((None, 150))
+            expected = as_field(dijkstra(grid.width, grid.height, costs, sources, max_cost), count)
+            for workers in (1, 2):
+                distances = parallel_distance_field(grid, sources, costs, max_cost=max_cost,
+                                                    workers=workers)
+                self.assertEqual(distances, expected, workers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests für Index-Abfragen auf Binärkarten
+Spalten aus read_binary_map sind memoryviews auf die gemappte Datei, keine arrays
+"""
+import os
+import random
+import tempfile
+import unittest
+
+from data.grid_manager import GridManager
+from data.models import Grid, FACTIONS, STRATEGIC_ROLE_CODES
+from export.binary_format import BINARY_EXTENSION, read_binary_map, write_binary_map
+
+
+COLUMNS = ("area_codes", "faction_codes", "role_codes", "land", "production")
+
+
+class QueryValuesBinaryMapTest(unittest.TestCase):
+    """query_values auf einer per mmap geladenen Karte gegen einen Vergleich Tile für Tile"""
+
+    def test_matches_brute_force(self):
+        rng = random.Random(20)
+        grid = Grid(width=19, height=13)
+        for index in range(grid.width * grid.height):
+            grid.area_codes[index] = rng.randrange(len(grid.area_definitions))
+            grid.faction_codes[index] = rng.randrange(len(FACTIONS))
+            grid.role_codes[index] = rng.randrange(len(STRATEGIC_ROLE_CODES))
+            grid.land[index] = rng.random() < 0.5
+            grid.production[index] = rng.choice((0, 5, 300, -70000))
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "world" + BINARY_EXTENSION)
+            write_binary_map(grid, file_path)
+            loaded, _ = read_binary_map(file_path)
+            self.assertIsInstance(loaded.production, memoryview)
+            manager = GridManager(loaded)
+
+            for name in COLUMNS:
+                column = list(getattr(grid, name))
+                for values in ([column[0]], sorted(set(column))[:2], [1 << 20]):
+                    expected = [index for index, value in enumerate(column) if value in values]
+                    self.assertEqual(list(manager.query_values(name, values)), expected, (name, values))
+
+
+if __name__ == "__main__":
+    unittest.main()
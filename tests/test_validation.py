@@ -0,0 +1,146 @@
+"""
+Vergleichstests für die Karten-Prüfung
+validate gegen eine Breitensuche der Teilgebiete, recheck gegen eine vollständige Neuprüfung
+"""
+import random
+import unittest
+from collections import deque
+from typing import Dict, Set, Tuple
+
+from data.grid_manager import GridManager
+from data.models import Grid, FACTIONS, FACTION_CODES, FactionType, STRATEGIC_ROLE_CODES, StrategicRoleType
+from data.validation import MapValidator, RULE_HEADQUARTER, RULE_TERRITORY
+from utils.hex_math import HexMath
+
+
+HEADQUARTER = STRATEGIC_ROLE_CODES[StrategicRoleType.HEADQUARTER]
+NEUTRAL = FACTION_CODES[FactionType.NEUTRAL]
+
+
+def brute_force_territories(grid: Grid) -> Tuple[Set[str], Dict[str, int]]:
+    """
+    Referenz: Teilgebiete per Breitensuche über HexMath.get_hex_neighbors
+
+    Returns:
+        (Fraktionen ohne Headquarter, Fraktion -> Anzahl abgetrennter Tiles)
+    """
+    width, height = grid.width, grid.height
+    seen = [False] * (width * height)
+    components: Dict[int, list] = {}
+    for start in range(width * height):
+        faction = grid.faction_codes[start]
+        if faction == NEUTRAL or seen[start]:
+            continue
+        seen[start] = True
+        queue = deque([start])
+        size = 0
+        has_headquarter = False
+        while queue:
+            index = queue.popleft()
+            size += 1
+            has_headquarter |= grid.role_codes[index] == HEADQUARTER
+            y, x = divmod(index, width)
+            for next_x, next_y in HexMath.get_hex_neighbors(x, y):
+                neighbor = next_y * width + next_x
+                if (0 <= next_x < width and 0 <= next_y < height and not seen[neighbor]
+                        and grid.faction_codes[neighbor] == faction):
+                    seen[neighbor] = True
+                    queue.append(neighbor)
+        components.setdefault(faction, []).append((has_headquarter, size))
+
+    missing = set()
+    detached = {}
+    for faction, sizes in components.items():
+        name = FACTIONS[faction].value
+        if not any(has_headquarter for has_headquarter, _ in sizes):
+            missing.add(name)
+        # Hauptgebiet: das größte Teilgebiet mit Headquarter (sonst das größte)
+        main_size = max(sizes)[1]
+        count = sum(size for _, size in sizes) - main_size
+        if count:
+            detached[name] = count
+    return missing, detached
+
+
+def reported_territories(issues) -> Tuple[Set[str], Dict[str, int]]:
+    """Fraktionen aus den Meldungen der Headquarter- und Territoriums-Regel"""
+    missing = {issue.message.split()[1] for issue in issues if issue.rule == RULE_HEADQUARTER}
+    detached = {issue.message.split()[1]: issue.count for issue in issues if issue.rule == RULE_TERRITORY}
+    return missing, detached
+
+
+def issue_key(issues):
+    """
+    Vergleichbare Form einer Problem-Liste
+
+    Bei gleich großen Teilgebieten darf die inkrementelle Prüfung ein
+    anderes als Hauptgebiet behalten, das erste abgetrennte Tile der
+    Territoriums-Regel wird daher nicht verglichen.
+    """
+    return [(issue.rule, issue.message, issue.count,
+             None if issue.rule == RULE_TERRITORY else issue.first_index) for issue in issues]
+
+
+def random_grid(rng: random.Random, width: int, height: int) -> GridManager:
+    """Grid mit zufälligen Fraktionen, Rollen, Areas und Produktionswerten"""
+    manager = GridManager(Grid(width, height))
+    grid = manager.grid
+    for index in range(width * height):
+        grid.faction_codes[index] = rng.randrange(len(FACTIONS)) if rng.random() < 0.6 else NEUTRAL
+        grid.area_codes[index] = rng.randrange(len(grid.area_definitions))
+        grid.land[index] = rng.random() < 0.5
+        grid.role_codes[index] = rng.randrange(len(STRATEGIC_ROLE_CODES)) if rng.random() < 0.2 else 0
+        grid.production[index] = rng.choice((0, 0, 300, -70000))
+    return manager
+
+
+class ValidateTest(unittest.TestCase):
+    """Vollständige Prüfung gegen die Breitensuche"""
+
+    def test_territories_match_bfs(self):
+        rng = random.Random(22)
+        for _ in range(150):
+            manager = random_grid(rng, rng.randint(1, 20), rng.randint(1, 20))
+            issues = MapValidator(manager).validate()
+            self.assertEqual(reported_territories(issues), brute_force_territories(manager.grid))
+
+
+class RecheckTest(unittest.TestCase):
+    """Inkrementelle Prüfung gegen eine vollständige Neuprüfung nach jeder Änderung"""
+
+    def test_matches_full_validation(self):
+        rng = random.Random(25)
+        for _ in range(40):
+            width, height = rng.randint(1, 30), rng.randint(1, 30)
+            manager = random_grid(rng, width, height)
+            grid = manager.grid
+            validator = MapValidator(manager)
+            validator.validate()
+            for _ in range(30):
+                indices = set(rng.sample(range(width * height), rng.randint(1, min(30, width * height))))
+                for index in indices:
+                    change = rng.randrange(5)
+                    if change == 0:
+                        grid.faction_codes[index] = rng.randrange(len(FACTIONS))
+                    elif change == 1:
+                        role = rng.randrange(len(STRATEGIC_ROLE_CODES))
+                        grid.role_codes[index] = rng.choice((0, HEADQUARTER, role))
+                    elif change == 2:
+                        grid.area_codes[index] = rng.randrange(len(grid.area_definitions))
+                    elif change == 3:
+                        grid.land[index] = 1 - grid.land[index]
+                    else:
+                        grid.production[index] = rng.choice((0, 5, 1 << 20))
+
+                issues = validator.recheck(indices)
+                expected = MapValidator(GridManager(grid)).validate()
+                self.assertEqual(issue_key(issues), issue_key(expected))
+                self.assertEqual(reported_territories(issues), brute_force_territories(grid))
+                # Die Anzeige-Maske folgt den einzelnen Regel-Masken
+                flagged = bytes(land | production | detached for land, production, detached in zip(
+                    validator.land_mask, validator.production_mask, validator.detached_mask))
+                self.assertEqual(bytes(validator.flagged_mask()), flagged)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+"""
+Raster-Chunk Cache für weit herausgezoomte Ansichten
+Rastert feste Hex-Blöcke in tk.PhotoImage Bitmaps statt einzelner Polygone
+"""
+import math
+import tkinter as tk
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from data.models import FactionType, FACTIONS, NO_AREA
+from utils.hex_geometry import VisibleRange
+
+
+CHUNK_TAG = "chunk"
+CHUNK_SIZE = 64  # Hexes pro Chunk-Kante
+
+DEFAULT_FILL_COLOR = "#90c695"
+
+# Faction-Farben für die Einfärbung im Raster (Neutral bleibt Terrain-Farbe)
+FACTION_TINTS = {
+    FactionType.BLUE: (0x00, 0x66, 0xff),
+    FactionType.RED: (0xff, 0x00, 0x00),
+}
+
+SQRT3 = math.sqrt(3.0)
+
+
+def build_palette(area_definitions) -> List[List[str]]:
+    """
+    Erstellt die Farbtabelle [area_code][faction_code] -> '#rrggbb'
+
+    Nicht-neutrale Fraktionen werden zur Hälfte in die Terrain-Farbe gemischt.
+    """
+    area_colors = [area.color for area in area_definitions]
+    # NO_AREA (0xFF) zeigt die Standard-Farbe
+    area_colors += [DEFAULT_FILL_COLOR] * (NO_AREA + 1 - len(area_colors))
+
+    palette = []
+    for color in area_colors:
+        red, green, blue = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+        row = []
+        for faction in FACTIONS:
+            tint = FACTION_TINTS.get(faction)
+            if tint is None:
+                row.append(color)
+            else:
+                row.append("#%02x%02x%02x" % ((red + tint[0]) // 2,
+                                              (green + tint[1]) // 2,
+                                              (blue + tint[2]) // 2))
+        palette.append(row)
+    return palette
+
+
+class ChunkCache:
+    """
+    Level-of-Detail Darstellung über gerasterte Chunks
+
+    Das Grid wird in CHUNK_SIZE x CHUNK_SIZE Hex-Blöcke geteilt. Jeder
+    Block wird pro Zoom-Stufe einmal in ein PhotoImage gerastert und in
+    einem LRU-Cache gehalten. Mal-Operationen invalidieren nur die
+    betroffenen Chunks.
+    """
+
+    def __init__(self, canvas: tk.Canvas, max_images: int = 96):
+        self.canvas = canvas
+        self.max_images = max_images
+
+        # (chunk_x, chunk_y, zoom_key) -> (PhotoImage, left, top) in LRU-Reihenfolge
+        self.images: "OrderedDict[Tuple[int, int, float], tuple]" = OrderedDict()
+        # (chunk_x, chunk_y) -> [canvas_item_id, zoom_key]
+        self.displayed: Dict[Tuple[int, int], list] = {}
+
+        self.grid = None
+        self.palette: Optional[List[List[str]]] = None
+        self.palette_areas = 0
+
+        # Statistik
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, grid, scale: float, offset_x: float, offset_y: float,
+               visible_range: Optional[VisibleRange]):
+        """
+        Zeigt die Chunks für den sichtbaren Bereich an
+
+        Args:
+            grid: Darzustellendes Grid
+            scale: Bildschirm-Pixel pro Einheits-Hex
+            offset_x: Bildschirm-Offset X des Welt-Ursprungs
+            offset_y: Bildschirm-Offset Y des Welt-Ursprungs
+            visible_range: Sichtbarer Hex-Bereich oder None
+        """
+        if grid is not self.grid:
+            self.invalidate_all()
+            self.grid = grid
+        if self.palette is None or self.palette_areas != len(grid.area_definitions):
+            self.palette = build_palette(grid.area_definitions)
+            self.palette_areas = len(grid.area_definitions)
+
+        wanted = set()
+        if visible_range is not None:
+            left_x, right_x = visible_range.left_x, visible_range.right_x
+            top_y, bottom_y = visible_range.top_y, visible_range.bottom_y
+            for chunk_y in range(top_y // CHUNK_SIZE, bottom_y // CHUNK_SIZE + 1):
+                for chunk_x in range(left_x // CHUNK_SIZE, right_x // CHUNK_SIZE + 1):
+                    wanted.add((chunk_x, chunk_y))
+
+        # Chunks außerhalb des Sichtbereichs entfernen
+        for chunk in list(self.displayed):
+            if chunk not in wanted:
+                self.canvas.delete(self.displayed.pop(chunk)[0])
+
+        zoom_key = round(scale, 3)
+        for chunk in wanted:
+            image, left, top = self._get_image(chunk, zoom_key)
+            screen_x = left + round(offset_x)
+            screen_y = top + round(offset_y)
+            entry = self.displayed.get(chunk)
+            if entry is None:
+                item_id = self.canvas.create_image(
+                    screen_x, screen_y,
+                    image=image,
+                    anchor="nw",
+                    tags=(CHUNK_TAG,)
+                )
+                self.displayed[chunk] = [item_id, zoom_key]
+            else:
+                if entry[1] != zoom_key:
+                    self.canvas.itemconfigure(entry[0], image=image)
+                    entry[1] = zoom_key
+                self.canvas.coords(entry[0], screen_x, screen_y)
+
+        self._evict()
+
+    def clear_items(self):
+        """Entfernt die Chunk-Items vom Canvas (Bitmaps bleiben im Cache)"""
+        if self.displayed:
+            self.canvas.delete(CHUNK_TAG)
+            self.displayed.clear()
+
+    def invalidate_hex(self, hex_x: int, hex_y: int):
+        """Verwirft die Bitmaps des Chunks, der das Hex enthält"""
+        self.invalidate_chunk(hex_x // CHUNK_SIZE, hex_y // CHUNK_SIZE)
+
+    def invalidate_chunk(self, chunk_x: int, chunk_y: int):
+        """Verwirft alle Zoom-Stufen eines Chunks"""
+        for key in [key for key in self.images if key[0] == chunk_x and key[1] == chunk_y]:
+            del self.images[key]
+        entry = self.displayed.get((chunk_x, chunk_y))
+        if entry is not None:
+            # Beim nächsten Render neu rastern
+            entry[1] = None
+
+    def invalidate_all(self):
+        """Verwirft alle Bitmaps (z.B. nach Laden oder neuem Grid)"""
+        self.clear_items()
+        self.images.clear()
+        self.palette = None
+
+    def _get_image(self, chunk: Tuple[int, int], zoom_key: float):
+        """Holt eine Chunk-Bitmap aus dem Cache oder rastert sie"""
+        key = (chunk[0], chunk[1], zoom_key)
+        cached = self.images.get(key)
+        if cached is not None:
+            self.images.move_to_end(key)
+            self.hits += 1
+            return cached
+        self.misses += 1
+        cached = self._rasterize(chunk[0], chunk[1], zoom_key)
+        self.images[key] = cached
+        return cached
+
+    def _evict(self):
+        """Entfernt die ältesten nicht angezeigten Bitmaps (LRU)"""
+        if len(self.images) <= self.max_images:
+            return
+        in_use = {(chunk[0], chunk[1], entry[1]) for chunk, entry in self.displayed.items()}
+        for key in list(self.images):
+            if len(self.images) <= self.max_images:
+                break
+            if key not in in_use:
+                del self.images[key]
+
+    def _rasterize(self, chunk_x: int, chunk_y: int, scale: float):
+        """
+        Rastert einen Chunk in ein PhotoImage
+
+        Jedes Hex wird als Rechteck-Block seiner Zeile gezeichnet. Die
+        Pixelgrenzen werden global gerundet, damit benachbarte Chunks
+        lückenlos aneinander anschließen.
+
+        Returns:
+            (PhotoImage, linker Pixel, oberer Pixel) relativ zum Welt-Ursprung
+        """
+        grid = self.grid
+        x0 = chunk_x * CHUNK_SIZE
+        y0 = chunk_y * CHUNK_SIZE
+        x1 = min(x0 + CHUNK_SIZE, grid.width)
+        y1 = min(y0 + CHUNK_SIZE, grid.height)
+
+        pitch_x = SQRT3 * scale
+        pitch_y = 1.5 * scale
+
+        def column_edge(x: int, parity: int) -> int:
+            return math.floor(pitch_x * (x + 0.5 * parity - 0.5))
+
+        def row_edge(y: int) -> int:
+            return math.floor(pitch_y * (y - 0.5))
+
+        left = column_edge(x0, 0)
+        top = row_edge(y0)
+        width = max(1, column_edge(x1, 1) - left)
+        height = max(1, row_edge(y1) - top)
+        image = tk.PhotoImage(width=width, height=height)
+
+        # Pixelbreite jedes Hex pro Zeilen-Parität
+        widths = []
+        starts = []
+        for parity in (0, 1):
+            edges = [column_edge(x, parity) for x in range(x0, x1 + 1)]
+            widths.append([edges[i + 1] - edges[i] for i in range(x1 - x0)])
+            starts.append(edges[0] - left)
+
+        palette = self.palette
+        area_codes = grid.area_codes
+        faction_codes = grid.faction_codes
+        for y in range(y0, y1):
+            row_top = row_edge(y) - top
+            row_height = row_edge(y + 1) - row_edge(y)
+            if row_height <= 0:
+                continue
+            parity = y & 1
+            start = y * grid.width + x0
+            end = start + (x1 - x0)
+            parts = [
+                (palette[area][faction] + " ") * run
+                for area, faction, run in zip(area_codes[start:end],
+                                              faction_codes[start:end],
+                                              widths[parity])
+                if run > 0
+            ]
+            row = "".join(parts).rstrip()
+            if not row:
+                continue
+            image.put(("{" + row + "} ") * row_height, to=(starts[parity], row_top))
+
+        return image, left, top
@@ -1,9 +1,12 @@
 """
 Dialog-Fenster für verschiedene UI-Interaktionen
 """
+import random
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from data.terrain_generator import TerrainSettings
+
 
 class GridSizeDialog:
     """Dialog für Grid-Größe Eingabe"""
@@ -63,7 +66,7 @@ class GridSizeDialog:
         self.height_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Info
-        info_text = "Size range: 10-200\\nLarge grids may be slow"
+        info_text = "Size range: 10-2000\\nZoom out for an overview of large grids"
         ttk.Label(main_frame, text=info_text, 
                  font=('TkDefaultFont', 8)).pack(pady=(10, 0))
         
@@ -82,8 +85,8 @@ class GridSizeDialog:
             width = int(self.width_var.get())
             height = int(self.height_var.get())
             
-            if width < 10 or width > 200 or height < 10 or height > 200:
-                messagebox.showerror("Error", "Size must be between 10 and 200")
+            if width < 10 or width > 2000 or height < 10 or height > 2000:
+                messagebox.showerror("Error", "Size must be between 10 and 2000")
                 return
             
             self.result = (width, height)
@@ -99,4 +102,122 @@ class GridSizeDialog:
     def show(self):
         """Zeigt Dialog und wartet auf Ergebnis"""
         self.dialog.wait_window()
-        return self.result
\ No newline at end of file
+        return self.result
+
+class GenerateMapDialog:
+    """Dialog für die Terrain-Generierung (Größe, Seed und Anteile)"""
+    
+    def __init__(self, parent, current_width=50, current_height=50):
+        self.result = None
+        
+        # Dialog erstellen
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Generate Map")
+        self.dialog.geometry("320x330")
+        self.dialog.resizable(False, False)
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+        
+        # Zentriere Dialog
+        self.dialog.geometry("+%d+%d" % (
+            parent.winfo_rootx() + 50,
+            parent.winfo_rooty() + 50
+        ))
+        
+        # Variables (Anteile in Prozent)
+        defaults = TerrainSettings(seed=random.randrange(1000000))
+        self.width_var = tk.StringVar(value=str(current_width))
+        self.height_var = tk.StringVar(value=str(current_height))
+        self.seed_var = tk.StringVar(value=str(defaults.seed))
+        self.land_var = tk.StringVar(value=str(round(defaults.land_ratio * 100)))
+        self.mountain_var = tk.StringVar(value=str(round(defaults.mountain_ratio * 100)))
+        self.desert_var = tk.StringVar(value=str(round(defaults.desert_ratio * 100)))
+        self.feature_var = tk.StringVar(value=str(defaults.feature_size))
+        
+        self._create_widgets()
+        
+        # Enter/Escape bindings
+        self.dialog.bind('<Return>', lambda e: self._ok())
+        self.dialog.bind('<Escape>', lambda e: self._cancel())
+        
+        # Focus auf width entry
+        self.width_entry.focus()
+    
+    def _create_widgets(self):
+        """Erstellt Dialog-Widgets"""
+        # Main frame
+        main_frame = ttk.Frame(self.dialog)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Title
+        ttk.Label(main_frame, text="Generate terrain from noise:", 
+                 font=('TkDefaultFont', 10, 'bold')).pack(pady=(0, 10))
+        
+        entries = []
+        for label, variable in (("Width:", self.width_var),
+                                ("Height:", self.height_var),
+                                ("Seed:", self.seed_var),
+                                ("Land %:", self.land_var),
+                                ("Mountains %:", self.mountain_var),
+                                ("Desert %:", self.desert_var),
+                                ("Feature size:", self.feature_var)):
+            row_frame = ttk.Frame(main_frame)
+            row_frame.pack(fill=tk.X, pady=2)
+            ttk.Label(row_frame, text=label, width=14).pack(side=tk.LEFT)
+            entry = ttk.Entry(row_frame, textvariable=variable)
+            entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            entries.append(entry)
+        self.width_entry = entries[0]
+        
+        # Info
+        info_text = "Mountains % of land, desert % of lowland\nFeature size = continent scale in tiles"
+        ttk.Label(main_frame, text=info_text, 
+                 font=('TkDefaultFont', 8)).pack(pady=(8, 0))
+        
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(12, 0))
+        
+        ttk.Button(button_frame, text="Cancel", 
+                  command=self._cancel).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Button(button_frame, text="Generate", 
+                  command=self._ok).pack(side=tk.RIGHT)
+    
+    def _ok(self):
+        """Generate gedrückt"""
+        try:
+            width = int(self.width_var.get())
+            height = int(self.height_var.get())
+            settings = TerrainSettings(
+                seed=int(self.seed_var.get()),
+                feature_size=int(self.feature_var.get()),
+                land_ratio=float(self.land_var.get()) / 100.0,
+                mountain_ratio=float(self.mountain_var.get()) / 100.0,
+                desert_ratio=float(self.desert_var.get()) / 100.0,
+            )
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid numbers")
+            return
+        
+        if width < 10 or width > 2000 or height < 10 or height > 2000:
+            messagebox.showerror("Error", "Size must be between 10 and 2000")
+            return
+        ratios = (settings.land_ratio, settings.mountain_ratio, settings.desert_ratio)
+        if any(ratio < 0.0 or ratio > 1.0 for ratio in ratios):
+            messagebox.showerror("Error", "Percentages must be between 0 and 100")
+            return
+        if settings.feature_size < 4:
+            messagebox.showerror("Error", "Feature size must be at least 4")
+            return
+        
+        self.result = (width, height, settings)
+        self.dialog.destroy()
+    
+    def _cancel(self):
+        """Cancel gedrückt"""
+        self.dialog.destroy()
+    
+    def show(self):
+        """Zeigt Dialog und wartet auf Ergebnis"""
+        self.dialog.wait_window()
+        return self.result
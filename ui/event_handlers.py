@@ -3,6 +3,7 @@ Event Handler für die Hauptanwendung
 """
 from typing import Optional
 from data.models import Tile
+from data.pathfinding import find_path
 
 
 class EventHandlers:
@@ -18,6 +19,9 @@ class EventHandlers:
         self.map_canvas.on_tile_click = self._on_tile_click
         self.map_canvas.on_tile_paint = self._on_terrain_painted
         self.map_canvas.on_faction_paint = self._on_faction_painted
+        self.map_canvas.on_strategic_role_paint = self._on_strategic_role_painted
+        self.map_canvas.on_region_fill = self._on_region_filled
+        self.map_canvas.on_validation = self._on_validation
     
     def _on_tile_hover(self, tile: Optional[Tile]):
         """Wird aufgerufen wenn Maus über Tile hovert"""
@@ -30,7 +34,9 @@ class EventHandlers:
     
     def _on_tile_click(self, tile: Tile):
         """Wird aufgerufen wenn auf ein Tile geklickt wird"""
-        if tile:
+        if tile and self.main_window.path_tool_active.get():
+            self._on_path_point(tile)
+        elif tile:
             # Tile für Bearbeitung auswählen
             self.main_window.select_tile_for_editing(tile)
             
@@ -38,9 +44,34 @@ class EventHandlers:
             coords = tile.coordinates
             self.main_window.set_status(f"Selected tile at ({coords[0]}, {coords[1]}) for editing")
     
+    def _on_path_point(self, tile: Tile):
+        """Path-Tool: erster Klick setzt den Start, zweiter sucht den Weg zum Ziel"""
+        x, y = tile.coordinates
+        index = y * self.grid_manager.grid.width + x
+        start = self.main_window.path_start
+        if start is None:
+            self.main_window.path_start = index
+            self.map_canvas.set_path_overlay([index])
+            self.main_window.set_status(f"Path start at ({x}, {y}) - click the goal tile")
+            return
+        
+        self.main_window.path_start = None
+        result = find_path(self.grid_manager.grid, start, index,
+                           neighbors=self.grid_manager.neighbor_table)
+        if result is None:
+            self.map_canvas.set_path_overlay([])
+            self.main_window.set_status(f"No path to ({x}, {y})")
+            return
+        
+        self.map_canvas.set_path_overlay(result.path)
+        self.main_window.set_status(
+            f"Path to ({x}, {y}): cost {result.cost}, {len(result.path) - 1} steps, "
+            f"{result.explored} tiles explored"
+        )
+    
     def _on_terrain_painted(self, tile: Tile, old_area):
         """Wird aufgerufen wenn ein Tile mit Terrain bemalt wurde"""
-        terrain_name = tile.area.name if tile.area else "Unknown"
+        terrain_name = tile.area.display_name if tile.area else "Unknown"
         coords_text = f"Painted {terrain_name} at ({tile.coordinates[0]}, {tile.coordinates[1]})"
         self.main_window.set_status(coords_text)
     
@@ -50,6 +81,21 @@ class EventHandlers:
         coords_text = f"Painted faction {faction_name} at ({tile.coordinates[0]}, {tile.coordinates[1]})"
         self.main_window.set_status(coords_text)
     
+    def _on_strategic_role_painted(self, tile: Tile, old_strategic_role):
+        """Wird aufgerufen wenn ein Tile mit einer Strategic Role bemalt wurde"""
+        role_name = tile.strategic_role.value
+        coords_text = f"Painted role {role_name} at ({tile.coordinates[0]}, {tile.coordinates[1]})"
+        self.main_window.set_status(coords_text)
+    
+    def _on_region_filled(self, tile: Tile, entry):
+        """Wird aufgerufen wenn eine Region mit dem Bucket-Tool gefüllt wurde"""
+        coords_text = f"{entry.label} at ({tile.coordinates[0]}, {tile.coordinates[1]})"
+        self.main_window.set_status(coords_text)
+    
+    def _on_validation(self, issues):
+        """Wird nach jeder Prüfung der Karte aufgerufen"""
+        self.main_window.update_issue_summary(issues)
+    
     def _format_tile_properties(self, tile: Tile) -> str:
         """Formatiert Tile-Eigenschaften für Anzeige"""
         lines = []
@@ -0,0 +1,48 @@
+"""
+Datei-Dialoge für Laden und Export von Karten
+Kapselt tkinter.filedialog/messagebox, damit das export-Paket ohne tkinter importierbar bleibt
+"""
+from tkinter import filedialog, messagebox
+
+from export.binary_format import BINARY_EXTENSION
+
+
+MAP_FILETYPES = [("JSON", "*.json"), ("Hex Map Binary", "*" + BINARY_EXTENSION), ("All Files", "*.*")]
+REPORT_FILETYPES = [("Text", "*.txt"), ("JSON", "*.json"), ("All Files", "*.*")]
+
+
+def ask_save_map_path() -> str:
+    """Fragt den Ziel-Pfad für den Export ab ('' bei Abbruch)"""
+    return filedialog.asksaveasfilename(
+        title="Export Hex Map",
+        defaultextension=".json",
+        filetypes=MAP_FILETYPES
+    )
+
+
+def ask_open_map_path() -> str:
+    """Fragt die zu ladende Karte ab ('' bei Abbruch)"""
+    return filedialog.askopenfilename(
+        title="Load Hex Map",
+        defaultextension=".json",
+        filetypes=MAP_FILETYPES
+    )
+
+
+def ask_save_report_path() -> str:
+    """Fragt den Ziel-Pfad für den Performance-Report ab ('' bei Abbruch)"""
+    return filedialog.asksaveasfilename(
+        title="Save Performance Report",
+        defaultextension=".txt",
+        filetypes=REPORT_FILETYPES
+    )
+
+
+def show_info(title: str, message: str):
+    """Zeigt eine Info-Meldung"""
+    messagebox.showinfo(title, message)
+
+
+def show_error(title: str, message: str):
+    """Zeigt eine Fehlermeldung"""
+    messagebox.showerror(title, message)
@@ -0,0 +1,306 @@
+"""
+Retained-Mode Renderer für den Map Canvas
+Hält die Canvas-Items pro Hex vor und aktualisiert nur, was sich geändert hat
+"""
+import tkinter as tk
+from typing import Dict, List, Optional, Tuple
+
+from data.models import FactionType, StrategicRoleType, FACTIONS, STRATEGIC_ROLES, NO_AREA
+from utils.hex_geometry import HexGeometry, VisibleRange
+
+
+# Tag aller Karten-Items (für Pan/Zoom per Canvas-Transformation)
+MAP_TAG = "map"
+FACTION_TAG = "faction"
+LABEL_TAG = "label"
+
+DEFAULT_FILL_COLOR = "#90c695"  # Standard grün
+OUTLINE_COLOR = "#404040"
+
+FACTION_COLORS = {
+    FactionType.BLUE: "#0066ff",
+    FactionType.RED: "#ff0000",
+    FactionType.NEUTRAL: "#808080",
+}
+
+# Rollen-Kürzel und ob der Produktionswert angezeigt wird
+ROLE_LABELS = {
+    StrategicRoleType.FIREPOWER: ("F", True),
+    StrategicRoleType.MOBILITY: ("M", True),
+    StrategicRoleType.INTEL: ("I", True),
+    StrategicRoleType.RAILWAY: ("H", False),
+    StrategicRoleType.LOGISTIC_HUB: ("L", False),
+    StrategicRoleType.HEADQUARTER: ("Hq", False),
+}
+
+# Index-Positionen in den Pool-Einträgen
+POLYGON, FACTION_OUTLINE, LABEL, STYLE, ZOOM_STYLE = range(5)
+
+
+class HexRenderer:
+    """
+    Retained-Mode Renderer für Hex-Tiles
+
+    Jedes sichtbare Hex besitzt einen Pool-Eintrag mit seinen Canvas-Items
+    (Polygon, optional Faction-Rahmen und Text). Kamera-Änderungen werden
+    mit einer einzigen Canvas-Transformation (scale/move) auf alle Items
+    angewendet; neu erzeugt oder gelöscht werden nur Hexes, die den
+    sichtbaren Bereich betreten oder verlassen.
+    """
+
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+
+        # (hex_x, hex_y) -> [polygon_id, faction_id, label_id, style, zoom_style]
+        self.items: Dict[Tuple[int, int], list] = {}
+
+        # Transformation mit der die Items aktuell gelegt sind
+        self.layout_scale: Optional[float] = None
+        self.layout_offset_x = 0.0
+        self.layout_offset_y = 0.0
+
+        self.geometry: Optional[HexGeometry] = None
+        self.visible_range: Optional[VisibleRange] = None
+        self.zoom_style: Optional[tuple] = None
+        self.grid = None
+
+        # Statistik des letzten Renders
+        self.items_created = 0
+        self.items_deleted = 0
+
+    def clear(self):
+        """Entfernt alle Karten-Items"""
+        self.canvas.delete(MAP_TAG)
+        self.items.clear()
+        self.visible_range = None
+        self.layout_scale = None
+
+    def render(self, grid, geometry: HexGeometry, visible_range: Optional[VisibleRange],
+               tiles_changed: bool = True):
+        """
+        Aktualisiert die Darstellung
+
+        Args:
+            grid: Darzustellendes Grid
+            geometry: Aktuelle Bildschirm-Transformation (gemeinsam mit dem Hit-Testing)
+            visible_range: Sichtbarer Hex-Bereich oder None
+            tiles_changed: Tile-Daten aller gepoolten Hexes auf Änderungen prüfen
+        """
+        self.items_created = 0
+        self.items_deleted = 0
+
+        if grid is not self.grid:
+            self.clear()
+            self.grid = grid
+
+        self.geometry = geometry
+        self._apply_camera(geometry.scale, geometry.offset_x, geometry.offset_y)
+
+        zoom_style = self._zoom_style(geometry.scale)
+        restyle_all = tiles_changed or zoom_style != self.zoom_style
+        self.zoom_style = zoom_style
+
+        self._update_visible_set(visible_range)
+
+        if restyle_all:
+            for (hex_x, hex_y), entry in self.items.items():
+                self._restyle(hex_x, hex_y, entry)
+
+        self.canvas.tag_raise(FACTION_TAG)
+        self.canvas.tag_raise(LABEL_TAG)
+
+    def update_hex(self, hex_x: int, hex_y: int):
+        """Aktualisiert ein einzelnes Hex (falls sichtbar) nach einer Tile-Änderung"""
+        entry = self.items.get((hex_x, hex_y))
+        if entry is not None:
+            self._restyle(hex_x, hex_y, entry)
+
+    def _apply_camera(self, scale: float, offset_x: float, offset_y: float):
+        """Verschiebt/skaliert alle bestehenden Items auf die neue Kamera"""
+        if self.layout_scale is not None and self.items:
+            if scale != self.layout_scale:
+                factor = scale / self.layout_scale
+                self.canvas.scale(MAP_TAG, self.layout_offset_x, self.layout_offset_y, factor, factor)
+            dx = offset_x - self.layout_offset_x
+            dy = offset_y - self.layout_offset_y
+            if dx or dy:
+                self.canvas.move(MAP_TAG, dx, dy)
+
+        self.layout_scale = scale
+        self.layout_offset_x = offset_x
+        self.layout_offset_y = offset_y
+
+    def _update_visible_set(self, new_range: Optional[VisibleRange]):
+        """Erzeugt/löscht nur die Hexes am Rand des sichtbaren Bereichs"""
+        old_range = self.visible_range
+        self.visible_range = new_range
+
+        if old_range is not None:
+            for hex_x, hex_y in _range_difference(old_range, new_range):
+                entry = self.items.pop((hex_x, hex_y), None)
+                if entry is not None:
+                    self._delete_entry(entry)
+
+        if new_range is not None:
+            for hex_x, hex_y in _range_difference(new_range, old_range):
+                self.items[(hex_x, hex_y)] = self._create_entry(hex_x, hex_y)
+
+    def _zoom_style(self, scale: float) -> tuple:
+        """Zoom-abhängige Darstellungsparameter"""
+        font_size = max(8, min(16, int(scale * 0.4)))
+        faction_line_width = 3 if scale > 15 else 2
+        return font_size, faction_line_width, scale > 10, scale > 25
+
+    def _tile_style(self, hex_x: int, hex_y: int) -> tuple:
+        """Berechnet (Füllfarbe, Faction-Farbe, Text, Text ist Koordinate) für ein Tile"""
+        grid = self.grid
+        index = hex_y * grid.width + hex_x
+
+        fill_color = DEFAULT_FILL_COLOR
+        area_code = grid.area_codes[index]
+        if area_code != NO_AREA:
+            fill_color = grid.area_definitions[area_code].color
+
+        faction = FACTIONS[grid.faction_codes[index]]
+        faction_color = None
+        if faction != FactionType.NEUTRAL:
+            faction_color = FACTION_COLORS.get(faction, "#808080")
+
+        _, _, show_roles, show_coords = self.zoom_style
+        text = None
+        is_coordinate = False
+        role = STRATEGIC_ROLES[grid.role_codes[index]]
+        if role in ROLE_LABELS:
+            if show_roles:
+                # Für production-fähige Rollen: Zeige Rolle + Produktionswert
+                role_text, show_production = ROLE_LABELS[role]
+                production = grid.production[index]
+                text = f"{role_text}{production}" if show_production and production > 0 else role_text
+        elif show_coords:
+            # Koordinaten nur bei sehr großen Hexagonen und ohne Strategic Role
+            text = f"{hex_x},{hex_y}"
+            is_coordinate = True
+
+        return fill_color, faction_color, text, is_coordinate
+
+    def _hex_center(self, hex_x: int, hex_y: int) -> Tuple[float, float]:
+        """Bildschirm-Position des Hex-Zentrums in der aktuellen Transformation"""
+        return self.geometry.hex_center(hex_x, hex_y)
+
+    def _hex_coords(self, hex_x: int, hex_y: int) -> List[float]:
+        """Flache Eckpunkt-Liste für tkinter"""
+        return self.geometry.hex_vertices(hex_x, hex_y)
+
+    def _create_entry(self, hex_x: int, hex_y: int) -> list:
+        """Erzeugt die Canvas-Items für ein Hex"""
+        style = self._tile_style(hex_x, hex_y)
+        coords = self._hex_coords(hex_x, hex_y)
+        polygon_id = self.canvas.create_polygon(
+            coords,
+            fill=style[0],
+            outline=OUTLINE_COLOR,
+            width=1,
+            tags=(MAP_TAG,)
+        )
+        self.items_created += 1
+        entry = [polygon_id, None, None, None, None]
+        self._apply_decorations(hex_x, hex_y, entry, style, coords)
+        entry[STYLE] = style
+        return entry
+
+    def _restyle(self, hex_x: int, hex_y: int, entry: list):
+        """Passt die Items eines Hex an, falls sich dessen Darstellung geändert hat"""
+        style = self._tile_style(hex_x, hex_y)
+        old_style = entry[STYLE]
+        if style == old_style and entry[ZOOM_STYLE] == self.zoom_style:
+            return
+
+        if style[0] != old_style[0]:
+            self.canvas.itemconfigure(entry[POLYGON], fill=style[0])
+        self._apply_decorations(hex_x, hex_y, entry, style, None)
+        entry[STYLE] = style
+
+    def _apply_decorations(self, hex_x: int, hex_y: int, entry: list, style: tuple,
+                           coords: Optional[List[float]]):
+        """Erzeugt, aktualisiert oder löscht Faction-Rahmen und Text eines Hex"""
+        _, faction_color, text, is_coordinate = style
+        font_size, faction_line_width, _, _ = self.zoom_style
+
+        # Faction-Rahmen
+        if faction_color is None:
+            if entry[FACTION_OUTLINE] is not None:
+                self.canvas.delete(entry[FACTION_OUTLINE])
+                self.items_deleted += 1
+                entry[FACTION_OUTLINE] = None
+        elif entry[FACTION_OUTLINE] is None:
+            if coords is None:
+                coords = self.canvas.coords(entry[POLYGON])
+            entry[FACTION_OUTLINE] = self.canvas.create_polygon(
+                coords,
+                fill="",  # Kein Fill, nur Rahmen
+                outline=faction_color,
+                width=faction_line_width,
+                tags=(MAP_TAG, FACTION_TAG)
+            )
+            self.items_created += 1
+        else:
+            self.canvas.itemconfigure(entry[FACTION_OUTLINE], outline=faction_color,
+                                      width=faction_line_width)
+
+        # Rollen- bzw. Koordinaten-Text
+        if entry[LABEL] is not None:
+            self.canvas.delete(entry[LABEL])
+            self.items_deleted += 1
+            entry[LABEL] = None
+        if text is not None:
+            screen_x, screen_y = self._hex_center(hex_x, hex_y)
+            if is_coordinate:
+                entry[LABEL] = self.canvas.create_text(
+                    screen_x, screen_y + self.layout_scale * 0.3,
+                    text=text,
+                    fill="black",
+                    font=("Arial", 8),
+                    tags=(MAP_TAG, LABEL_TAG)
+                )
+            else:
+                entry[LABEL] = self.canvas.create_text(
+                    screen_x, screen_y,
+                    text=text,
+                    fill="white",
+                    font=("Arial", font_size, "bold"),
+                    tags=(MAP_TAG, LABEL_TAG)
+                )
+            self.items_created += 1
+
+        # Zoom-Stil merken, mit dem die Dekorationen erzeugt wurden
+        entry[ZOOM_STYLE] = self.zoom_style
+
+    def _delete_entry(self, entry: list):
+        """Löscht alle Canvas-Items eines Pool-Eintrags"""
+        for item_id in entry[:STYLE]:
+            if item_id is not None:
+                self.canvas.delete(item_id)
+                self.items_deleted += 1
+
+
+def _range_difference(range_a: VisibleRange, range_b: Optional[VisibleRange]):
+    """
+    Iteriert über alle Hexes in range_a, die nicht in range_b liegen
+
+    Der Aufwand ist proportional zum Rand-Unterschied, nicht zur Fläche.
+    """
+    if range_b is None:
+        yield from range_a.tiles()
+        return
+
+    for y in range(range_a.top_y, range_a.bottom_y + 1):
+        left_a, right_a = range_a.columns(y)
+        if y < range_b.top_y or y > range_b.bottom_y:
+            for x in range(left_a, right_a + 1):
+                yield x, y
+        else:
+            left_b, right_b = range_b.columns(y)
+            for x in range(left_a, min(right_a, left_b - 1) + 1):
+                yield x, y
+            for x in range(max(left_a, right_b + 1), right_a + 1):
+                yield x, y
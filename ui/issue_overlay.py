@@ -0,0 +1,71 @@
+"""
+Hervorhebung von Validierungs-Problemen auf dem Map Canvas
+Umrandet die sichtbaren Tiles, die eine Regel der Karten-Prüfung verletzen
+"""
+import tkinter as tk
+from typing import Optional
+
+from utils.hex_geometry import HexGeometry, VisibleRange
+
+
+ISSUE_TAG = "issue"
+ISSUE_COLOR = "#ff2020"
+
+# Höchstens so viele Tiles werden umrandet (weit herausgezoomt)
+MAX_ISSUE_MARKERS = 3000
+
+
+class IssueOverlay:
+    """
+    Overlay der fehlerhaften Tiles
+
+    Gezeichnet werden nur markierte Tiles im sichtbaren Bereich; sie werden
+    zeilenweise per bytes.find in der Problem-Maske gesucht, der Aufwand
+    hängt damit nicht von der Grid-Größe ab.
+    """
+
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+        self.enabled = True
+        self.marker_count = 0
+
+    def clear(self):
+        """Entfernt alle Markierungen"""
+        self.canvas.delete(ISSUE_TAG)
+        self.marker_count = 0
+
+    def render(self, grid, geometry: HexGeometry, visible_range: Optional[VisibleRange],
+               flagged: Optional[bytearray]):
+        """
+        Umrandet die sichtbaren markierten Tiles
+
+        Args:
+            grid: Aktuelles Grid
+            geometry: Bildschirm-Transformation des Map Canvas
+            visible_range: Sichtbarer Hex-Bereich oder None
+            flagged: 0/1-Maske der fehlerhaften Tiles (siehe MapValidator.flagged_mask)
+        """
+        self.clear()
+        if not self.enabled or visible_range is None or flagged is None:
+            return
+
+        width = grid.width
+        line_width = 2 if geometry.scale >= 6 else 1
+        create = self.canvas.create_polygon
+        count = 0
+        for hex_y in range(visible_range.top_y, visible_range.bottom_y + 1):
+            x_start, x_end = visible_range.columns(hex_y)
+            row_start = hex_y * width
+            end = row_start + x_end + 1
+            position = flagged.find(1, row_start + x_start, end)
+            while position >= 0:
+                if count >= MAX_ISSUE_MARKERS:
+                    self.marker_count = count
+                    return
+                create(geometry.hex_vertices(position - row_start, hex_y),
+                       fill="", outline=ISSUE_COLOR, width=line_width, tags=(ISSUE_TAG,))
+                count += 1
+                position = flagged.find(1, position + 1, end)
+        self.marker_count = count
+        if count:
+            self.canvas.tag_raise(ISSUE_TAG)
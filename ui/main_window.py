@@ -5,8 +5,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from typing import Callable, Optional
 
-from data.models import get_default_areas, FactionType, StrategicRoleType
+from data.models import get_default_areas, FactionType, StrategicRoleType, AreaRegistry
 from ui.dialogs import GridSizeDialog
+from ui.map_canvas import MAX_BRUSH_SIZE
+from ui.minimap import Minimap
+from ui import file_dialogs
+from utils.profiling import PROFILER
 
 
 class MainWindow:
@@ -25,12 +29,23 @@ class MainWindow:
         self.strategic_role_paint_active = tk.BooleanVar()
         self.selected_strategic_role_var = tk.StringVar()
         self.brush_size = tk.IntVar(value=1)
+        self.bucket_fill_active = tk.BooleanVar()
+        self.path_tool_active = tk.BooleanVar()
+        self.issue_overlay_active = tk.BooleanVar(value=True)
         
         # Callbacks
         self.on_new_grid: Optional[Callable] = None
+        self.on_generate: Optional[Callable] = None
         # Export callbacks
         self.on_export: Optional[Callable] = None
         self.on_load: Optional[Callable] = None
+        # Distanz-Feld der Headquarter (Hintergrund-Task)
+        self.on_show_distances: Optional[Callable] = None
+        # Abbruch des laufenden Hintergrund-Tasks
+        self.on_cancel_task: Optional[Callable] = None
+        
+        # Path-Tool: Start-Index bis zum zweiten Klick
+        self.path_start: Optional[int] = None
         
         # Tile editing
         self.selected_tile = None
@@ -39,6 +54,8 @@ class MainWindow:
         
         # Canvas Frame referenz für später
         self.canvas_frame = None
+        self.minimap_frame = None
+        self.minimap = None
         
         self._create_menu()
         self._create_main_layout()
@@ -53,8 +70,41 @@ class MainWindow:
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="New Grid...", command=self._new_grid)
+        file_menu.add_command(label="Generate...", command=self._generate_map)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
+        
+        # Edit Menu
+        edit_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Edit", menu=edit_menu)
+        edit_menu.add_command(label="Undo", accelerator="Ctrl+Z", command=self._undo)
+        edit_menu.add_command(label="Redo", accelerator="Ctrl+Y", command=self._redo)
+        
+        self.root.bind_all("<Control-z>", lambda event: self._undo())
+        self.root.bind_all("<Control-y>", lambda event: self._redo())
+        self.root.bind_all("<Control-Shift-Z>", lambda event: self._redo())
+        
+        # View Menu
+        view_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="View", menu=view_menu)
+        self.profiling_active = tk.BooleanVar(value=PROFILER.enabled)
+        view_menu.add_checkbutton(label="Performance Overlay", accelerator="P",
+                                  variable=self.profiling_active, command=self._toggle_profiling)
+        view_menu.add_command(label="Save Performance Report...", command=self._save_performance_report)
+        view_menu.add_command(label="Reset Performance Stats", command=PROFILER.reset)
+        
+        # Analysis Menu (Wegfindung)
+        analysis_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Analysis", menu=analysis_menu)
+        analysis_menu.add_checkbutton(label="Path Tool (click start and goal)",
+                                      variable=self.path_tool_active, command=self._toggle_path_tool)
+        analysis_menu.add_command(label="Distance from Headquarters", command=self._show_headquarter_distances)
+        analysis_menu.add_separator()
+        analysis_menu.add_command(label="Clear Overlay", command=self._clear_overlay)
+        analysis_menu.add_separator()
+        analysis_menu.add_command(label="Validate Map", command=self._validate_map)
+        analysis_menu.add_checkbutton(label="Highlight Issues", variable=self.issue_overlay_active,
+                                      command=self._toggle_issue_overlay)
     
     def _create_main_layout(self):
         """Erstellt das Hauptlayout"""
@@ -98,6 +148,10 @@ class MainWindow:
         props_frame.pack(side=tk.RIGHT, fill=tk.Y)
         props_frame.pack_propagate(False)
         
+        # Minimap über den Tile-Eigenschaften (wird mit dem Map Canvas erstellt)
+        self.minimap_frame = ttk.LabelFrame(props_frame, text="Overview")
+        self.minimap_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+        
         self._create_properties_panel(props_frame)
         self._create_tile_editor_panel(props_frame)
     
@@ -106,6 +160,9 @@ class MainWindow:
         self.map_canvas = map_canvas
         if self.canvas_frame and map_canvas:
             map_canvas.canvas.pack(fill=tk.BOTH, expand=True)
+        if self.minimap_frame and map_canvas:
+            self.minimap = Minimap(self.minimap_frame, self.grid_manager, map_canvas)
+            self.minimap.get_widget().pack(padx=5, pady=5)
     
     def _create_controls_info(self, parent):
         """Erstellt Controls-Hilfe"""
@@ -123,7 +180,8 @@ class MainWindow:
             "• Hold Left Mouse: Paint\\n"
             "• Select faction below\\n"            "\nStrategic Role Mode:\n"
             "• Hold Left Mouse: Paint\n"
-            "• Select role below\n"            "• Adjust brush size"
+            "• Select role below\n"            "• Adjust brush size\n"
+            "• Bucket Fill: click fills region"
         )
         controls_label = ttk.Label(
             parent,
@@ -166,6 +224,7 @@ class MainWindow:
         
         # Brush Size Control
         self._create_brush_size_control(paint_frame, "terrain")
+        self._create_bucket_fill_toggle(paint_frame)
     
     def _create_faction_tool_panel(self, parent):
         """Erstellt Faction-Tool Panel"""
@@ -199,6 +258,7 @@ class MainWindow:
         
         # Brush Size Control für Faction
         self._create_brush_size_control(faction_frame, "faction")
+        self._create_bucket_fill_toggle(faction_frame)
     
     def _create_strategic_role_tool_panel(self, parent):
         """Erstellt Strategic Role Tool Panel"""
@@ -232,6 +292,7 @@ class MainWindow:
         
         # Brush Size Control für Strategic Role
         self._create_brush_size_control(role_frame, "strategic_role")
+        self._create_bucket_fill_toggle(role_frame)
     
     def _create_brush_size_control(self, parent, prefix):
         """Erstellt Brush Size Kontrolle"""
@@ -243,7 +304,7 @@ class MainWindow:
         brush_size_scale = ttk.Scale(
             brush_size_frame,
             from_=1,
-            to=5,
+            to=MAX_BRUSH_SIZE,
             orient=tk.HORIZONTAL,
             variable=self.brush_size,
             command=self._on_brush_size_changed
@@ -259,6 +320,15 @@ class MainWindow:
         else:
             self.faction_brush_size_label = brush_size_label
     
+    def _create_bucket_fill_toggle(self, parent):
+        """Erstellt den Bucket-Fill Schalter (gemeinsam für alle Mal-Werkzeuge)"""
+        ttk.Checkbutton(
+            parent,
+            text="Bucket Fill (click fills region)",
+            variable=self.bucket_fill_active,
+            command=self._toggle_bucket_fill
+        ).pack(anchor="w", padx=5, pady=(0, 5))
+    
     def _create_export_panel(self, parent):
         """Erstellt Export Panel"""
         export_frame = ttk.LabelFrame(parent, text="Export")
@@ -412,13 +482,41 @@ class MainWindow:
     
     def _create_status_bar(self):
         """Erstellt die Statusleiste"""
+        status_frame = ttk.Frame(self.root)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Ergebnis der Karten-Prüfung (rechts)
+        self.issue_label = ttk.Label(
+            status_frame,
+            text="",
+            relief=tk.SUNKEN,
+            anchor=tk.E,
+            width=40
+        )
+        self.issue_label.pack(side=tk.RIGHT)
+        
+        # Fortschritt des Hintergrund-Tasks (nur sichtbar solange einer läuft)
+        self.cancel_task_button = ttk.Button(
+            status_frame,
+            text="Cancel",
+            command=self._cancel_task
+        )
+        self.progress_var = tk.DoubleVar(value=0.0)
+        self.progress_bar = ttk.Progressbar(
+            status_frame,
+            mode="determinate",
+            maximum=1.0,
+            variable=self.progress_var,
+            length=200
+        )
+        
         self.status_label = ttk.Label(
-            self.root,
+            status_frame,
             text="Ready",
             relief=tk.SUNKEN,
             anchor=tk.W
         )
-        self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
     
     def _toggle_paint_tool(self):
         """Schaltet Paint-Tool an/aus"""
@@ -429,6 +527,7 @@ class MainWindow:
         if is_active:
             self.faction_paint_active.set(False)
             self.strategic_role_paint_active.set(False)
+            self.path_tool_active.set(False)
             if self.map_canvas:
                 self.map_canvas.set_faction_paint_mode(False)
                 self.map_canvas.set_strategic_role_paint_mode(False)
@@ -442,6 +541,7 @@ class MainWindow:
         if is_active:
             self.paint_tool_active.set(False)
             self.strategic_role_paint_active.set(False)
+            self.path_tool_active.set(False)
             if self.map_canvas:
                 self.map_canvas.set_paint_mode(False)
                 self.map_canvas.set_strategic_role_paint_mode(False)
@@ -455,18 +555,73 @@ class MainWindow:
         if is_active:
             self.paint_tool_active.set(False)
             self.faction_paint_active.set(False)
+            self.path_tool_active.set(False)
             if self.map_canvas:
                 self.map_canvas.set_paint_mode(False)
                 self.map_canvas.set_faction_paint_mode(False)
     
+    def _toggle_bucket_fill(self):
+        """Schaltet zwischen Pinsel und Bucket-Fill um"""
+        if self.map_canvas:
+            self.map_canvas.set_bucket_fill(self.bucket_fill_active.get())
+    
+    def _toggle_path_tool(self):
+        """Schaltet das Path-Tool an/aus (deaktiviert die Mal-Werkzeuge)"""
+        self.path_start = None
+        if not self.path_tool_active.get():
+            self.set_status("Path tool off")
+            return
+        
+        self.paint_tool_active.set(False)
+        self.faction_paint_active.set(False)
+        self.strategic_role_paint_active.set(False)
+        if self.map_canvas:
+            self.map_canvas.set_paint_mode(False)
+            self.map_canvas.set_faction_paint_mode(False)
+            self.map_canvas.set_strategic_role_paint_mode(False)
+        self.set_status("Path tool: click the start tile")
+    
+    def _show_headquarter_distances(self):
+        """Zeigt die Bewegungskosten vom nächsten Headquarter als Overlay an (läuft im Hintergrund)"""
+        if self.on_show_distances:
+            self.on_show_distances()
+    
+    def _clear_overlay(self):
+        """Entfernt das Wegfindungs-Overlay"""
+        self.path_start = None
+        if self.map_canvas:
+            self.map_canvas.clear_overlay()
+    
+    def _validate_map(self):
+        """Prüft die ganze Karte und zeigt das Ergebnis in der Statusleiste"""
+        if not self.map_canvas:
+            return
+        issues = self.map_canvas.validate_map()
+        if issues:
+            self.set_status("Validation: " + "; ".join(issue.message for issue in issues))
+        else:
+            self.set_status("Validation: no issues found")
+    
+    def _toggle_issue_overlay(self):
+        """Schaltet die Hervorhebung fehlerhafter Tiles an/aus"""
+        if self.map_canvas:
+            self.map_canvas.set_issue_overlay(self.issue_overlay_active.get())
+    
+    def update_issue_summary(self, issues):
+        """Zeigt die Anzahl der gefundenen Probleme in der Statusleiste an"""
+        if not issues:
+            self.issue_label.config(text="No issues")
+            return
+        tiles = sum(issue.count for issue in issues)
+        self.issue_label.config(text=f"{len(issues)} issues ({tiles} tiles)")
+    
     def _on_terrain_selected(self, event):
         """Terrain-Auswahl geändert"""
         terrain_name = self.selected_terrain_var.get()
-        areas = get_default_areas()
-        selected_terrain = next(
-            (area for area in areas if area.id == terrain_name),
-            areas[0] if areas else None
-        )
+        registry = self.grid_manager.grid.area_registry
+        selected_terrain = registry.get(terrain_name)
+        if selected_terrain is None and registry.areas:
+            selected_terrain = registry.areas[0]
         
         if selected_terrain:
             if self.map_canvas:
@@ -474,21 +629,13 @@ class MainWindow:
     
     def _on_faction_selected(self, event):
         """Faction-Auswahl geändert"""
-        faction_name = self.selected_faction_var.get()
-        faction = next(
-            (f for f in FactionType if f.value == faction_name),
-            FactionType.NEUTRAL
-        )
+        faction = AreaRegistry.faction(self.selected_faction_var.get())
         if self.map_canvas:
             self.map_canvas.set_selected_faction(faction)
     
     def _on_strategic_role_selected(self, event):
         """Strategic Role Auswahl geändert"""
-        role_name = self.selected_strategic_role_var.get()
-        role = next(
-            (r for r in StrategicRoleType if r.value == role_name),
-            StrategicRoleType.NONE
-        )
+        role = AreaRegistry.strategic_role(self.selected_strategic_role_var.get())
         if self.map_canvas:
             self.map_canvas.set_selected_strategic_role(role)
             
@@ -516,11 +663,63 @@ class MainWindow:
         if self.map_canvas:
             self.map_canvas.set_brush_size(brush_size)
     
+    def _undo(self):
+        """Macht den letzten Bearbeitungsschritt rückgängig"""
+        entry = self.grid_manager.undo()
+        if entry is None:
+            self.set_status("Nothing to undo")
+            return
+        if self.map_canvas:
+            self.map_canvas.recheck_entry(entry)
+        self._refresh_after_history()
+        self.set_status(f"Undo: {entry.label}")
+    
+    def _redo(self):
+        """Wiederholt den zuletzt rückgängig gemachten Schritt"""
+        entry = self.grid_manager.redo()
+        if entry is None:
+            self.set_status("Nothing to redo")
+            return
+        if self.map_canvas:
+            self.map_canvas.recheck_entry(entry)
+        self._refresh_after_history()
+        self.set_status(f"Redo: {entry.label}")
+    
+    def _refresh_after_history(self):
+        """Aktualisiert Karte und Tile-Editor nach Undo/Redo"""
+        if self.map_canvas:
+            self.map_canvas.render_map()
+        if self.selected_tile:
+            self.select_tile_for_editing(self.selected_tile)
+    
+    def _toggle_profiling(self):
+        """Schaltet das Performance-Overlay an/aus"""
+        if self.map_canvas:
+            self.map_canvas.set_profiling(self.profiling_active.get())
+        else:
+            PROFILER.enable(self.profiling_active.get())
+    
+    def _save_performance_report(self):
+        """Speichert die gesammelten Laufzeiten als Text- oder JSON-Report"""
+        file_path = file_dialogs.ask_save_report_path()
+        if not file_path:
+            return
+        try:
+            PROFILER.dump(file_path)
+            self.set_status(f"Performance report saved to {file_path}")
+        except OSError as e:
+            file_dialogs.show_error("Report Error", f"Failed to save report:\n{str(e)}")
+    
     def _new_grid(self):
         """Erstellt ein neues Grid"""
         if self.on_new_grid:
             self.on_new_grid()
     
+    def _generate_map(self):
+        """Erstellt ein Grid mit generiertem Terrain"""
+        if self.on_generate:
+            self.on_generate()
+    
     def update_grid_info(self):
         """Aktualisiert Grid-Info"""
         self.grid_info_label.config(
@@ -539,6 +738,38 @@ class MainWindow:
         """Setzt Statusleiste"""
         self.status_label.config(text=text)
     
+    def show_progress(self, text: str):
+        """Zeigt Fortschrittsbalken und Cancel-Button für einen Hintergrund-Task"""
+        self.progress_var.set(0.0)
+        self.cancel_task_button.config(state=tk.NORMAL)
+        self.cancel_task_button.pack(side=tk.RIGHT)
+        self.progress_bar.pack(side=tk.RIGHT, padx=2)
+        self.set_status(text)
+    
+    def update_progress(self, fraction: float, text: Optional[str] = None):
+        """
+        Aktualisiert den Fortschrittsbalken
+        
+        Args:
+            fraction: Anteil 0.0 - 1.0
+            text: Neuer Status-Text oder None
+        """
+        self.progress_var.set(fraction)
+        if text is not None:
+            self.set_status(text)
+    
+    def hide_progress(self):
+        """Versteckt Fortschrittsbalken und Cancel-Button"""
+        self.progress_bar.pack_forget()
+        self.cancel_task_button.pack_forget()
+    
+    def _cancel_task(self):
+        """Bricht den laufenden Hintergrund-Task ab"""
+        self.cancel_task_button.config(state=tk.DISABLED)
+        self.set_status("Cancelling...")
+        if self.on_cancel_task:
+            self.on_cancel_task()
+    
     def post_init_setup(self):
         """Post-Initialisierung Setup"""
         # Initial Terrain und Faction setzen
@@ -590,41 +821,41 @@ class MainWindow:
         if not self.selected_tile:
             return
         
-        # Area/Terrain ändern
-        area_name = self.tile_editor_vars['area'].get()
-        areas = get_default_areas()
-        selected_area = next(
-            (area for area in areas if area.display_name == area_name),
-            None
-        )
-        if selected_area:
-            self.selected_tile.area = selected_area
+        registry = self.grid_manager.grid.area_registry
         
-        # Is Land ändern
-        self.selected_tile.is_land = self.tile_editor_vars['is_land'].get()
+        # Area/Terrain
+        area_name = self.tile_editor_vars['area'].get()
+        selected_area = registry.get_by_display_name(area_name)
         
-        # Faction ändern
-        faction_name = self.tile_editor_vars['faction'].get()
-        faction = next(
-            (f for f in FactionType if f.value == faction_name),
-            FactionType.NEUTRAL
-        )
-        self.selected_tile.faction = faction
+        # Faction und Strategic Role
+        faction = registry.faction(self.tile_editor_vars['faction'].get())
+        role = registry.strategic_role(self.tile_editor_vars['strategic_role'].get())
         
-        # Strategic Role ändern
-        role_name = self.tile_editor_vars['strategic_role'].get()
-        role = next(
-            (r for r in StrategicRoleType if r.value == role_name),
-            StrategicRoleType.NONE
-        )
-        self.selected_tile.strategic_role = role        
-        # Production aktualisieren (nur für production-fähige Rollen)
+        # Production nur für production-fähige Rollen
         if role.value in ["firepower", "mobility", "intel"]:
-            self.selected_tile.production = self.tile_editor_vars['production'].get()
+            production = self.tile_editor_vars['production'].get()
         else:
-            self.selected_tile.production = 0        
-        # Karte neu rendern
+            production = 0
+        
+        # Alle Änderungen als ein Undo-Schritt anwenden
+        coords = self.selected_tile.coordinates
+        applied = self.grid_manager.apply_tile_changes(
+            coords[0], coords[1],
+            area=selected_area,
+            is_land=self.tile_editor_vars['is_land'].get(),
+            faction=faction,
+            strategic_role=role,
+            production=production
+        )
+        if not applied:
+            # Auswahl gehört zu einem ersetzten Grid
+            self.select_tile_for_editing(None)
+            self.set_status(f"Tile ({coords[0]}, {coords[1]}) is no longer on the map")
+            return
+        
+        # Karte neu rendern und das Tile neu prüfen
         if self.map_canvas:
+            self.map_canvas.recheck_tiles([coords[1] * self.grid_manager.grid.width + coords[0]])
             self.map_canvas.render_map()
         
         # Button-Text zurücksetzen
@@ -4,13 +4,27 @@ Zeigt Hex-Grid an mit Zoom und Pan-Funktionalität
 """
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional, Tuple, Callable, List
-import math
+from typing import Optional, Tuple, Callable, Iterator, List
+import time
 
 from data.grid_manager import GridManager
-from data.models import Tile
-from utils.hex_math import HexMath
+from data.models import Tile, FACTIONS, STRATEGIC_ROLES
+from data.paint_stroke import LAYER_AREA, LAYER_FACTION, LAYER_STRATEGIC_ROLE
+from data.validation import MapValidator, ValidationIssue
+from ui.hex_renderer import HexRenderer
+from ui.chunk_cache import ChunkCache, CHUNK_SIZE
+from ui.path_overlay import PathOverlay
+from ui.issue_overlay import IssueOverlay
 from utils.hex_math import HexMath
+from utils.hex_geometry import HexGeometry, VisibleRange
+from utils.profiling import PROFILER, timed
+
+
+# Größte Pinselgröße (Radius + 1)
+MAX_BRUSH_SIZE = 101
+
+# Mindestabstand zweier geplanter Renders in Millisekunden (~60 FPS)
+FRAME_BUDGET_MS = 16
 
 
 class MapCanvas:
@@ -35,16 +49,27 @@ class MapCanvas:
             height=600
         )
         
-        # Hex-Darstellungsparameter
+        # Hex-Darstellungsparameter: hex_size ist die Welt-Größe eines Hex,
+        # die Bildschirm-Größe ist hex_size * zoom_factor und liegt beim
+        # Zoomen zwischen lod_min_hex_size und max_hex_size
         self.hex_size = 15.0
         self.min_hex_size = 5.0
         self.max_hex_size = 50.0
         
+        # Level-of-Detail: unterhalb dieser Bildschirm-Größe (Pixel) werden
+        # gerasterte Chunks statt Polygone gezeigt; Zoom-Out ist dann bis
+        # lod_min_hex_size möglich
+        self.lod_hex_size = 6.0
+        self.lod_min_hex_size = 2.5
+        
         # Kamera/View Parameter
         self.view_x = 0.0
         self.view_y = 0.0
         self.zoom_factor = 1.0
         
+        # Gemeinsame Bildschirm-Transformation für Rendering und Hit-Testing
+        self.geometry = HexGeometry()
+        
         # Mouse-Tracking für Pan
         self.last_mouse_x = 0
         self.last_mouse_y = 0
@@ -71,11 +96,50 @@ class MapCanvas:
         # Brush Size
         self.brush_size = 1
         
+        # Bucket-Tool: Klick füllt die zusammenhängende Region des aktiven Werkzeugs
+        self.bucket_fill = False
+        self.is_filling = False
+        
+        # Aktueller Pinselstrich; geänderte Tiles werden gesammelt und
+        # einmal pro Idle-Zyklus neu gezeichnet
+        self.paint_stroke = None
+        self.pending_paint_indices: List[int] = []
+        self.paint_redraw_pending = False
+        
+        # Retained-Mode Renderer (Canvas-Items werden wiederverwendet)
+        self.renderer = HexRenderer(self.canvas)
+        self.chunk_cache = ChunkCache(self.canvas)
+        self.debug_text_id = None
+        
+        # Overlay für Wegfindung (Pfad bzw. Distanz-Feld)
+        self.path_overlay = PathOverlay(self.canvas)
+        
+        # Karten-Prüfung: vollständig beim Laden, danach nur geänderte Tiles
+        self.validator = MapValidator(grid_manager)
+        self.issue_overlay = IssueOverlay(self.canvas)
+        
+        # Sichtbarer Hex-Bereich des letzten Renders (für Debug-Info)
+        self.visible_range: Optional[VisibleRange] = None
+        
+        # Render-Scheduler: Eingaben markieren die Ansicht nur als veraltet,
+        # gerendert wird höchstens einmal pro FRAME_BUDGET_MS
+        self.camera_dirty = False
+        self.tiles_dirty = False
+        self.render_job = None
+        self.last_render_time = 0.0
+        
         # Callbacks
         self.on_tile_hover: Optional[Callable[[Optional[Tile]], None]] = None
         self.on_tile_click: Optional[Callable[[Tile], None]] = None
         self.on_tile_paint: Optional[Callable[[Tile, any], None]] = None
         self.on_faction_paint: Optional[Callable[[Tile, any], None]] = None
+        self.on_strategic_role_paint: Optional[Callable[[Tile, any], None]] = None
+        self.on_region_fill: Optional[Callable[[Tile, any], None]] = None
+        # Nach jedem Render (tiles_changed) bzw. nach dem Neuzeichnen gemalter Tiles
+        self.on_render: Optional[Callable[[bool], None]] = None
+        self.on_tiles_redrawn: Optional[Callable[[List[int]], None]] = None
+        # Nach jeder (vollständigen oder inkrementellen) Prüfung
+        self.on_validation: Optional[Callable[[List[ValidationIssue]], None]] = None
         
         # Event-Bindings
         self._bind_events()
@@ -115,24 +179,31 @@ class MapCanvas:
         # Focus setzen
         self.canvas.focus_set()
         
+        # Bucket-Tool: ein Klick füllt die Region, kein Pinselstrich
+        if self.bucket_fill and self._fill_region_at(event.x, event.y):
+            return
+        
         # Paint-Mode aktivieren wenn Pinsel aktiv
         if self.paint_mode and self.selected_terrain:
             self.is_painting = True
+            self.paint_stroke = self.grid_manager.begin_paint_stroke(LAYER_AREA, self.selected_terrain)
             tile = self._get_tile_at_pixel(event.x, event.y)
             if tile:
-                self._paint_tile(tile)
+                self._paint_stroke_to(tile)
                 self.last_painted_tile = tile
         elif self.faction_paint_mode and self.selected_faction:
             self.is_faction_painting = True
+            self.paint_stroke = self.grid_manager.begin_paint_stroke(LAYER_FACTION, self.selected_faction)
             tile = self._get_tile_at_pixel(event.x, event.y)
             if tile:
-                self._paint_faction(tile)
+                self._paint_stroke_to(tile)
                 self.last_faction_painted_tile = tile
         elif self.strategic_role_paint_mode and self.selected_strategic_role:
             self.is_strategic_role_painting = True
+            self.paint_stroke = self.grid_manager.begin_paint_stroke(LAYER_STRATEGIC_ROLE, self.selected_strategic_role)
             tile = self._get_tile_at_pixel(event.x, event.y)
             if tile:
-                self._paint_strategic_role(tile)
+                self._paint_stroke_to(tile)
                 self.last_strategic_role_painted_tile = tile
         
         # Click wird in mouse_up behandelt für saubere Trennung
@@ -150,21 +221,21 @@ class MapCanvas:
             # Paint-Mode: Male über alle Tiles die der Cursor berührt
             tile = self._get_tile_at_pixel(event.x, event.y)
             if tile and tile != self.last_painted_tile:
-                self._paint_tile(tile)
+                self._paint_stroke_to(tile)
                 self.last_painted_tile = tile
         elif self.is_faction_painting and self.faction_paint_mode and self.selected_faction:
             # Faction-Paint-Mode: Male Fraktionen über alle Tiles
             tile = self._get_tile_at_pixel(event.x, event.y)
             if tile and tile != self.last_faction_painted_tile:
-                self._paint_faction(tile)
+                self._paint_stroke_to(tile)
                 self.last_faction_painted_tile = tile
         elif self.is_strategic_role_painting and self.strategic_role_paint_mode and self.selected_strategic_role:
             # Strategic Role Paint Mode: Male strategische Rollen über alle Tiles
             tile = self._get_tile_at_pixel(event.x, event.y)
             if tile and tile != self.last_strategic_role_painted_tile:
-                self._paint_strategic_role(tile)
+                self._paint_stroke_to(tile)
                 self.last_strategic_role_painted_tile = tile
-        elif self.is_dragging and not self.is_painting and not self.is_faction_painting and not self.is_strategic_role_painting:
+        elif self.is_dragging and not self.is_painting and not self.is_faction_painting and not self.is_strategic_role_painting and not self.is_filling:
             # Normal Pan-Mode
             dx = event.x - self.last_mouse_x
             dy = event.y - self.last_mouse_y
@@ -176,7 +247,7 @@ class MapCanvas:
             self.last_mouse_x = event.x
             self.last_mouse_y = event.y
             
-            self.render_map()
+            self.request_render(tiles_changed=False)
     
     def _on_mouse_up(self, event):
         """Mouse-Button losgelassen"""
@@ -184,17 +255,20 @@ class MapCanvas:
         was_painting = self.is_painting
         was_faction_painting = self.is_faction_painting
         was_strategic_role_painting = self.is_strategic_role_painting
+        was_filling = self.is_filling
         
         self.is_dragging = False
+        self.is_filling = False
         self.is_painting = False
         self.is_faction_painting = False
         self.is_strategic_role_painting = False
+        self._end_paint_stroke()
         self.last_painted_tile = None
         self.last_faction_painted_tile = None
         self.last_strategic_role_painted_tile = None
         
         # Wenn nicht gedragt und nicht gemalt wurde, als Click behandeln
-        if not was_dragging and not was_painting and not was_faction_painting and not was_strategic_role_painting:
+        if not was_dragging and not was_painting and not was_faction_painting and not was_strategic_role_painting and not was_filling:
             tile = self._get_tile_at_pixel(event.x, event.y)
             if tile and self.on_tile_click:
                 self.on_tile_click(tile)
@@ -215,17 +289,17 @@ class MapCanvas:
         world_x = (mouse_x / self.zoom_factor) + self.view_x
         world_y = (mouse_y / self.zoom_factor) + self.view_y
         
-        # Neuen Zoom-Faktor anwenden (mit Limits)
-        new_hex_size = self.hex_size * zoom_delta
-        if self.min_hex_size <= new_hex_size <= self.max_hex_size:
-            self.hex_size = new_hex_size
+        # Neuen Zoom-Faktor anwenden (Limits gelten für die Bildschirm-Größe)
+        new_screen_size = self.hex_size * self.zoom_factor * zoom_delta
+        if self.lod_min_hex_size <= new_screen_size <= self.max_hex_size:
             self.zoom_factor *= zoom_delta
             
             # View anpassen um Mouse-Position stabil zu halten
             self.view_x = world_x - (mouse_x / self.zoom_factor)
             self.view_y = world_y - (mouse_y / self.zoom_factor)
             
-            self.render_map()
+            # Mehrere Wheel-Ticks werden zu einem Render auf der letzten Zoom-Stufe
+            self.request_render(tiles_changed=False)
     
     def _on_mouse_motion(self, event):
         """Mouse-Motion für Hover"""
@@ -249,10 +323,13 @@ class MapCanvas:
             self.view_x += pan_speed
         elif event.keysym == 'r':  # Reset View
             self.reset_view()
+        elif event.keysym == 'p':  # Performance-Overlay
+            self.set_profiling(not PROFILER.enabled)
+            return
         else:
             return
         
-        self.render_map()
+        self.request_render(tiles_changed=False)
     
     def _get_tile_at_pixel(self, pixel_x: int, pixel_y: int) -> Optional[Tile]:
         """
@@ -265,20 +342,95 @@ class MapCanvas:
         Returns:
             Tile oder None
         """
-        # Pixel zu Welt-Koordinaten
-        world_x = (pixel_x / self.zoom_factor) + self.view_x
-        world_y = (pixel_y / self.zoom_factor) + self.view_y
-        
-        # Welt zu Hex-Koordinaten
-        hex_x, hex_y = HexMath.pixel_to_hex(world_x, world_y, self.hex_size)
+        # Gleiche Transformation wie beim Rendering
+        with PROFILER.section("hit_test"):
+            hex_x, hex_y = self._update_geometry().pixel_to_hex(pixel_x, pixel_y)
         
         return self.grid_manager.get_tile_at(hex_x, hex_y)
     
-    def render_map(self):
-        """Rendert die komplette Hex-Karte"""
-        # Canvas löschen
-        self.canvas.delete("all")
+    def _update_geometry(self) -> HexGeometry:
+        """
+        Aktualisiert die Bildschirm-Transformation aus Kamera und Hex-Größe
+        
+        Bildschirm = Einheits-Hex * (hex_size * zoom) - view * zoom. Die
+        gecachte Geometrie wird nur bei geänderter Skalierung neu berechnet.
+        
+        Returns:
+            Die aktuelle HexGeometry
+        """
+        self.geometry.update(
+            self.hex_size * self.zoom_factor,
+            -self.view_x * self.zoom_factor,
+            -self.view_y * self.zoom_factor
+        )
+        grid = self.grid_manager.grid
+        self.geometry.ensure_size(grid.width, grid.height)
+        return self.geometry
+    
+    def render_map(self, tiles_changed: bool = True):
+        """
+        Rendert die Hex-Karte
+        
+        Bestehende Canvas-Items werden wiederverwendet: Kamera-Änderungen
+        verschieben sie, nur Hexes am Rand des Sichtbereichs werden neu
+        erzeugt oder gelöscht.
+        
+        Args:
+            tiles_changed: False wenn sich nur die Kamera bewegt hat
+        """
+        # Ein direkter Render erledigt auch alle geplanten Änderungen
+        if self.render_job is not None:
+            self.canvas.after_cancel(self.render_job)
+            self.render_job = None
+        tiles_changed = tiles_changed or self.tiles_dirty
+        self.tiles_dirty = False
+        self.camera_dirty = False
+        
+        rendered = self._render_frame(tiles_changed)
         
+        # Grid-Info anzeigen
+        if rendered:
+            self._render_debug_info()
+            if self.on_render:
+                self.on_render(tiles_changed)
+        self.last_render_time = time.perf_counter()
+    
+    def request_render(self, tiles_changed: bool = True):
+        """
+        Markiert die Ansicht als veraltet und plant einen Render ein
+        
+        Beliebig viele Anforderungen innerhalb eines Frames werden zu einem
+        Render zusammengefasst. Reine Kamera-Änderungen nehmen den günstigen
+        Pfad ohne Prüfung der Tile-Daten.
+        
+        Args:
+            tiles_changed: False wenn sich nur die Kamera bewegt hat
+        """
+        if tiles_changed:
+            self.tiles_dirty = True
+        else:
+            self.camera_dirty = True
+        PROFILER.count("render.requests")
+        
+        if self.render_job is None:
+            elapsed_ms = (time.perf_counter() - self.last_render_time) * 1000.0
+            delay = max(0, int(FRAME_BUDGET_MS - elapsed_ms))
+            self.render_job = self.canvas.after(delay, self._render_scheduled)
+    
+    def _render_scheduled(self):
+        """Führt den geplanten Render aus"""
+        self.render_job = None
+        if self.camera_dirty or self.tiles_dirty:
+            self.render_map(tiles_changed=self.tiles_dirty)
+    
+    @timed("render")
+    def _render_frame(self, tiles_changed: bool) -> bool:
+        """
+        Aktualisiert die Canvas-Items für die aktuelle Kamera
+        
+        Returns:
+            False wenn das Canvas noch keine Größe hat
+        """
         # Canvas-Größe aktualisieren
         self.canvas.update_idletasks()
         canvas_width = self.canvas.winfo_width()
@@ -287,199 +439,130 @@ class MapCanvas:
         if canvas_width <= 1 or canvas_height <= 1:
             # Canvas noch nicht initialisiert - versuche es später nochmal
             self.canvas.after(100, self.render_map)
-            return
+            return False
         
-        # Sichtbare Hex-Bereiche berechnen
-        visible_hexes = self._get_visible_hexes(canvas_width, canvas_height)
+        geometry = self._update_geometry()
         
-        # Performance-Info (nur bei sehr großen Listen)
-        if len(visible_hexes) > 1000:
-            print(f"Rendering {len(visible_hexes)} hexes (large grid optimization active)")
+        # Sichtbaren Hex-Bereich aus derselben Transformation berechnen
+        visible_range = self._get_visible_range(canvas_width, canvas_height)
+        self.visible_range = visible_range
         
-        # Alle sichtbaren Hexagone rendern
-        for hex_x, hex_y in visible_hexes:
-            tile = self.grid_manager.get_tile_at(hex_x, hex_y)
-            if tile:
-                self._render_hex(hex_x, hex_y, tile)
+        if tiles_changed:
+            self.chunk_cache.invalidate_all()
         
-        # Grid-Info anzeigen
-        self._render_debug_info()
+        if self.is_lod_active():
+            # Weit herausgezoomt: gerasterte Chunks statt Polygone
+            self.renderer.clear()
+            hits, misses = self.chunk_cache.hits, self.chunk_cache.misses
+            self.chunk_cache.render(self.grid_manager.grid, geometry.scale,
+                                    geometry.offset_x, geometry.offset_y, visible_range)
+            PROFILER.count("chunk_cache.hits", self.chunk_cache.hits - hits)
+            PROFILER.count("chunk_cache.misses", self.chunk_cache.misses - misses)
+        else:
+            self.chunk_cache.clear_items()
+            self.renderer.render(
+                self.grid_manager.grid,
+                geometry,
+                visible_range,
+                tiles_changed=tiles_changed
+            )
+            PROFILER.count("render.items_created", self.renderer.items_created)
+            PROFILER.count("render.items_deleted", self.renderer.items_deleted)
+        
+        self._render_issues()
+        self.path_overlay.render(self.grid_manager.grid, geometry, visible_range)
+        return True
     
-    def _get_visible_hexes(self, canvas_width: int, canvas_height: int) -> list[Tuple[int, int]]:
+    def is_lod_active(self) -> bool:
+        """True wenn die Karte als gerasterte Chunks dargestellt wird"""
+        return self.hex_size * self.zoom_factor < self.lod_hex_size
+    
+    @timed("render.visible_range")
+    def _get_visible_range(self, canvas_width: int, canvas_height: int) -> Optional[VisibleRange]:
         """
-        Berechnet welche Hexagone sichtbar sind (optimiert für große Grids)
+        Berechnet den exakt sichtbaren Hex-Bereich
+        
+        Nutzt dieselbe Bildschirm-Transformation wie Rendering und
+        Hit-Testing; der Aufwand ist unabhängig von der Grid-Größe.
         
         Args:
             canvas_width: Canvas-Breite
             canvas_height: Canvas-Höhe
             
         Returns:
-            Liste von (hex_x, hex_y) Tupeln
+            VisibleRange oder None wenn nichts sichtbar ist
         """
-        visible_hexes = []
-        
-        # Berechne den sichtbaren Weltbereich
-        world_left = self.view_x
-        world_right = self.view_x + (canvas_width / self.zoom_factor)
-        world_top = self.view_y
-        world_bottom = self.view_y + (canvas_height / self.zoom_factor)
-        
-        # Hex-Größe für Berechnungen
-        hex_world_size = self.hex_size * 1.2  # Etwas Puffer
-        
-        # Grobe Schätzung des sichtbaren Hex-Bereichs
-        # Verwende Hex-Layout Formeln um Grenzen zu finden
-        left_hex_x = int((world_left / (self.hex_size * 3.0 / 2.0)) - 2)
-        right_hex_x = int((world_right / (self.hex_size * 3.0 / 2.0)) + 2)
-        top_hex_y = int((world_top / (self.hex_size * math.sqrt(3.0))) - 2)
-        bottom_hex_y = int((world_bottom / (self.hex_size * math.sqrt(3.0))) + 2)
-        
-        # Grid-Grenzen einhalten
-        min_x, min_y, max_x, max_y = self.grid_manager.get_grid_bounds()
-        left_hex_x = max(min_x, left_hex_x)
-        right_hex_x = min(max_x, right_hex_x)
-        top_hex_y = max(min_y, top_hex_y)
-        bottom_hex_y = min(max_y, bottom_hex_y)
-        
-        # Nur die Tiles im sichtbaren Bereich prüfen (nicht das ganze Grid!)
-        for y in range(top_hex_y, bottom_hex_y + 1):
-            for x in range(left_hex_x, right_hex_x + 1):
-                if 0 <= x < self.grid_manager.grid.width and 0 <= y < self.grid_manager.grid.height:
-                    visible_hexes.append((x, y))
-        
-        return visible_hexes
-    
-    def _get_tiles_in_brush(self, center_coord):
-        """Gibt eine Liste von Tile-Koordinaten im Pinsel-Bereich zurück"""
-        if self.brush_size <= 1:
-            return [center_coord]
-        
-        from ..utils.hex_math import get_hex_neighbors_in_radius
-        return get_hex_neighbors_in_radius(center_coord, self.brush_size - 1)
-    
-    def _render_hex(self, hex_x: int, hex_y: int, tile: Tile):
+        grid = self.grid_manager.grid
+        return self._update_geometry().visible_range(canvas_width, canvas_height,
+                                                     grid.width, grid.height)
+    
+    def _get_visible_hexes(self, canvas_width: int, canvas_height: int) -> Iterator[Tuple[int, int]]:
         """
-        Rendert ein einzelnes Hexagon
+        Iteriert über die sichtbaren Hexagone (ohne Liste aufzubauen)
         
         Args:
-            hex_x: Hex X-Koordinate
-            hex_y: Hex Y-Koordinate
-            tile: Tile-Objekt
-        """
-        # Hex-Position in Welt-Koordinaten
-        world_x, world_y = HexMath.hex_to_pixel(hex_x, hex_y, self.hex_size)
-        
-        # Welt zu Screen-Koordinaten
-        screen_x = (world_x - self.view_x) * self.zoom_factor
-        screen_y = (world_y - self.view_y) * self.zoom_factor
-        
-        # Hex-Eckpunkte berechnen
-        hex_vertices = HexMath.get_hex_vertices(screen_x, screen_y, self.hex_size * self.zoom_factor)
-        
-        # Flache Liste für tkinter
-        coords = []
-        for vx, vy in hex_vertices:
-            coords.extend([vx, vy])
-        
-        # Farbe bestimmen
-        fill_color = "#90c695"  # Standard grün
-        if tile.area:
-            fill_color = tile.area.color
-        
-        outline_color = "#404040"
-        line_width = 1
-        
-        # Hexagon zeichnen
-        self.canvas.create_polygon(
-            coords,
-            fill=fill_color,
-            outline=outline_color,
-            width=line_width,
-            tags=f"hex_{hex_x}_{hex_y}"
-        )
-        
-        # Faction-Rahmen zeichnen
-        if tile.faction.value != "neutral":
-            faction_colors = {
-                "blue": "#0066ff",
-                "red": "#ff0000",
-                "neutral": "#808080"
-            }
-            faction_color = faction_colors.get(tile.faction.value, "#808080")
-            faction_line_width = 3 if self.hex_size * self.zoom_factor > 15 else 2
-            
-            self.canvas.create_polygon(
-                coords,
-                fill="",  # Kein Fill, nur Rahmen
-                outline=faction_color,
-                width=faction_line_width,
-                tags=f"faction_{hex_x}_{hex_y}"
-            )
-        
-        # Strategic Role anzeigen (falls vorhanden)
-        if hasattr(tile, 'strategic_role') and tile.strategic_role:
-            role_text = ""
-            show_production = False
-            
-            if tile.strategic_role.value == "firepower":
-                role_text = "F"
-                show_production = True
-            elif tile.strategic_role.value == "mobility":
-                role_text = "M"
-                show_production = True
-            elif tile.strategic_role.value == "intel":
-                role_text = "I"
-                show_production = True
-            elif tile.strategic_role.value == "railway":
-                role_text = "H"
-            elif tile.strategic_role.value == "logistic_hub":
-                role_text = "L"
-            elif tile.strategic_role.value == "headquarter":
-                role_text = "Hq"
+            canvas_width: Canvas-Breite
+            canvas_height: Canvas-Höhe
             
-            if role_text and self.hex_size * self.zoom_factor > 10:
-                # Strategic Role Text zentriert anzeigen
-                font_size = max(8, min(16, int(self.hex_size * self.zoom_factor * 0.4)))
-                
-                # Für production-fähige Rollen: Zeige Rolle + Produktionswert
-                if show_production and hasattr(tile, 'production') and tile.production > 0:
-                    display_text = f"{role_text}{tile.production}"
-                else:
-                    display_text = role_text
-                
-                self.canvas.create_text(
-                    screen_x, screen_y,
-                    text=display_text,
-                    fill="white",
-                    font=("Arial", font_size, "bold"),
-                    tags=f"role_{hex_x}_{hex_y}"
-                )
-        
-        # Koordinaten anzeigen (nur bei sehr großen Hexagonen und wenn keine Strategic Role)
-        elif self.hex_size * self.zoom_factor > 25:
-            self.canvas.create_text(
-                screen_x, screen_y + self.hex_size * self.zoom_factor * 0.3,
-                text=f"{hex_x},{hex_y}",
-                fill="black",
-                font=("Arial", 8)
-            )
+        Returns:
+            Iterator über (hex_x, hex_y) Tupel
+        """
+        visible_range = self._get_visible_range(canvas_width, canvas_height)
+        if visible_range is None:
+            return iter(())
+        return visible_range.tiles()
     
     def _render_debug_info(self):
         """Rendert Debug-Informationen"""
-        # Berechne sichtbare Tiles für Performance-Info
-        canvas_width = self.canvas.winfo_width() or 800
-        canvas_height = self.canvas.winfo_height() or 600
-        visible_count = len(self._get_visible_hexes(canvas_width, canvas_height))
+        # Sichtbare Tiles aus dem Bereich des letzten Renders
+        visible_count = 0
+        if self.visible_range is not None:
+            visible_count = self.visible_range.tile_count()
         total_tiles = self.grid_manager.grid.width * self.grid_manager.grid.height
         
-        info_text = f"Zoom: {self.zoom_factor:.2f} | Hex Size: {self.hex_size:.1f} | View: ({self.view_x:.1f}, {self.view_y:.1f})\nVisible: {visible_count}/{total_tiles} tiles"
-        self.canvas.create_text(
-            10, 10,
-            text=info_text,
-            fill="white",
-            anchor="nw",
-            font=("Arial", 9)
-        )
+        info_text = f"Zoom: {self.zoom_factor:.2f} | Hex Size: {self.hex_size * self.zoom_factor:.1f} | View: ({self.view_x:.1f}, {self.view_y:.1f})\nVisible: {visible_count}/{total_tiles} tiles"
+        if PROFILER.enabled:
+            info_text += "\n" + self._profiling_text()
+        if self.debug_text_id is None:
+            self.debug_text_id = self.canvas.create_text(
+                10, 10,
+                text=info_text,
+                fill="white",
+                anchor="nw",
+                font=("Arial", 9)
+            )
+        else:
+            self.canvas.itemconfigure(self.debug_text_id, text=info_text)
+            self.canvas.tag_raise(self.debug_text_id)
+    
+    def _profiling_text(self) -> str:
+        """Zeilen des Performance-Overlays (Frame-Zeit, Items, Cache-Trefferquote)"""
+        def timing(name: str) -> str:
+            stats = PROFILER.stats(name)
+            if stats is None:
+                return "-"
+            return f"p50 {stats.percentile(0.5) * 1000:.1f} / p95 {stats.percentile(0.95) * 1000:.1f} ms"
+        
+        frame = PROFILER.stats("render")
+        frame_ms = frame.last * 1000 if frame else 0.0
+        hit_rate = PROFILER.ratio("chunk_cache.hits", "chunk_cache.misses")
+        cache_text = "-" if hit_rate is None else f"{hit_rate:.0%}"
+        if self.is_lod_active():
+            items_text = f"Chunks: {len(self.chunk_cache.displayed)} shown, {len(self.chunk_cache.images)} cached"
+        else:
+            items_text = (f"Items: +{self.renderer.items_created} -{self.renderer.items_deleted} "
+                          f"({len(self.renderer.items)} hexes pooled)")
+        return "\n".join((
+            f"Frame: {frame_ms:.1f} ms | {timing('render')}",
+            f"Visible range: {timing('render.visible_range')} | Hit test: {timing('hit_test')}",
+            f"Paint: {timing('paint')} | Redraw: {timing('paint.redraw')} | Recheck: {timing('validate.recheck')}",
+            f"{items_text} | Chunk cache hits: {cache_text}",
+        ))
+    
+    def set_profiling(self, enabled: bool):
+        """Schaltet Laufzeit-Messung und Performance-Overlay an/aus"""
+        PROFILER.enable(enabled)
+        self._render_debug_info()
     
     def reset_view(self):
         """Setzt die Ansicht zurück"""
@@ -492,8 +575,6 @@ class MapCanvas:
         """Setzt die Hex-Größe für das Canvas"""
         if self.min_hex_size <= new_hex_size <= self.max_hex_size:
             self.hex_size = new_hex_size
-            # Optional: View neu rendern um die Änderung sofort zu zeigen
-            self.render_map()
         self.render_map()
     
     def center_on_grid(self):
@@ -515,6 +596,81 @@ class MapCanvas:
         
         self.render_map()
     
+    def center_on_hex(self, hex_x: int, hex_y: int):
+        """Zentriert die Ansicht auf ein Hex (z.B. Klick in die Minimap)"""
+        world_x, world_y = HexMath.hex_to_pixel(hex_x, hex_y, self.hex_size)
+        self.view_x = world_x - (self.canvas.winfo_width() / 2.0) / self.zoom_factor
+        self.view_y = world_y - (self.canvas.winfo_height() / 2.0) / self.zoom_factor
+        self.request_render(tiles_changed=False)
+    
+    def set_path_overlay(self, path: List[int]):
+        """Zeigt einen Pfad (Tile-Indizes) über der Karte an"""
+        self.path_overlay.set_path(self.grid_manager.grid, path)
+        self.request_render(tiles_changed=False)
+    
+    def set_distance_overlay(self, distances):
+        """Zeigt ein Distanz-Feld (siehe data.pathfinding.distance_field) über der Karte an"""
+        self.path_overlay.set_distance_field(self.grid_manager.grid, distances)
+        self.request_render(tiles_changed=False)
+    
+    def clear_overlay(self):
+        """Entfernt Pfad und Distanz-Feld"""
+        self.path_overlay.clear()
+        self.request_render(tiles_changed=False)
+    
+    def validate_map(self) -> List[ValidationIssue]:
+        """Prüft die ganze Karte (nach Laden, neuem Grid oder vor dem Export)"""
+        issues = self.validator.validate()
+        self._after_validation(issues)
+        return issues
+    
+    def set_validator(self, validator: MapValidator) -> List[ValidationIssue]:
+        """
+        Übernimmt einen bereits geprüften Validator (z.B. aus einem Hintergrund-Task)
+        
+        Args:
+            validator: MapValidator, dessen Grid gerade im GridManager gesetzt wurde
+            
+        Returns:
+            Die Probleme der Prüfung
+        """
+        validator.grid_manager = self.grid_manager
+        self.validator = validator
+        issues = validator.issues()
+        self._after_validation(issues)
+        return issues
+    
+    def recheck_tiles(self, indices, columns=None) -> List[ValidationIssue]:
+        """Prüft nur geänderte Tiles neu (siehe MapValidator.recheck)"""
+        issues = self.validator.recheck(indices, columns)
+        self._after_validation(issues)
+        return issues
+    
+    def recheck_entry(self, entry) -> List[ValidationIssue]:
+        """Prüft die Tiles eines Undo-Schritts neu"""
+        issues = self.validator.recheck_entry(entry)
+        self._after_validation(issues)
+        return issues
+    
+    def _after_validation(self, issues: List[ValidationIssue]):
+        """Aktualisiert die Markierungen und meldet das Ergebnis"""
+        if self.visible_range is not None:
+            self._render_issues()
+        if self.on_validation:
+            self.on_validation(issues)
+    
+    def _render_issues(self):
+        """Umrandet die fehlerhaften Tiles im sichtbaren Bereich"""
+        flagged = None
+        if self.issue_overlay.enabled and self.validator.grid is not None:
+            flagged = self.validator.flagged_mask()
+        self.issue_overlay.render(self.grid_manager.grid, self.geometry, self.visible_range, flagged)
+    
+    def set_issue_overlay(self, enabled: bool):
+        """Schaltet die Hervorhebung fehlerhafter Tiles an/aus"""
+        self.issue_overlay.enabled = enabled
+        self._render_issues()
+    
     def get_widget(self) -> tk.Canvas:
         """Gibt das Canvas-Widget zurück"""
         return self.canvas
@@ -549,107 +705,165 @@ class MapCanvas:
         """Setzt die aktuell ausgewählte strategische Rolle für das Strategic Role Paint Tool"""
         self.selected_strategic_role = strategic_role
     
+    def set_bucket_fill(self, enabled: bool):
+        """Aktiviert oder deaktiviert das Bucket-Tool"""
+        self.bucket_fill = enabled
+    
+    def _active_paint_layer(self) -> Tuple[Optional[str], any]:
+        """(Mal-Ebene, Wert) des aktiven Werkzeugs oder (None, None)"""
+        if self.paint_mode and self.selected_terrain:
+            return LAYER_AREA, self.selected_terrain
+        if self.faction_paint_mode and self.selected_faction:
+            return LAYER_FACTION, self.selected_faction
+        if self.strategic_role_paint_mode and self.selected_strategic_role:
+            return LAYER_STRATEGIC_ROLE, self.selected_strategic_role
+        return None, None
+    
+    def _fill_region_at(self, pixel_x: int, pixel_y: int) -> bool:
+        """
+        Füllt die Region unter dem Cursor mit dem Wert des aktiven Werkzeugs
+        
+        Returns:
+            False wenn kein Mal-Werkzeug aktiv ist (Klick wird normal behandelt)
+        """
+        layer, value = self._active_paint_layer()
+        if layer is None:
+            return False
+        
+        self.is_filling = True
+        tile = self._get_tile_at_pixel(pixel_x, pixel_y)
+        if tile is None:
+            return True
+        
+        hex_x, hex_y = tile.coordinates
+        with PROFILER.section("fill"):
+            entry = self.grid_manager.fill_region(layer, value, hex_x, hex_y)
+        if entry is None:
+            return True
+        
+        # Eine Änderung, ein Redraw (nur betroffene Chunks und Hexes)
+        self.recheck_entry(entry)
+        self._redraw_entry(entry)
+        if self.on_region_fill:
+            self.on_region_fill(tile, entry)
+        return True
+    
     def set_brush_size(self, size: int):
         """Setzt die Pinselgröße"""
-        self.brush_size = max(1, int(size))
+        self.brush_size = max(1, min(MAX_BRUSH_SIZE, int(size)))
     
-    def _paint_tile(self, tile: Tile):
-        """Malt ein Tile oder Brush Area mit dem ausgewählten Terrain"""
-        if not self.selected_terrain:
+    def _paint_stroke_to(self, tile: Tile):
+        """Führt den aktuellen Pinselstrich bis zum Tile fort"""
+        if self.paint_stroke is None:
+            return
+        
+        # Linie seit der letzten Maus-Position inklusive Pinsel-Fläche malen
+        hex_x, hex_y = tile.coordinates
+        with PROFILER.section("paint"):
+            changed = self.paint_stroke.paint_to(hex_x, hex_y, self.brush_size - 1)
+        if not changed:
             return
-            
-        # Alle Tiles im Brush-Bereich finden
-        tiles_to_paint = self._get_tiles_in_brush(tile.coordinates[0], tile.coordinates[1])
-        painted_tiles = []
-        
-        for hex_x, hex_y in tiles_to_paint:
-            target_tile = self.grid_manager.get_tile_at(hex_x, hex_y)
-            if target_tile and target_tile.area != self.selected_terrain:
-                # Setze das neue Terrain
-                old_area = target_tile.area
-                target_tile.area = self.selected_terrain
-                
-                # Automatisch is_land basierend auf Terrain-Typ setzen
-                if self.selected_terrain.id == "water":
-                    target_tile.is_land = False
-                else:
-                    target_tile.is_land = True
-                
-                painted_tiles.append((target_tile, old_area))
-                
-                # Einzelnes Hex neu zeichnen für sofortiges visuelles Feedback
-                self._render_single_hex(hex_x, hex_y, target_tile)
         
-        # Callback für andere Komponenten (mit dem ersten Tile)
-        if painted_tiles and self.on_tile_paint:
-            first_tile, old_area = painted_tiles[0]
-            self.on_tile_paint(first_tile, old_area)
+        # Redraw gesammelt im nächsten Idle-Zyklus
+        self.pending_paint_indices.extend(changed)
+        if not self.paint_redraw_pending:
+            self.paint_redraw_pending = True
+            self.canvas.after_idle(self._flush_paint_redraw)
     
-    def _paint_faction(self, tile: Tile):
-        """Malt ein Tile oder Brush Area mit der ausgewählten Fraktion"""
-        if not self.selected_faction:
+    def _end_paint_stroke(self):
+        """Schließt den aktuellen Pinselstrich ab und nimmt ihn in den Undo-Verlauf auf"""
+        if self.paint_stroke is None:
             return
-            
-        # Alle Tiles im Brush-Bereich finden
-        tiles_to_paint = self._get_tiles_in_brush(tile.coordinates[0], tile.coordinates[1])
-        painted_tiles = []
-        
-        for hex_x, hex_y in tiles_to_paint:
-            target_tile = self.grid_manager.get_tile_at(hex_x, hex_y)
-            if target_tile and target_tile.faction != self.selected_faction:
-                # Setze die neue Fraktion
-                old_faction = target_tile.faction
-                target_tile.faction = self.selected_faction
-                
-                painted_tiles.append((target_tile, old_faction))
-                
-                # Einzelnes Hex neu zeichnen für sofortiges visuelles Feedback
-                self._render_single_hex(hex_x, hex_y, target_tile)
+        self._flush_paint_redraw()
+        self.grid_manager.commit_paint_stroke(self.paint_stroke)
+        self.paint_stroke = None
+    
+    def _flush_paint_redraw(self):
+        """Zeichnet alle seit dem letzten Flush gemalten Tiles neu und meldet sie einmal"""
+        self.paint_redraw_pending = False
+        indices = self.pending_paint_indices
+        if not indices:
+            return
+        self.pending_paint_indices = []
         
-        # Callback für andere Komponenten (mit dem ersten Tile)
-        if painted_tiles and self.on_faction_paint:
-            first_tile, old_faction = painted_tiles[0]
-            self.on_faction_paint(first_tile, old_faction)
+        self._redraw_tiles(indices)
+        self._notify_paint(indices[0])
     
-    def _paint_strategic_role(self, tile: Tile):
-        """Malt ein Tile oder Brush Area mit der ausgewählten strategischen Rolle"""
-        if not self.selected_strategic_role:
+    def _notify_paint(self, index: int):
+        """Ruft den Callback der Mal-Ebene mit einem Tile des Flushs und dessen altem Wert auf"""
+        stroke = self.paint_stroke
+        if stroke is None:
             return
-            
-        # Alle Tiles im Brush-Bereich finden
-        tiles_to_paint = self._get_tiles_in_brush(tile.coordinates[0], tile.coordinates[1])
-        painted_tiles = []
-        
-        for hex_x, hex_y in tiles_to_paint:
-            target_tile = self.grid_manager.get_tile_at(hex_x, hex_y)
-            if target_tile and target_tile.strategic_role != self.selected_strategic_role:
-                # Setze die neue strategische Rolle
-                old_strategic_role = target_tile.strategic_role
-                target_tile.strategic_role = self.selected_strategic_role
-                
-                painted_tiles.append((target_tile, old_strategic_role))
+        
+        old_code = stroke.old_values[index][0]
+        if stroke.layer == LAYER_AREA:
+            callback, old_value = self.on_tile_paint, self.grid_manager.grid.get_area(old_code)
+        elif stroke.layer == LAYER_FACTION:
+            callback, old_value = self.on_faction_paint, FACTIONS[old_code]
+        else:
+            callback, old_value = self.on_strategic_role_paint, STRATEGIC_ROLES[old_code]
+        
+        if callback:
+            hex_y, hex_x = divmod(index, self.grid_manager.grid.width)
+            callback(self.grid_manager.get_tile_at(hex_x, hex_y), old_value)
+    
+    @timed("paint.redraw")
+    def _redraw_tiles(self, indices: List[int]):
+        """Aktualisiert die Darstellung geänderter Tiles ohne komplettes Re-Render"""
+        width = self.grid_manager.grid.width
+        chunks = set()
+        for index in indices:
+            hex_y, hex_x = divmod(index, width)
+            # Bestehende Items des Hex werden nur umgestaltet
+            self.renderer.update_hex(hex_x, hex_y)
+            chunks.add((hex_x // CHUNK_SIZE, hex_y // CHUNK_SIZE))
+        
+        # Gerasterte Chunks verwerfen und einmal neu zeichnen
+        for chunk_x, chunk_y in chunks:
+            self.chunk_cache.invalidate_chunk(chunk_x, chunk_y)
+        if self.is_lod_active():
+            self.request_render(tiles_changed=False)
+        
+        if self.paint_stroke is not None:
+            self.recheck_tiles(indices, self.paint_stroke.column_names)
+        
+        if self.on_tiles_redrawn:
+            self.on_tiles_redrawn(indices)
+    
+    @timed("fill.redraw")
+    def _redraw_entry(self, entry):
+        """
+        Aktualisiert die Darstellung nach einem Undo-Schritt (z.B. Bucket-Fill)
+        
+        Arbeitet auf den Zeilen-Spannen der Runs statt auf einzelnen Tiles:
+        nur berührte Chunks werden verworfen, nur sichtbare Hexes umgestaltet.
+        
+        Args:
+            entry: data.history.HistoryEntry
+        """
+        width = self.grid_manager.grid.width
+        visible_range = self.visible_range
+        chunks = set()
+        for change in entry.changes:
+            for hex_y, x_start, x_end in change.row_spans(width):
+                chunk_y = hex_y // CHUNK_SIZE
+                for chunk_x in range(x_start // CHUNK_SIZE, x_end // CHUNK_SIZE + 1):
+                    chunks.add((chunk_x, chunk_y))
                 
-                # Einzelnes Hex neu zeichnen für sofortiges visuelles Feedback
-                self._render_single_hex(hex_x, hex_y, target_tile)
-        
-        # Callback für andere Komponenten (mit dem ersten Tile)
-        if painted_tiles and self.on_strategic_role_paint:
-            first_tile, old_strategic_role = painted_tiles[0]
-            self.on_strategic_role_paint(first_tile, old_strategic_role)
-    
-    def _render_single_hex(self, hex_x: int, hex_y: int, tile: Tile):
-        """Rendert ein einzelnes Hex ohne komplettes Re-Render"""
-        # Lösche altes Hex, Faction-Rahmen und Role-Text
-        self.canvas.delete(f"hex_{hex_x}_{hex_y}")
-        self.canvas.delete(f"faction_{hex_x}_{hex_y}")
-        self.canvas.delete(f"role_{hex_x}_{hex_y}")
-        
-        # Zeichne neues Hex
-        self._render_hex(hex_x, hex_y, tile)
-    
-    def _get_tiles_in_brush(self, center_x: int, center_y: int) -> List[Tuple[int, int]]:
-        """Gibt eine Liste von Tile-Koordinaten im Pinsel-Bereich zurück"""
-        if not hasattr(self, 'brush_size') or self.brush_size <= 1:
-            return [(center_x, center_y)]
-        
-        return HexMath.get_hex_neighbors_in_radius(center_x, center_y, self.brush_size - 1)
\ No newline at end of file
+                # Bestehende Items nur im sichtbaren Teil der Spanne umgestalten
+                if visible_range is None or not visible_range.top_y <= hex_y <= visible_range.bottom_y:
+                    continue
+                left_x, right_x = visible_range.columns(hex_y)
+                for hex_x in range(max(x_start, left_x), min(x_end, right_x) + 1):
+                    self.renderer.update_hex(hex_x, hex_y)
+        
+        for chunk_x, chunk_y in chunks:
+            self.chunk_cache.invalidate_chunk(chunk_x, chunk_y)
+        self.request_render(tiles_changed=False)
+        
+        if self.on_tiles_redrawn:
+            if len(entry.changes) == 1:
+                indices = list(entry.changes[0].indices())
+            else:
+                indices = sorted({index for change in entry.changes for index in change.indices()})
+            self.on_tiles_redrawn(indices)
@@ -0,0 +1,205 @@
+"""
+Minimap mit Übersichts-Bitmap des gesamten Grids
+Zeigt die ganze Karte verkleinert an, markiert den sichtbaren Bereich und springt per Klick
+"""
+import math
+import tkinter as tk
+from typing import Dict, List, Optional
+
+from ui.chunk_cache import build_palette
+from utils.hex_math import SQRT3
+
+
+MINIMAP_WIDTH = 230
+MINIMAP_HEIGHT = 170
+
+# Größte Darstellung eines Hex in Pixeln (für kleine Grids)
+MAX_PIXELS_PER_HEX = 4.0
+
+VIEW_RECT_COLOR = "#ffffff"
+
+
+class Minimap:
+    """
+    Übersichtskarte neben dem Map Canvas
+
+    Das Grid wird einmal in einem Durchlauf über die Spalten-Arrays in ein
+    PhotoImage gerastert; jedes Pixel zeigt das Tile an seiner Position
+    (bei großen Grids nur jedes n-te Tile). Nach Pinselstrichen werden nur
+    die Pixel-Zeilen der geänderten Tiles neu geschrieben. Tile-Objekte
+    werden nie erzeugt.
+    """
+
+    def __init__(self, parent: tk.Widget, grid_manager, map_canvas,
+                 width: int = MINIMAP_WIDTH, height: int = MINIMAP_HEIGHT):
+        """
+        Args:
+            parent: Parent-Widget
+            grid_manager: GridManager-Instanz
+            map_canvas: MapCanvas, dessen Ansicht angezeigt und gesteuert wird
+            width: Breite der Minimap in Pixeln
+            height: Höhe der Minimap in Pixeln
+        """
+        self.grid_manager = grid_manager
+        self.map_canvas = map_canvas
+        self.width = width
+        self.height = height
+
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg='#2d2d30',
+                                highlightthickness=0)
+        self.image: Optional[tk.PhotoImage] = None
+        self.image_id = None
+        self.view_rect_id = None
+
+        # Layout der aktuellen Bitmap
+        self.grid = None
+        self.pixels_per_unit = 1.0
+        self.image_x = 0
+        self.image_y = 0
+        self.palette: List[List[str]] = []
+        # Pixel -> abgetastete Spalte/Zeile und umgekehrt
+        self.sample_columns: List[int] = []
+        self.sample_rows: List[int] = []
+        self.column_pixels: Dict[int, List[int]] = {}
+        self.row_pixels: Dict[int, List[int]] = {}
+
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<B1-Motion>", self._on_click)
+
+        map_canvas.on_render = self._on_map_rendered
+        map_canvas.on_tiles_redrawn = self.update_tiles
+
+    def get_widget(self) -> tk.Canvas:
+        """Gibt das Canvas-Widget zurück"""
+        return self.canvas
+
+    def rebuild(self):
+        """Rastert das gesamte Grid neu (neues Grid, Undo/Redo, Laden)"""
+        grid = self.grid_manager.grid
+        self.grid = grid
+        self.palette = build_palette(grid.area_definitions)
+
+        # Seitenverhältnis der Karte: Spalten-Abstand sqrt(3), Zeilen-Abstand 1.5
+        world_width = grid.width * SQRT3
+        world_height = grid.height * 1.5
+        self.pixels_per_unit = min(self.width / world_width, self.height / world_height,
+                                   MAX_PIXELS_PER_HEX / SQRT3)
+        image_width = max(1, int(world_width * self.pixels_per_unit))
+        image_height = max(1, int(world_height * self.pixels_per_unit))
+        self.image_x = (self.width - image_width) // 2
+        self.image_y = (self.height - image_height) // 2
+
+        column_pitch = SQRT3 * self.pixels_per_unit
+        row_pitch = 1.5 * self.pixels_per_unit
+        self.sample_columns = [min(grid.width - 1, int(px / column_pitch)) for px in range(image_width)]
+        self.sample_rows = [min(grid.height - 1, int(py / row_pitch)) for py in range(image_height)]
+        self.column_pixels = _invert(self.sample_columns)
+        self.row_pixels = _invert(self.sample_rows)
+
+        self.image = tk.PhotoImage(width=image_width, height=image_height)
+        rows = [
+            "{" + self._pixel_row(y, 0, image_width) + "}"
+            for y in self.sample_rows
+        ]
+        self.image.put(" ".join(rows), to=(0, 0))
+
+        if self.image_id is None:
+            self.image_id = self.canvas.create_image(self.image_x, self.image_y,
+                                                     image=self.image, anchor="nw")
+        else:
+            self.canvas.itemconfigure(self.image_id, image=self.image)
+            self.canvas.coords(self.image_id, self.image_x, self.image_y)
+        self.update_view()
+
+    def _pixel_row(self, y: int, px_start: int, px_end: int) -> str:
+        """Farben der Pixel px_start..px_end-1 einer Bild-Zeile für Tile-Zeile y"""
+        grid = self.grid
+        row_start = y * grid.width
+        area_codes = grid.area_codes
+        faction_codes = grid.faction_codes
+        palette = self.palette
+        return " ".join(
+            palette[area_codes[row_start + x]][faction_codes[row_start + x]]
+            for x in self.sample_columns[px_start:px_end]
+        )
+
+    def update_tiles(self, indices: List[int]):
+        """
+        Schreibt nur die Pixel geänderter Tiles neu
+
+        Args:
+            indices: Flache Indizes der geänderten Tiles
+        """
+        if self.image is None or self.grid is not self.grid_manager.grid:
+            self.rebuild()
+            return
+
+        # Pro betroffener Tile-Zeile die Pixel-Spanne der geänderten Spalten
+        width = self.grid.width
+        spans: Dict[int, List[int]] = {}
+        for index in indices:
+            y, x = divmod(index, width)
+            if y not in self.row_pixels:
+                continue
+            pixels = self.column_pixels.get(x)
+            if not pixels:
+                continue
+            span = spans.get(y)
+            if span is None:
+                spans[y] = [pixels[0], pixels[-1]]
+            else:
+                span[0] = min(span[0], pixels[0])
+                span[1] = max(span[1], pixels[-1])
+
+        for y, (px_start, px_end) in spans.items():
+            row = "{" + self._pixel_row(y, px_start, px_end + 1) + "}"
+            for py in self.row_pixels[y]:
+                self.image.put(row, to=(px_start, py))
+
+    def update_view(self):
+        """Verschiebt das Rechteck des sichtbaren Bereichs"""
+        visible_range = self.map_canvas.visible_range
+        if visible_range is None or self.image is None:
+            if self.view_rect_id is not None:
+                self.canvas.itemconfigure(self.view_rect_id, state="hidden")
+            return
+
+        unit = self.pixels_per_unit
+        left = self.image_x + visible_range.left_x * SQRT3 * unit
+        right = self.image_x + (visible_range.right_x + 1) * SQRT3 * unit
+        top = self.image_y + visible_range.top_y * 1.5 * unit
+        bottom = self.image_y + (visible_range.bottom_y + 1) * 1.5 * unit
+        if self.view_rect_id is None:
+            self.view_rect_id = self.canvas.create_rectangle(left, top, right, bottom,
+                                                             outline=VIEW_RECT_COLOR, width=1)
+        else:
+            self.canvas.coords(self.view_rect_id, left, top, right, bottom)
+            self.canvas.itemconfigure(self.view_rect_id, state="normal")
+        self.canvas.tag_raise(self.view_rect_id)
+
+    def _on_map_rendered(self, tiles_changed: bool):
+        """Callback des Map Canvas nach jedem Render"""
+        if tiles_changed or self.image is None or self.grid is not self.grid_manager.grid:
+            self.rebuild()
+        else:
+            self.update_view()
+
+    def _on_click(self, event):
+        """Zentriert den Map Canvas auf die geklickte Position"""
+        if self.image is None:
+            return
+        grid = self.grid
+        unit = self.pixels_per_unit
+        hex_x = math.floor((event.x - self.image_x) / (SQRT3 * unit))
+        hex_y = math.floor((event.y - self.image_y) / (1.5 * unit))
+        hex_x = max(0, min(grid.width - 1, hex_x))
+        hex_y = max(0, min(grid.height - 1, hex_y))
+        self.map_canvas.center_on_hex(hex_x, hex_y)
+
+
+def _invert(samples: List[int]) -> Dict[int, List[int]]:
+    """Ordnet jedem abgetasteten Wert die Pixel zu, die ihn zeigen"""
+    pixels: Dict[int, List[int]] = {}
+    for pixel, value in enumerate(samples):
+        pixels.setdefault(value, []).append(pixel)
+    return pixels
@@ -0,0 +1,136 @@
+"""
+Overlay für Wegfindungs-Ergebnisse auf dem Map Canvas
+Zeichnet einen Pfad als Linie und ein Distanz-Feld als farbige Marker über die Karte
+"""
+import tkinter as tk
+from array import array
+from typing import List, Optional
+
+from data.pathfinding import UNREACHABLE
+from utils.hex_geometry import HexGeometry, VisibleRange
+
+
+OVERLAY_TAG = "overlay"
+
+PATH_COLOR = "#ffd800"
+PATH_ENDPOINT_COLOR = "#ffffff"
+
+# Distanz-Marker werden nur gezeichnet, wenn höchstens so viele Hexes sichtbar sind
+MAX_DISTANCE_MARKERS = 5000
+
+# Farbverlauf der Distanz-Marker von nah (grün) über gelb nach fern (rot)
+GRADIENT_STEPS = 32
+
+
+def _build_gradient(steps: int) -> List[str]:
+    """Farbverlauf grün -> gelb -> rot als '#rrggbb'"""
+    colors = []
+    for step in range(steps):
+        t = step / max(1, steps - 1)
+        red = int(255 * min(1.0, 2.0 * t))
+        green = int(255 * min(1.0, 2.0 * (1.0 - t)))
+        colors.append("#%02x%02x00" % (red, green))
+    return colors
+
+
+GRADIENT = _build_gradient(GRADIENT_STEPS)
+
+
+class PathOverlay:
+    """
+    Overlay-Ebene über den Hex-Items
+
+    Die Items werden bei jedem Render für den sichtbaren Bereich neu
+    gelegt. Das Distanz-Feld wird nur für sichtbare Hexes und bis
+    MAX_DISTANCE_MARKERS gezeichnet, der Pfad als eine einzige Linie.
+    """
+
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+        self.grid = None
+        # Pfad als Tile-Indizes und Distanz-Feld (array('i') pro Tile)
+        self.path: List[int] = []
+        self.distances: Optional[array] = None
+        self.max_distance = 0
+
+    @property
+    def is_active(self) -> bool:
+        """True wenn ein Pfad oder Distanz-Feld angezeigt wird"""
+        return bool(self.path) or self.distances is not None
+
+    def set_path(self, grid, path: List[int]):
+        """Zeigt einen Pfad (Tile-Indizes vom Start zum Ziel) an"""
+        self.grid = grid
+        self.path = list(path)
+
+    def set_distance_field(self, grid, distances: array):
+        """Zeigt ein Distanz-Feld (UNREACHABLE = nicht erreichbar) an"""
+        self.grid = grid
+        self.distances = distances
+        self.max_distance = max(distances) if len(distances) else 0
+
+    def clear(self):
+        """Entfernt Pfad, Distanz-Feld und alle Overlay-Items"""
+        self.path = []
+        self.distances = None
+        self.max_distance = 0
+        self.canvas.delete(OVERLAY_TAG)
+
+    def render(self, grid, geometry: HexGeometry, visible_range: Optional[VisibleRange]):
+        """
+        Legt die Overlay-Items für die aktuelle Kamera neu
+
+        Args:
+            grid: Aktuelles Grid (ein Overlay eines anderen Grids wird verworfen)
+            geometry: Bildschirm-Transformation des Map Canvas
+            visible_range: Sichtbarer Hex-Bereich oder None
+        """
+        self.canvas.delete(OVERLAY_TAG)
+        if not self.is_active:
+            return
+        if grid is not self.grid:
+            self.clear()
+            return
+
+        if self.distances is not None and visible_range is not None:
+            self._render_distances(geometry, visible_range)
+        if self.path:
+            self._render_path(geometry)
+        self.canvas.tag_raise(OVERLAY_TAG)
+
+    def _render_distances(self, geometry: HexGeometry, visible_range: VisibleRange):
+        """Farbige Marker für die sichtbaren erreichbaren Hexes"""
+        if visible_range.tile_count() > MAX_DISTANCE_MARKERS:
+            return
+        distances = self.distances
+        width = self.grid.width
+        scale_steps = (GRADIENT_STEPS - 1) / max(1, self.max_distance)
+        radius = max(1.0, geometry.scale * 0.35)
+        create = self.canvas.create_rectangle
+        for hex_x, hex_y in visible_range.tiles():
+            distance = distances[hex_y * width + hex_x]
+            if distance == UNREACHABLE:
+                continue
+            center_x, center_y = geometry.hex_center(hex_x, hex_y)
+            color = GRADIENT[int(distance * scale_steps)]
+            create(center_x - radius, center_y - radius, center_x + radius, center_y + radius,
+                   fill=color, outline="", tags=(OVERLAY_TAG,))
+
+    def _render_path(self, geometry: HexGeometry):
+        """Pfad als Linie durch die Hex-Zentren mit markierten Endpunkten"""
+        width = self.grid.width
+        coords = []
+        for index in self.path:
+            hex_y, hex_x = divmod(index, width)
+            coords.extend(geometry.hex_center(hex_x, hex_y))
+
+        line_width = max(2, int(geometry.scale * 0.25))
+        if len(coords) >= 4:
+            self.canvas.create_line(*coords, fill=PATH_COLOR, width=line_width,
+                                    capstyle=tk.ROUND, joinstyle=tk.ROUND, tags=(OVERLAY_TAG,))
+        radius = line_width + 2
+        for center_x, center_y in (coords[:2], coords[-2:]):
+            self.canvas.create_oval(center_x - radius, center_y - radius,
+                                    center_x + radius, center_y + radius,
+                                    fill=PATH_ENDPOINT_COLOR, outline=PATH_COLOR,
+                                    tags=(OVERLAY_TAG,))
@@ -0,0 +1,180 @@
+"""
+Hintergrund-Tasks für lange Operationen
+Führt Arbeit in einem Worker-Thread aus und reicht Fortschritt und Ergebnis per root.after an die UI weiter
+"""
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable, Optional
+
+
+# Abfrage-Intervall der Nachrichten-Queue (ms)
+POLL_INTERVAL_MS = 50
+
+
+class TaskCancelled(Exception):
+    """Wird im Worker-Thread ausgelöst, wenn der Task abgebrochen wurde"""
+
+
+class TaskContext:
+    """
+    Schnittstelle des laufenden Tasks zum Worker-Thread
+
+    report() ist als Fortschritts-Callback für MapIO und Co. gedacht: es
+    stellt den Fortschritt in die Queue und löst TaskCancelled aus, sobald
+    der Task abgebrochen wurde. Die Arbeit bricht damit an der nächsten
+    Meldung ab, ohne selbst auf Abbruch prüfen zu müssen.
+    """
+
+    def __init__(self, messages: queue.Queue):
+        self._messages = messages
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """True wenn der Abbruch angefordert wurde"""
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Fordert den Abbruch an (aus dem UI-Thread)"""
+        self._cancel_event.set()
+
+    def check_cancelled(self):
+        """Löst TaskCancelled aus, wenn der Abbruch angefordert wurde"""
+        if self._cancel_event.is_set():
+            raise TaskCancelled()
+
+    def report(self, fraction: float, message: Optional[str] = None):
+        """
+        Meldet den Fortschritt (aus dem Worker-Thread)
+
+        Args:
+            fraction: Anteil 0.0 - 1.0
+            message: Neuer Status-Text oder None für den bisherigen
+        """
+        self.check_cancelled()
+        self._messages.put(("progress", fraction, message))
+
+
+class TaskRunner:
+    """
+    Führt jeweils einen Task in einem Worker-Thread aus
+
+    Der Worker darf weder tkinter noch das Grid des Editors anfassen: er
+    baut sein Ergebnis (z.B. ein neues Grid) unabhängig auf. Fortschritt
+    und Ergebnis gehen über eine Queue, die per root.after im UI-Thread
+    abgefragt wird; erst dort übernimmt on_done das Ergebnis in einem
+    Schritt, der Canvas sieht also nie ein halb geladenes Grid.
+    """
+
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        self._messages: queue.Queue = queue.Queue()
+        self._context: Optional[TaskContext] = None
+        self._thread: Optional[threading.Thread] = None
+        self._name = ""
+        self._on_done: Optional[Callable[[Any], None]] = None
+        self._on_error: Optional[Callable[[Exception], None]] = None
+        self._on_cancel: Optional[Callable[[], None]] = None
+
+        # UI-Callbacks (z.B. Fortschrittsbalken im MainWindow)
+        self.on_start: Optional[Callable[[str], None]] = None
+        self.on_progress: Optional[Callable[[float, Optional[str]], None]] = None
+        self.on_finish: Optional[Callable[[], None]] = None
+
+    @property
+    def is_busy(self) -> bool:
+        """True solange ein Task läuft oder sein Ergebnis noch aussteht"""
+        return self._context is not None
+
+    def start(self, name: str, work: Callable[[TaskContext], Any],
+              on_done: Callable[[Any], None],
+              on_error: Optional[Callable[[Exception], None]] = None,
+              on_cancel: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Startet einen Task
+
+        Args:
+            name: Status-Text während der Ausführung
+            work: Arbeit im Worker-Thread; erhält den TaskContext, Rückgabe geht an on_done
+            on_done: Übernimmt das Ergebnis (im UI-Thread)
+            on_error: Fehlerbehandlung (im UI-Thread)
+            on_cancel: Aufräumen nach einem Abbruch (im UI-Thread)
+
+        Returns:
+            False wenn bereits ein Task läuft
+        """
+        if self.is_busy:
+            return False
+        context = TaskContext(self._messages)
+        self._context = context
+        self._name = name
+        self._on_done = on_done
+        self._on_error = on_error
+        self._on_cancel = on_cancel
+        self._thread = threading.Thread(target=self._run, args=(work, context), name=name, daemon=True)
+
+        if self.on_start:
+            self.on_start(name)
+        self._thread.start()
+        self.root.after(POLL_INTERVAL_MS, self._poll)
+        return True
+
+    def cancel(self):
+        """Bricht den laufenden Task ab (wirksam bei seiner nächsten Fortschritts-Meldung)"""
+        if self._context is not None:
+            self._context.cancel()
+
+    def _run(self, work: Callable[[TaskContext], Any], context: TaskContext):
+        """Worker-Thread: führt die Arbeit aus und stellt das Ergebnis in die Queue"""
+        try:
+            result = work(context)
+            context.check_cancelled()
+            self._messages.put(("done", result))
+        except TaskCancelled:
+            self._messages.put(("cancelled",))
+        except Exception as e:
+            self._messages.put(("error", e))
+
+    def _poll(self):
+        """UI-Thread: verarbeitet die Nachrichten des Workers"""
+        progress = None
+        finished = None
+        while True:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "progress":
+                # Nur die letzte Meldung zeichnen, Status-Texte aber nicht verlieren
+                text = message[2] if message[2] is not None else (progress[1] if progress else None)
+                progress = (message[1], text)
+            else:
+                finished = message
+
+        if progress and self.on_progress:
+            self.on_progress(*progress)
+        if finished is None:
+            self.root.after(POLL_INTERVAL_MS, self._poll)
+            return
+        self._finish(finished)
+
+    def _finish(self, message: tuple):
+        """UI-Thread: beendet den Task und ruft den passenden Callback auf"""
+        on_done, on_error, on_cancel = self._on_done, self._on_error, self._on_cancel
+        self._context = None
+        self._thread = None
+        self._on_done = self._on_error = self._on_cancel = None
+        if self.on_finish:
+            self.on_finish()
+
+        kind = message[0]
+        if kind == "done":
+            on_done(message[1])
+        elif kind == "error":
+            if on_error:
+                on_error(message[1])
+            else:
+                raise message[1]
+        elif kind == "cancelled" and on_cancel:
+            on_cancel()
@@ -0,0 +1,209 @@
+"""
+Gecachte Hex-Geometrie pro Zoom-Stufe
+Bildschirm-Transformation für Rendering und Hit-Testing aus einer Hand
+"""
+import math
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from utils.hex_math import HexMath, SQRT3, UNIT_HEX_VERTICES
+
+
+class VisibleRange(NamedTuple):
+    """
+    Sichtbarer Hex-Bereich (alle Grenzen inklusive)
+
+    Ungerade Zeilen sind um ein halbes Hex nach rechts versetzt, daher
+    hat jede Zeilen-Parität ihre eigene Spalten-Spanne. Eine leere Spanne
+    hat start > end.
+    """
+    top_y: int
+    bottom_y: int
+    even_columns: Tuple[int, int]
+    odd_columns: Tuple[int, int]
+
+    def columns(self, y: int) -> Tuple[int, int]:
+        """(left_x, right_x) der Zeile y"""
+        return self.odd_columns if y & 1 else self.even_columns
+
+    @property
+    def left_x(self) -> int:
+        """Kleinste sichtbare Spalte über beide Paritäten"""
+        return min(self.even_columns[0], self.odd_columns[0])
+
+    @property
+    def right_x(self) -> int:
+        """Größte sichtbare Spalte über beide Paritäten"""
+        return max(self.even_columns[1], self.odd_columns[1])
+
+    def contains(self, x: int, y: int) -> bool:
+        """True wenn das Hex (x, y) im Bereich liegt"""
+        if not self.top_y <= y <= self.bottom_y:
+            return False
+        left_x, right_x = self.columns(y)
+        return left_x <= x <= right_x
+
+    def tile_count(self) -> int:
+        """Anzahl der Hexes im Bereich (ohne sie aufzuzählen)"""
+        odd_rows = (self.bottom_y + 1) // 2 - self.top_y // 2
+        even_rows = self.bottom_y - self.top_y + 1 - odd_rows
+        even_width = max(0, self.even_columns[1] - self.even_columns[0] + 1)
+        odd_width = max(0, self.odd_columns[1] - self.odd_columns[0] + 1)
+        return even_rows * even_width + odd_rows * odd_width
+
+    def tiles(self) -> Iterator[Tuple[int, int]]:
+        """Iteriert zeilenweise über alle (x, y) im Bereich"""
+        for y in range(self.top_y, self.bottom_y + 1):
+            left_x, right_x = self.columns(y)
+            for x in range(left_x, right_x + 1):
+                yield x, y
+
+
+class HexGeometry:
+    """
+    Bildschirm-Transformation Einheits-Hex -> Canvas-Pixel
+
+    Für die aktuelle Skalierung werden die Eckpunkt-Offsets des
+    Einheits-Hexagons sowie die Pixel-Positionen pro Spalte (je
+    Zeilen-Parität) und pro Zeile einmal berechnet. Zentren und
+    Eckpunkte eines Hex ergeben sich danach nur aus Additionen. Die
+    Tabellen werden nur bei einer Änderung der Skalierung verworfen,
+    ein Verschieben der Kamera ändert nur den Offset.
+    """
+
+    def __init__(self):
+        # Bildschirm-Pixel pro Einheits-Hex (hex_size * zoom_factor)
+        self.scale = 0.0
+        # Bildschirm-Position des Welt-Ursprungs
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+        # Flache Eckpunkt-Offsets (x0, y0, ..., x5, y5) relativ zum Zentrum
+        self.vertex_offsets: List[float] = []
+        # Spalten-Positionen je Zeilen-Parität und Zeilen-Positionen (ohne Offset)
+        self.column_x: Tuple[List[float], List[float]] = ([], [])
+        self.row_y: List[float] = []
+
+    def update(self, scale: float, offset_x: float, offset_y: float):
+        """
+        Setzt die Transformation
+
+        Args:
+            scale: Bildschirm-Pixel pro Einheits-Hex
+            offset_x: Bildschirm-Offset X des Welt-Ursprungs
+            offset_y: Bildschirm-Offset Y des Welt-Ursprungs
+        """
+        if scale != self.scale:
+            self.scale = scale
+            self.vertex_offsets = [
+                component * scale for vertex in UNIT_HEX_VERTICES for component in vertex
+            ]
+            self.column_x = ([], [])
+            self.row_y = []
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+    def ensure_size(self, width: int, height: int):
+        """Erweitert die Spalten-/Zeilen-Tabellen auf die Grid-Größe"""
+        step_x = self.scale * SQRT3
+        for parity, columns in enumerate(self.column_x):
+            for x in range(len(columns), width):
+                columns.append(step_x * (x + 0.5 * parity))
+        step_y = self.scale * 1.5
+        for y in range(len(self.row_y), height):
+            self.row_y.append(step_y * y)
+
+    def hex_center(self, hex_x: int, hex_y: int) -> Tuple[float, float]:
+        """
+        Bildschirm-Position des Hex-Zentrums
+
+        Args:
+            hex_x: Hex X-Koordinate
+            hex_y: Hex Y-Koordinate
+
+        Returns:
+            (screen_x, screen_y) Tuple
+        """
+        row_y = self.row_y
+        if 0 <= hex_y < len(row_y):
+            columns = self.column_x[hex_y & 1]
+            if 0 <= hex_x < len(columns):
+                return columns[hex_x] + self.offset_x, row_y[hex_y] + self.offset_y
+        # Außerhalb der Tabellen (z.B. Grid-Rand) direkt berechnen
+        pixel_x, pixel_y = HexMath.hex_to_pixel(hex_x, hex_y, self.scale)
+        return pixel_x + self.offset_x, pixel_y + self.offset_y
+
+    def hex_vertices(self, hex_x: int, hex_y: int) -> List[float]:
+        """
+        Flache Eckpunkt-Liste eines Hex für tkinter
+
+        Returns:
+            [x0, y0, ..., x5, y5]
+        """
+        center_x, center_y = self.hex_center(hex_x, hex_y)
+        offsets = self.vertex_offsets
+        return [
+            offsets[0] + center_x, offsets[1] + center_y,
+            offsets[2] + center_x, offsets[3] + center_y,
+            offsets[4] + center_x, offsets[5] + center_y,
+            offsets[6] + center_x, offsets[7] + center_y,
+            offsets[8] + center_x, offsets[9] + center_y,
+            offsets[10] + center_x, offsets[11] + center_y,
+        ]
+
+    def pixel_to_hex(self, screen_x: float, screen_y: float) -> Tuple[int, int]:
+        """
+        Bildschirm-Position zu Hex-Koordinaten (Umkehrung von hex_center)
+
+        Args:
+            screen_x: Canvas-Pixel X
+            screen_y: Canvas-Pixel Y
+
+        Returns:
+            (hex_x, hex_y) Tuple
+        """
+        return HexMath.pixel_to_hex(screen_x - self.offset_x, screen_y - self.offset_y, self.scale)
+
+    def visible_range(self, screen_width: float, screen_height: float,
+                      grid_width: int, grid_height: int) -> Optional[VisibleRange]:
+        """
+        Exakter Hex-Bereich, dessen Hexes den Bildschirm berühren
+
+        Ein Hex gilt als sichtbar, wenn sein Begrenzungsrechteck (Breite
+        sqrt(3) * scale, Höhe 2 * scale) das Bildschirm-Rechteck schneidet.
+        Die Grenzen folgen direkt aus hex_center, ohne Sicherheitsrand.
+
+        Args:
+            screen_width: Bildschirm-Breite in Pixeln
+            screen_height: Bildschirm-Höhe in Pixeln
+            grid_width: Grid-Breite (Spalten)
+            grid_height: Grid-Höhe (Zeilen)
+
+        Returns:
+            Auf das Grid beschnittener VisibleRange oder None wenn nichts sichtbar ist
+        """
+        scale = self.scale
+        if scale <= 0 or grid_width <= 0 or grid_height <= 0:
+            return None
+
+        # Zeilen: Zentrum y = 1.5 * scale * row + offset_y, halbe Höhe = scale
+        step_y = 1.5 * scale
+        top_y = max(0, math.floor((-self.offset_y - scale) / step_y) + 1)
+        bottom_y = min(grid_height - 1, math.ceil((screen_height - self.offset_y + scale) / step_y) - 1)
+        if top_y > bottom_y:
+            return None
+
+        # Spalten je Parität: Zentrum x = step_x * (col + parity / 2) + offset_x
+        step_x = SQRT3 * scale
+        half_width = step_x / 2.0
+        spans = []
+        for parity in (0, 1):
+            low = (-self.offset_x - half_width) / step_x - 0.5 * parity
+            high = (screen_width - self.offset_x + half_width) / step_x - 0.5 * parity
+            spans.append((max(0, math.floor(low) + 1), min(grid_width - 1, math.ceil(high) - 1)))
+
+        # Nur eine Zeile sichtbar: die Spanne der anderen Parität spielt keine Rolle
+        if top_y == bottom_y:
+            spans[1 - (top_y & 1)] = spans[top_y & 1]
+        if all(left_x > right_x for left_x, right_x in spans):
+            return None
+        return VisibleRange(top_y, bottom_y, spans[0], spans[1])
@@ -3,9 +3,19 @@ Hex-Mathematik Funktionen
 Implementiert das odd-q offset System für pointy-top Hexagone
 """
 import math
+from functools import lru_cache
 from typing import Tuple, List
 
 
+SQRT3 = math.sqrt(3.0)
+
+# Eckpunkte des Einheits-Hexagons (pointy-top), Start bei 90° in 60° Schritten
+UNIT_HEX_VERTICES: Tuple[Tuple[float, float], ...] = tuple(
+    (math.cos(math.pi / 2.0 + math.pi / 3.0 * i), math.sin(math.pi / 2.0 + math.pi / 3.0 * i))
+    for i in range(6)
+)
+
+
 class HexMath:
     """Hex-Koordinaten Mathematik"""
     
@@ -24,29 +34,84 @@ class HexMath:
         """
         center_x = int(center_x)
         center_y = int(center_y)
-        radius = int(radius)
-        
-        if radius <= 0:
-            return [(center_x, center_y)]
-        
-        tiles = [(center_x, center_y)]
-        visited = {(center_x, center_y)}
-        
-        # Breadth-first search für alle Tiles im Radius
-        current_ring = [(center_x, center_y)]
-        
-        for ring in range(radius):
-            next_ring = []
-            for tile_x, tile_y in current_ring:
-                neighbors = HexMath.get_hex_neighbors(tile_x, tile_y)
-                for neighbor in neighbors:
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        tiles.append(neighbor)
-                        next_ring.append(neighbor)
-            current_ring = next_ring
-            
-        return tiles
+        
+        return [
+            (center_x + dx, center_y + dy)
+            for dx, dy in HexMath.get_radius_offsets(int(radius), center_x & 1)
+        ]
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_radius_offsets(radius: int, parity: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        Relative Offsets aller Hexes im Radius (gecacht)
+        
+        Im odd-q System hängt die Form des Radius nur von der Spalten-Parität
+        des Zentrums ab, die Tabelle wird daher einmal pro (radius, parity)
+        berechnet und danach nur noch verschoben.
+        
+        Args:
+            radius: Radius (0 = nur Zentrum)
+            parity: Spalten-Parität des Zentrums (x & 1)
+        
+        Returns:
+            (dx, dy) Offsets, Zentrum zuerst, dann Ring für Ring
+        """
+        offsets = []
+        for dx, dy_min, dy_max in HexMath.get_radius_columns(radius, parity):
+            for dy in range(dy_min, dy_max + 1):
+                distance = HexMath.hex_distance(parity, 0, parity + dx, dy)
+                offsets.append((distance, dy, dx))
+        offsets.sort()
+        return tuple((dx, dy) for _, dy, dx in offsets)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_radius_columns(radius: int, parity: int) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        Radius-Fläche als Spalten-Spannen (gecacht)
+        
+        Args:
+            radius: Radius (0 = nur Zentrum)
+            parity: Spalten-Parität des Zentrums (x & 1)
+        
+        Returns:
+            (dx, dy_min, dy_max) pro Spalte, dy_max inklusive
+        """
+        radius = max(0, radius)
+        q0, r0, _ = HexMath.offset_to_cube(parity, 0)
+        columns = []
+        for dx in range(-radius, radius + 1):
+            # |dq| + |dr| + |dq + dr| <= 2 * radius  <=>  dr im Intervall
+            r_min = r0 + max(-radius, -radius - dx)
+            r_max = r0 + min(radius, radius - dx)
+            _, dy_min = HexMath.cube_to_offset(q0 + dx, r_min)
+            _, dy_max = HexMath.cube_to_offset(q0 + dx, r_max)
+            columns.append((dx, dy_min, dy_max))
+        return tuple(columns)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_radius_rows(radius: int, parity: int) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        Radius-Fläche als Zeilen-Spannen (gecacht)
+        
+        Zeilen liegen in den Tile-Spalten zusammenhängend im Speicher, diese
+        Form eignet sich daher für Slice-Zugriffe.
+        
+        Args:
+            radius: Radius (0 = nur Zentrum)
+            parity: Spalten-Parität des Zentrums (x & 1)
+        
+        Returns:
+            (dy, dx_min, dx_max) pro Zeile, dx_max inklusive
+        """
+        rows = {}
+        for dx, dy_min, dy_max in HexMath.get_radius_columns(radius, parity):
+            for dy in range(dy_min, dy_max + 1):
+                span = rows.get(dy)
+                rows[dy] = (dx, dx) if span is None else (min(span[0], dx), max(span[1], dx))
+        return tuple((dy, dx_min, dx_max) for dy, (dx_min, dx_max) in sorted(rows.items()))
     
     @staticmethod
     def get_hex_neighbors(x: int, y: int) -> List[Tuple[int, int]]:
@@ -97,7 +162,7 @@ class HexMath:
         y = int(y)
         
         # odd-q offset layout (pointy-top hexes)
-        pixel_x = hex_size * math.sqrt(3.0) * (x + 0.5 * (y & 1))
+        pixel_x = hex_size * SQRT3 * (x + 0.5 * (y & 1))
         pixel_y = hex_size * (3.0 / 2.0) * y
         
         return pixel_x, pixel_y
@@ -125,7 +190,7 @@ class HexMath:
         
         # X-Koordinate berücksichtigt den offset für ungerade Reihen
         offset = 0.5 * (hex_y & 1)
-        hex_x_float = (pixel_x / (hex_size * math.sqrt(3.0))) - offset
+        hex_x_float = (pixel_x / (hex_size * SQRT3)) - offset
         hex_x = round(hex_x_float)
         
         return hex_x, hex_y
@@ -143,14 +208,10 @@ class HexMath:
         Returns:
             Liste von 6 Eckpunkten
         """
-        vertices = []
-        for i in range(6):
-            # Für pointy-top hexagons: Start bei 90 Grad (pi/2) und rotiere um 60 Grad
-            angle = math.pi / 2.0 + math.pi / 3.0 * i  # 60 Grad Schritte, Start bei 90°
-            vertex_x = center_x + hex_size * math.cos(angle)
-            vertex_y = center_y + hex_size * math.sin(angle)
-            vertices.append((vertex_x, vertex_y))
-        return vertices
+        return [
+            (center_x + hex_size * unit_x, center_y + hex_size * unit_y)
+            for unit_x, unit_y in UNIT_HEX_VERTICES
+        ]
     
     @staticmethod
     def hex_distance(x1: int, y1: int, x2: int, y2: int) -> int:
@@ -164,14 +225,85 @@ class HexMath:
         Returns:
             Hex-Distanz
         """
-        # Konvertiere zu cube coordinates für einfachere Distanz-Berechnung (odd-q offset)
-        def offset_to_cube(col: int, row: int) -> Tuple[int, int, int]:
-            q = col - (row + (row & 1)) // 2
-            r = row
-            s = -q - r
-            return q, r, s
+        q1, r1, s1 = HexMath.offset_to_cube(x1, y1)
+        q2, r2, s2 = HexMath.offset_to_cube(x2, y2)
         
-        q1, r1, s1 = offset_to_cube(x1, y1)
-        q2, r2, s2 = offset_to_cube(x2, y2)
+        return (abs(q1 - q2) + abs(r1 - r2) + abs(s1 - s2)) // 2
+    
+    @staticmethod
+    def hex_line(x1: int, y1: int, x2: int, y2: int) -> List[Tuple[int, int]]:
+        """
+        Rastert eine Linie zwischen zwei Hexes (lückenlos benachbart)
+        
+        Args:
+            x1, y1: Start-Koordinate
+            x2, y2: End-Koordinate
+            
+        Returns:
+            Hex-Koordinaten von Start bis Ende (inklusive)
+        """
+        distance = HexMath.hex_distance(x1, y1, x2, y2)
+        if distance == 0:
+            return [(x1, y1)]
+        
+        q1, r1, s1 = HexMath.offset_to_cube(x1, y1)
+        q2, r2, s2 = HexMath.offset_to_cube(x2, y2)
+        line = []
+        for step in range(distance + 1):
+            t = step / distance
+            # Kleiner Versatz, damit Punkte auf Hex-Kanten eindeutig runden
+            q = q1 + (q2 - q1) * t + 1e-6
+            r = r1 + (r2 - r1) * t + 1e-6
+            s = s1 + (s2 - s1) * t - 2e-6
+            line.append(HexMath.cube_to_offset(*HexMath.cube_round(q, r, s)))
+        return line
+    
+    @staticmethod
+    def cube_round(q: float, r: float, s: float) -> Tuple[int, int, int]:
+        """
+        Rundet gebrochene Cube-Koordinaten auf das nächste Hex
         
-        return (abs(q1 - q2) + abs(r1 - r2) + abs(s1 - s2)) // 2
\ No newline at end of file
+        Returns:
+            (q, r, s) mit q + r + s == 0
+        """
+        round_q, round_r, round_s = round(q), round(r), round(s)
+        diff_q, diff_r, diff_s = abs(round_q - q), abs(round_r - r), abs(round_s - s)
+        if diff_q > diff_r and diff_q > diff_s:
+            round_q = -round_r - round_s
+        elif diff_r > diff_s:
+            round_r = -round_q - round_s
+        else:
+            round_s = -round_q - round_r
+        return round_q, round_r, round_s
+    
+    @staticmethod
+    def offset_to_cube(col: int, row: int) -> Tuple[int, int, int]:
+        """
+        Konvertiert Offset-Koordinaten zu Cube-Koordinaten
+        
+        Passend zu get_hex_neighbors (Spalten-Parität), d.h. hex_distance
+        entspricht der Anzahl Nachbar-Schritte.
+        
+        Args:
+            col: X-Koordinate
+            row: Y-Koordinate
+            
+        Returns:
+            (q, r, s) mit q + r + s == 0
+        """
+        q = col
+        r = row - (col - (col & 1)) // 2
+        return q, r, -q - r
+    
+    @staticmethod
+    def cube_to_offset(q: int, r: int, s: int = None) -> Tuple[int, int]:
+        """
+        Konvertiert Cube-Koordinaten zurück zu Offset-Koordinaten
+        
+        Args:
+            q, r, s: Cube-Koordinaten (s wird nicht benötigt)
+            
+        Returns:
+            (x, y) Tuple
+        """
+        return q, r + (q - (q & 1)) // 2
@@ -0,0 +1,150 @@
+"""
+Reproduzierbares Value Noise für ganze Felder
+Fraktales Rauschen als Bytes (0-255) ohne Schleife pro Tile
+"""
+import random
+from typing import Dict, List, Optional
+
+
+# Kleinste Zellgröße einer Oktave in Tiles (feinere Oktaven bringen auf Hex-Karten kaum Detail)
+MIN_CELL_SIZE = 4
+
+# Gewichte werden in 1/256 gerechnet: (a * (256 - w) + b * w) passt in 16 Bit
+WEIGHT_SCALE = 256
+
+
+def _smoothstep_weights(cell: int) -> List[int]:
+    """Interpolations-Gewichte (0..255) der cell Positionen einer Zelle mit Smoothstep-Verlauf"""
+    weights = []
+    for step in range(cell):
+        t = step / cell
+        weights.append(min(WEIGHT_SCALE - 1, int(round(WEIGHT_SCALE * t * t * (3.0 - 2.0 * t)))))
+    return weights
+
+
+def _pack(values: bytes, lane_size: int) -> int:
+    """Bytes als Ganzzahl mit lane_size Bytes pro Wert (little endian, ohne Überlauf zwischen Werten)"""
+    lanes = bytearray(len(values) * lane_size)
+    lanes[0::lane_size] = values
+    return int.from_bytes(lanes, "little")
+
+
+class _Octave:
+    """
+    Eine Oktave Value Noise
+
+    Zufallswerte liegen auf einem Gitter mit Zellgröße cell. Die Gitter-
+    Zeilen werden einmal in x-Richtung interpoliert: pro Zellen-Paar (a, b)
+    wird die Rampe als gepackte Ganzzahl berechnet (eine Multiplikation
+    für alle Positionen) und zwischengespeichert. Zwischen zwei Gitter-
+    Zeilen interpoliert row() in y-Richtung auf einer gepackten Ganzzahl
+    mit 4 Bytes pro Wert, die Werte einer Zeile werden also gemeinsam
+    multipliziert und addiert.
+    """
+
+    def __init__(self, width: int, cell: int, lattice_height: int, amplitude: int, rng: random.Random,
+                 rows: range):
+        self.cell = cell
+        self.weights = _smoothstep_weights(cell)
+        lattice_width = width // cell + 2
+        # Das ganze Gitter wird gezogen (gleiche Zufallsfolge für jeden Zeilenbereich),
+        # interpoliert werden nur die Gitter-Zeilen für rows
+        lattice = rng.randbytes(lattice_width * lattice_height)
+        self.first_row = rows.start // cell
+        last_row = (rows.stop - 1) // cell + 1 if len(rows) else self.first_row
+
+        weights_b = _pack(bytes(self.weights), 2)
+        weights_a = _pack(bytes(WEIGHT_SCALE - w - 1 for w in self.weights), 2) + _pack(b"\x01" * cell, 2)
+        ramps: Dict[int, bytes] = {}
+
+        # Gitter-Zeilen in x interpoliert, mit der Amplitude der Oktave multipliziert
+        self.rows: List[int] = []
+        for y in range(self.first_row, last_row + 1):
+            values = lattice[y * lattice_width:(y + 1) * lattice_width]
+            parts = []
+            for a, b in zip(values, values[1:]):
+                key = a << 8 | b
+                ramp = ramps.get(key)
+                if ramp is None:
+                    ramp = ramps[key] = (a * weights_a + b * weights_b).to_bytes(2 * cell, "little")[1::2]
+                parts.append(ramp)
+            self.rows.append(_pack(b"".join(parts)[:width], 4) * amplitude)
+
+    def row(self, y: int) -> int:
+        """Gepackte Zeile y (4 Bytes pro Wert, Wert * amplitude * 256)"""
+        lattice_y, offset = divmod(y, self.cell)
+        weight = self.weights[offset]
+        lattice_y -= self.first_row
+        return self.rows[lattice_y] * (WEIGHT_SCALE - weight) + self.rows[lattice_y + 1] * weight
+
+
+def fractal_noise(width: int, height: int, seed: int, feature_size: int = 128,
+                  octaves: int = 5, persistence: float = 0.5, rows: Optional[range] = None) -> bytes:
+    """
+    Fraktales Value Noise (Summe von Oktaven mit halbierter Zellgröße)
+
+    Args:
+        width: Feld-Breite
+        height: Feld-Höhe
+        seed: Startwert des Zufallsgenerators (gleicher Seed = gleiches Feld)
+        feature_size: Zellgröße der gröbsten Oktave in Tiles
+        octaves: Anzahl Oktaven (Oktaven unter MIN_CELL_SIZE entfallen)
+        persistence: Amplituden-Faktor von Oktave zu Oktave
+        rows: Nur diese Zeilen berechnen (None = alle); die Werte sind
+            identisch mit denen des ganzen Felds
+
+    Returns:
+        bytes mit width Werten pro Zeile (Index = (y - rows.start) * width + x), Werte 0-255
+    """
+    if rows is None:
+        rows = range(height)
+    rng = random.Random(seed)
+    cells = []
+    cell = max(MIN_CELL_SIZE, int(feature_size))
+    for _ in range(max(1, octaves)):
+        cells.append(cell)
+        if cell // 2 < MIN_CELL_SIZE:
+            break
+        cell //= 2
+
+    # Amplituden als ganze Zahlen mit Summe WEIGHT_SCALE, damit die Summe in 3 Bytes passt
+    raw = [persistence ** level for level in range(len(cells))]
+    amplitudes = [int(WEIGHT_SCALE * value / sum(raw)) for value in raw]
+    amplitudes[0] += WEIGHT_SCALE - sum(amplitudes)
+
+    layers = [
+        _Octave(width, cell, (height - 1) // cell + 2, amplitude, rng, rows)
+        for cell, amplitude in zip(cells, amplitudes) if amplitude > 0
+    ]
+    result = bytearray(width * len(rows))
+    for row, y in enumerate(rows):
+        total = 0
+        for layer in layers:
+            total += layer.row(y)
+        # Wert * 256 * 256 je 4-Byte-Wert: das dritte Byte ist das Ergebnis
+        result[row * width:(row + 1) * width] = total.to_bytes(4 * width, "little")[2::4]
+    return bytes(result)
+
+
+def percentile(values: bytes, fraction: float, sample_step: int = 7) -> int:
+    """
+    Wert, unter dem der Anteil fraction der Werte liegt (auf einer Stichprobe)
+
+    Args:
+        values: Byte-Feld (z.B. von fractal_noise)
+        fraction: Anteil 0.0 - 1.0
+        sample_step: Nur jeder n-te Wert wird gezählt
+
+    Returns:
+        Schwellwert 0-256 (256 = kein Wert liegt darüber)
+    """
+    sample = values[::sample_step]
+    if not sample or fraction <= 0.0:
+        return 0
+    target = fraction * len(sample)
+    counted = 0
+    for value in range(256):
+        counted += sample.count(value)
+        if counted >= target:
+            return value + 1
+    return 256
@@ -0,0 +1,193 @@
+"""
+Leichtgewichtige Laufzeit-Messung für die Hot Paths des Editors
+Timer und Zähler mit rollierenden p50/p95 Werten, abschaltbar ohne nennenswerten Overhead
+
+Verwendung:
+    from utils.profiling import PROFILER
+
+    with PROFILER.section("render"):
+        ...
+    PROFILER.count("render.items_created", renderer.items_created)
+
+Ist der Profiler deaktiviert, liefert section() einen gemeinsamen
+No-Op Kontext und count()/record() kehren sofort zurück. Aktivieren
+per PROFILER.enable(), über die Umgebungsvariable HEXMAP_PROFILE=1
+oder im Editor mit der Taste P.
+"""
+import functools
+import json
+import os
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+
+# Anzahl der Messwerte pro Sektion für p50/p95
+WINDOW_SIZE = 240
+
+
+class _NullSection:
+    """Kontext ohne Wirkung für den deaktivierten Profiler"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """Misst die Laufzeit eines with-Blocks"""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class SectionStats:
+    """Gesamt-Statistik und rollierendes Fenster einer Sektion"""
+    __slots__ = ("calls", "total", "maximum", "last", "window")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.last = 0.0
+        self.window: Deque[float] = deque(maxlen=WINDOW_SIZE)
+
+    def add(self, seconds: float):
+        self.calls += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+        self.window.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Perzentil (0..1) über das rollierende Fenster in Sekunden"""
+        if not self.window:
+            return 0.0
+        values = sorted(self.window)
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+
+    def as_dict(self) -> dict:
+        """Werte in Millisekunden für Report und JSON"""
+        return {
+            "calls": self.calls,
+            "total_ms": self.total * 1000.0,
+            "mean_ms": self.total * 1000.0 / self.calls if self.calls else 0.0,
+            "last_ms": self.last * 1000.0,
+            "p50_ms": self.percentile(0.5) * 1000.0,
+            "p95_ms": self.percentile(0.95) * 1000.0,
+            "max_ms": self.maximum * 1000.0,
+        }
+
+
+class Profiler:
+    """Sammelt Laufzeiten benannter Sektionen und Zähler"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.sections: Dict[str, SectionStats] = {}
+        self.counters: Dict[str, int] = {}
+
+    def enable(self, enabled: bool = True):
+        """Schaltet die Messung an bzw. aus (gesammelte Werte bleiben erhalten)"""
+        self.enabled = enabled
+
+    def reset(self):
+        """Verwirft alle gesammelten Werte"""
+        self.sections.clear()
+        self.counters.clear()
+
+    def section(self, name: str):
+        """Kontext-Manager, der die Laufzeit des Blocks unter name erfasst"""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def record(self, name: str, seconds: float):
+        """Erfasst eine bereits gemessene Laufzeit"""
+        if not self.enabled:
+            return
+        stats = self.sections.get(name)
+        if stats is None:
+            stats = self.sections[name] = SectionStats()
+        stats.add(seconds)
+
+    def count(self, name: str, amount: int = 1):
+        """Erhöht einen Zähler"""
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def stats(self, name: str) -> Optional[SectionStats]:
+        """Statistik einer Sektion oder None"""
+        return self.sections.get(name)
+
+    def ratio(self, hits_name: str, misses_name: str) -> Optional[float]:
+        """Trefferquote aus zwei Zählern (None ohne Daten)"""
+        hits = self.counters.get(hits_name, 0)
+        total = hits + self.counters.get(misses_name, 0)
+        return hits / total if total else None
+
+    def snapshot(self) -> dict:
+        """Alle Werte als JSON-serialisierbares Dictionary"""
+        return {
+            "sections": {name: stats.as_dict() for name, stats in sorted(self.sections.items())},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def report(self) -> str:
+        """Lesbarer Report aller Sektionen und Zähler"""
+        lines = [f"{'section':28s} {'calls':>7s} {'mean':>9s} {'p50':>9s} {'p95':>9s} {'max':>9s}"]
+        for name, values in self.snapshot()["sections"].items():
+            lines.append(f"{name:28s} {values['calls']:7d} {values['mean_ms']:8.2f}ms "
+                         f"{values['p50_ms']:8.2f}ms {values['p95_ms']:8.2f}ms {values['max_ms']:8.2f}ms")
+        if self.counters:
+            lines.append("")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:28s} {value:7d}")
+        return "\n".join(lines)
+
+    def dump(self, file_path: str):
+        """Schreibt die Werte als JSON (.json) oder als Text-Report"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            if file_path.lower().endswith(".json"):
+                json.dump(self.snapshot(), f, indent=2)
+            else:
+                f.write(self.report() + "\n")
+
+
+# Gemeinsamer Profiler der Anwendung
+PROFILER = Profiler(enabled=os.environ.get("HEXMAP_PROFILE", "") not in ("", "0"))
+
+
+def timed(name: str, profiler: Profiler = PROFILER) -> Callable:
+    """Decorator: misst jeden Aufruf der Funktion unter name"""
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator